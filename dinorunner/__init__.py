@@ -1,10 +1,29 @@
-
 # Importiere wichtige Klassen und Funktionen aus den Modulen
-from .logic import Player, ObstacleManager, load_highscore, save_highscore
-from .gui import UI, GameController
-from .sfx import sound_manager
-from .gfx import SpriteSheet
+# Die pygame-Module werden erst beim ersten Zugriff geladen, damit z. B.
+# ``dinorunner.simulation`` ohne Display, Mixer und Fonts importiert werden kann.
+import importlib
+
+_LAZY_EXPORTS = {
+    "Player": ".logic",
+    "ObstacleManager": ".logic",
+    "UI": ".gui",
+    "GameController": ".gui",
+    "sound_manager": ".sfx",
+    "SpriteSheet": ".gfx",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 # (Optional) Du kannst auch Versionen oder Metadaten hinzufügen, falls benötigt
 __version__ = "0.0.1"
-__title__ = "dinorunner"
\ No newline at end of file
+__title__ = "dinorunner"
@@ -0,0 +1,276 @@
+"""
+Zentrale Verwaltung der Spiel-Assets.
+
+Der ``AssetManager`` lädt jedes Bild, Sprite-Sheet und jeden Sound genau einmal,
+konvertiert Bilder in das Pixelformat des Displays und gibt geteilte Handles zurück.
+Jeder Zugriff erhöht einen Referenzzähler, ``release`` verringert ihn. Nicht mehr
+referenzierte Assets bleiben in einer LRU-Liste und werden erst verdrängt, wenn mehr
+als ``max_unused`` davon vorhanden sind – ein Neustart des Spiels findet also alles
+noch im Speicher.
+
+Ist ein Asset-Pack geöffnet (siehe ``dinorunner.pack``), kommen Bilder in den dort
+vorberechneten Größen direkt aus dem Pack, ohne Dekodieren und Skalieren.
+"""
+import collections
+import os
+import sys
+import threading
+
+import pygame
+
+from .gfx import SpriteSheet
+
+
+def get_ressources_path(filename):
+    """
+    Gibt den absolut korrekten Pfad zur Ressource zurück – funktioniert sowohl
+    im Entwicklungsmodus als auch in einer PyInstaller-exe.
+    """
+    # Pfad zur temporären Entpackung (PyInstaller) oder aktuelles Verzeichnis
+    base_path = getattr(sys, '_MEIPASS', os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    return os.path.join(base_path, 'ressources', filename)
+
+
+class AssetManager:
+    """
+    Lädt Assets einmalig und verwaltet sie mit Referenzzählung.
+
+    Attributes:
+        resolve (callable): Wandelt einen Ressourcennamen in einen Dateipfad um.
+        max_unused (int): Anzahl nicht referenzierter Assets, die im Speicher bleiben dürfen.
+        loads (int): Anzahl der tatsächlichen Ladevorgänge von der Festplatte.
+        pack (AssetPack or None): Das geöffnete Asset-Pack.
+        pack_hits (int): Anzahl der Bilder, die aus dem Asset-Pack kamen.
+    """
+    def __init__(self, resolve=get_ressources_path, max_unused=64):
+        """
+        Initialisiert einen leeren AssetManager.
+
+        Args:
+            resolve (callable): Funktion Ressourcenname -> Dateipfad.
+            max_unused (int): Maximale Anzahl nicht referenzierter Assets im Speicher.
+        """
+        self.resolve = resolve
+        self.max_unused = max_unused
+        self.loads = 0
+        self.pack = None
+        self.pack_hits = 0
+        self._entries = {}
+        self._refs = collections.Counter()
+        self._unused = collections.OrderedDict()
+        self._raw = {}
+        self._raw_lock = threading.Lock()
+
+    ### Zugriff ###
+
+    def image(self, name, size=None, alpha=True):
+        """
+        Gibt ein Bild zurück, optional skaliert.
+
+        Args:
+            name (str): Der Ressourcenname, z. B. ``assets/meteor_1.png``.
+            size (tuple, optional): Zielgröße (Breite, Höhe).
+            alpha (bool): Mit Alphakanal konvertieren (``convert_alpha``) statt ``convert``.
+
+        Returns:
+            pygame.Surface or None: Das geteilte Bild, None wenn die Datei fehlt.
+        """
+        key = ("image", name, tuple(size) if size else None, alpha)
+        return self.get(key, lambda: self._load_image(name, size, alpha))
+
+    def sheet(self, name, frame_width, frame_height):
+        """
+        Gibt die Frames eines Sprite-Sheets zurück.
+
+        Args:
+            name (str): Der Ressourcenname des Sprite-Sheets.
+            frame_width (int): Die Breite eines Frames.
+            frame_height (int): Die Höhe eines Frames.
+
+        Returns:
+            list: Die Frames als Surfaces, leer wenn die Datei fehlt.
+        """
+        def load():
+            image = self.image(name)
+            self.release(("image", name, None, True))
+            if image is None:
+                return []
+            return SpriteSheet(None, frame_width, frame_height, image=image).frames
+        return self.get(("sheet", name, frame_width, frame_height), load)
+
+    def sound(self, name, volume=None):
+        """
+        Gibt einen Sound zurück.
+
+        Args:
+            name (str): Der Ressourcenname, z. B. ``sound/jump-sound.ogg``.
+            volume (float, optional): Lautstärke, die einmalig am Sound gesetzt wird.
+
+        Returns:
+            pygame.mixer.Sound or None: Der geteilte Sound, None wenn die Datei fehlt.
+        """
+        def load():
+            path = self.resolve(name)
+            if not os.path.exists(path):
+                return None
+            self.loads += 1
+            sound = pygame.mixer.Sound(path)
+            if volume is not None:
+                sound.set_volume(volume)
+            return sound
+        return self.get(("sound", name, volume), load)
+
+    def source_size(self, name):
+        """
+        Gibt die Originalgröße eines Bildes zurück, aus dem Asset-Pack ohne es zu laden.
+
+        Args:
+            name (str): Der Ressourcenname.
+
+        Returns:
+            tuple or None: (Breite, Höhe), None wenn die Datei fehlt.
+        """
+        if self.pack is not None:
+            size = self.pack.source_size(name)
+            if size is not None:
+                return size
+        image = self.image(name)
+        self.release(self.image_key(name))
+        return image.get_size() if image is not None else None
+
+    def open_pack(self, path):
+        """
+        Öffnet ein Asset-Pack, falls es existiert.
+
+        Args:
+            path (str): Pfad zur Pack-Datei.
+
+        Returns:
+            bool: True, wenn das Pack geöffnet wurde.
+        """
+        if not os.path.exists(path):
+            return False
+        from .pack import AssetPack
+        self.pack = AssetPack.open(path, self.resolve)
+        return self.pack is not None
+
+    def get(self, key, factory):
+        """
+        Gibt ein beliebiges (auch abgeleitetes) Asset zurück und erzeugt es bei Bedarf einmalig.
+
+        Args:
+            key (tuple): Eindeutiger Schlüssel des Assets.
+            factory (callable): Erzeugt das Asset, wenn es noch nicht im Speicher ist.
+
+        Returns:
+            object: Das geteilte Asset. Der Referenzzähler wird erhöht.
+        """
+        if key not in self._entries:
+            self._entries[key] = factory()
+        self._unused.pop(key, None)
+        self._refs[key] += 1
+        return self._entries[key]
+
+    def release(self, key):
+        """
+        Gibt eine Referenz auf ein Asset zurück.
+
+        Assets ohne Referenzen bleiben im Speicher, bis mehr als ``max_unused`` davon
+        vorhanden sind; dann wird das am längsten ungenutzte verdrängt.
+
+        Args:
+            key (tuple): Der Schlüssel des Assets.
+        """
+        if self._refs[key] <= 0:
+            return
+        self._refs[key] -= 1
+        if self._refs[key] == 0:
+            del self._refs[key]
+            self._unused[key] = True
+            while len(self._unused) > self.max_unused:
+                evicted, _ = self._unused.popitem(last=False)
+                self._entries.pop(evicted, None)
+
+    def image_key(self, name, size=None, alpha=True):
+        """
+        Returns:
+            tuple: Der Schlüssel, unter dem ``image`` ein Bild verwaltet (für ``release``).
+        """
+        return ("image", name, tuple(size) if size else None, alpha)
+
+    def stats(self):
+        """
+        Returns:
+            dict: Anzahl geladener, referenzierter und ungenutzter Assets sowie der Ladevorgänge.
+        """
+        return {
+            "entries": len(self._entries),
+            "referenced": len(self._refs),
+            "unused": len(self._unused),
+            "loads": self.loads,
+            "pack_hits": self.pack_hits,
+        }
+
+    ### Vorladen ###
+
+    def preload(self, names, background=True):
+        """
+        Dekodiert Bilddateien vorab, z. B. während das Hauptmenü angezeigt wird.
+
+        Im Hintergrund-Thread wird nur dekodiert; das Konvertieren in das Display-Format
+        passiert beim ersten Zugriff im Haupt-Thread.
+
+        Args:
+            names (list): Ressourcennamen der Bilder.
+            background (bool): In einem Daemon-Thread laden statt blockierend.
+
+        Returns:
+            threading.Thread or None: Der Lade-Thread, falls im Hintergrund geladen wird.
+        """
+        # Was im Asset-Pack liegt, muss nicht dekodiert werden
+        names = [name for name in names if self.pack is None or not self.pack.covers(name)]
+        if not background:
+            for name in names:
+                self._load_raw(name)
+            return None
+        thread = threading.Thread(target=lambda: [self._load_raw(name) for name in names],
+                                  name="asset-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def _load_raw(self, name):
+        with self._raw_lock:
+            if name in self._raw:
+                return self._raw[name]
+        path = self.resolve(name)
+        surface = pygame.image.load(path) if os.path.exists(path) else None
+        with self._raw_lock:
+            self.loads += surface is not None
+            return self._raw.setdefault(name, surface)
+
+    def _load_image(self, name, size, alpha):
+        if self.pack is not None:
+            surface = self.pack.surface(name, size, alpha)
+            if surface is not None:
+                self.pack_hits += 1
+                return surface
+        if size is not None:
+            # Skalierte Varianten werden aus dem unskalierten, geteilten Bild erzeugt
+            image = self.image(name, alpha=alpha)
+            self.release(self.image_key(name, alpha=alpha))
+            return pygame.transform.scale(image, size) if image is not None else None
+        with self._raw_lock:
+            surface = self._raw.pop(name, None)
+        if surface is None:
+            surface = self._load_raw(name)
+            with self._raw_lock:
+                self._raw.pop(name, None)
+        if surface is None:
+            return None
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        return surface
+
+
+# Gemeinsamer AssetManager für das ganze Spiel
+assets = AssetManager()
@@ -0,0 +1,190 @@
+"""
+Vektorisierte Batch-Simulation von dinorunner.
+
+``BatchSimulation`` hält N Spiele als Struct-of-Arrays in NumPy-Puffern und
+rechnet alle mit einem einzigen Aufruf von ``step`` um einen Tick weiter.
+Die Regeln entsprechen exakt ``simulation.step`` (gleicher Zufallsgenerator,
+gleiche Rundung bei der Kollision), ein Spiel aus dem Batch verläuft also
+bitgenau wie dasselbe Spiel im Einzelmodus. Nur die Reihenfolge der Hindernisse
+unterscheidet sich: Der Batch prüft alle Spalten auf einmal und hält sie deshalb
+nicht nach x sortiert.
+
+Benötigt NumPy (``pip install numpy``).
+"""
+import numpy as np
+
+from . import simulation as sim
+
+
+class BatchSimulation:
+    """
+    Simuliert viele Spiele gleichzeitig, inklusive automatischem Neustart beendeter Spiele.
+
+    Attributes:
+        size (int): Anzahl der Spiele im Batch.
+        x (ndarray): x-Positionen der Spieler.
+        y (ndarray): y-Positionen der Spieler.
+        y_change (ndarray): Vertikale Geschwindigkeiten.
+        on_ground (ndarray): Bodenkontakt der Spieler.
+        obstacles (ndarray): x-Positionen der Hindernisse, Form (size, Anzahl Hindernisse).
+        obstacle_speed (ndarray): Tempo der Hindernisse je Spiel.
+        score (ndarray): Punktestände.
+        last_speed_increase (ndarray): Punktestand bei der letzten Temposteigerung.
+        rng (ndarray): xorshift32-Zustände (uint32).
+        frame (ndarray): Anzahl der Ticks im aktuellen Spiel.
+        final_score (ndarray): Endstand des zuletzt beendeten Spiels je Platz.
+        final_frame (ndarray): Dauer in Ticks des zuletzt beendeten Spiels je Platz.
+        final_x (ndarray): x-Position des Spielers beim letzten Tod je Platz.
+        episodes (int): Anzahl aller bisher beendeten Spiele.
+    """
+    def __init__(self, size, seed=0):
+        """
+        Initialisiert den Batch und startet alle Spiele.
+
+        Args:
+            size (int): Anzahl der Spiele.
+            seed (int): Basis-Seed. Spiel Nummer k (über alle Plätze gezählt) nutzt ``seed + k``.
+        """
+        self.size = size
+        self.next_seed = seed
+        self.episodes = 0
+        start = sim.new_game()
+        count = len(start.obstacles)
+
+        self.x = np.empty(size, dtype=np.int64)
+        self.y = np.empty(size, dtype=np.int64)
+        self.y_change = np.empty(size, dtype=np.int64)
+        self.on_ground = np.empty(size, dtype=bool)
+        self.obstacles = np.empty((size, count), dtype=np.float64)
+        self.obstacle_speed = np.empty(size, dtype=np.float64)
+        self.score = np.empty(size, dtype=np.int64)
+        self.last_speed_increase = np.empty(size, dtype=np.int64)
+        self.rng = np.empty(size, dtype=np.uint32)
+        self.frame = np.empty(size, dtype=np.int64)
+
+        self.final_score = np.zeros(size, dtype=np.int64)
+        self.final_frame = np.zeros(size, dtype=np.int64)
+        self.final_x = np.zeros(size, dtype=np.int64)
+
+        self._start_obstacles = np.array(start.obstacles, dtype=np.float64)
+        self.reset(np.ones(size, dtype=bool))
+
+    def reset(self, mask):
+        """
+        Startet die markierten Spiele neu, jedes mit einem eigenen, fortlaufenden Seed.
+
+        Args:
+            mask (ndarray): Bool-Maske der neu zu startenden Spiele.
+        """
+        index = np.flatnonzero(mask)
+        if not len(index):
+            return
+        seeds = np.arange(self.next_seed, self.next_seed + len(index), dtype=np.uint64)
+        self.next_seed += len(index)
+        self.x[index] = sim.PLAYER_START_X
+        self.y[index] = sim.FLOOR_TOP - sim.PLAYER_SIZE
+        self.y_change[index] = 0
+        self.on_ground[index] = False
+        self.obstacles[index] = self._start_obstacles
+        self.obstacle_speed[index] = sim.OBSTACLE_SPEED
+        self.score[index] = 0
+        self.last_speed_increase[index] = -sim.POINTS_PER_SPEED_STEP
+        self.rng[index] = _seed_rng(seeds)
+        self.frame[index] = 0
+
+    def step(self, actions):
+        """
+        Rechnet alle Spiele um einen Tick weiter und startet beendete Spiele automatisch neu.
+
+        Args:
+            actions (ndarray): Aktions-Bits (``simulation.Action``) je Spiel, Form (size,).
+
+        Returns:
+            tuple: (Punkte dieses Ticks, Kollisionsmaske). Für Spiele mit Kollision stehen
+            Endstand, Dauer und Todesposition in ``final_score``, ``final_frame`` und ``final_x``;
+            ihr Platz enthält danach bereits das nächste Spiel.
+        """
+        actions = np.asarray(actions)
+
+        # Spieler: Laufen (links hat Vorrang vor rechts), Springen, Schwerkraft, Boden
+        left = (actions & int(sim.Action.LEFT)) != 0
+        right = (actions & int(sim.Action.RIGHT)) != 0
+        walk_left = left & (self.x > 0)
+        walk_right = ~walk_left & right & (self.x <= sim.PLAYER_MAX_X)
+        self.x += np.where(walk_left, -sim.PLAYER_SPEED, np.where(walk_right, sim.PLAYER_SPEED, 0))
+
+        jump = ((actions & int(sim.Action.JUMP)) != 0) & self.on_ground
+        self.y_change[jump] = sim.JUMP_IMPULSE
+        self.on_ground &= ~jump
+        self.y -= self.y_change
+        self.y_change -= sim.GRAVITY
+
+        ground = sim.FLOOR_TOP - sim.PLAYER_SIZE
+        landed = self.y >= ground
+        self.y[landed] = ground
+        self.y_change[landed] = 0
+        self.on_ground |= landed
+
+        # Hindernisse: Spalte für Spalte, damit der Zufallsgenerator in derselben Reihenfolge
+        # weiterläuft wie in simulation.step
+        points = np.zeros(self.size, dtype=np.int64)
+        self.obstacles -= self.obstacle_speed[:, None]
+        low = sim.SCREEN_WIDTH + sim.OBSTACLE_SIZE
+        span = np.uint32(sim.OBSTACLE_SIZE * 2 + 1)
+        for column in range(self.obstacles.shape[1]):
+            gone = self.obstacles[:, column] < -sim.OBSTACLE_SIZE
+            if gone.any():
+                state = _next_rng(self.rng[gone])
+                self.rng[gone] = state
+                self.obstacles[gone, column] = low + (state % span)
+                points += gone
+
+        # AABB-Kollision gegen alle Hindernisse (Koordinaten wie pygame.Rect abgeschnitten)
+        obstacle_x = np.trunc(self.obstacles).astype(np.int64)
+        player_x = self.x[:, None]
+        hit_x = (player_x < obstacle_x + sim.OBSTACLE_SIZE) & (obstacle_x < player_x + sim.PLAYER_SIZE)
+        hit_y = (self.y < sim.OBSTACLE_Y + sim.OBSTACLE_SIZE) & (sim.OBSTACLE_Y < self.y + sim.PLAYER_SIZE)
+        collision = hit_x.any(axis=1) & hit_y
+
+        # Punkte und Temposteigerung
+        self.score += points
+        faster = self.score >= self.last_speed_increase + sim.POINTS_PER_SPEED_STEP
+        self.obstacle_speed[faster] += sim.OBSTACLE_SPEED_STEP
+        self.last_speed_increase[faster] = self.score[faster]
+        self.frame += 1
+
+        if collision.any():
+            self.final_score[collision] = self.score[collision]
+            self.final_frame[collision] = self.frame[collision]
+            self.final_x[collision] = self.x[collision]
+            self.episodes += int(collision.sum())
+            self.reset(collision)
+
+        return points, collision
+
+    def observations(self):
+        """
+        Gibt die Zustände als Float-Matrix zurück (z. B. als Eingabe für ein neuronales Netz).
+
+        Returns:
+            ndarray: Form (size, 5 + Anzahl Hindernisse) mit x, y, y_change, on_ground,
+            Hindernistempo und den Hindernisabständen relativ zum Spieler.
+        """
+        head = np.stack([self.x, self.y, self.y_change, self.on_ground, self.obstacle_speed], axis=1)
+        return np.concatenate([head, self.obstacles - self.x[:, None]], axis=1).astype(np.float32)
+
+
+def _seed_rng(seeds):
+    """Vektorisierte Variante von ``simulation.seed_rng``."""
+    state = (seeds * np.uint64(0x9E3779B1) + np.uint64(0x7F4A7C15)) & np.uint64(0xFFFFFFFF)
+    state = state.astype(np.uint32)
+    state[state == 0] = 0x6D2B79F5
+    return state
+
+
+def _next_rng(state):
+    """Vektorisierte Variante von ``simulation.next_rng`` auf uint32-Arrays."""
+    state = state ^ (state << np.uint32(13))
+    state = state ^ (state >> np.uint32(17))
+    state = state ^ (state << np.uint32(5))
+    return state
@@ -0,0 +1,104 @@
+"""
+Broadphase für die Kollisionserkennung (Sweep and Prune entlang der x-Achse).
+
+Die Simulation hält die linken Kanten der Hindernisse aufsteigend sortiert. Eine
+Abfrage sucht per Binärsuche nur die Hindernisse, deren linke Kante höchstens
+``max_width`` links vom Spieler und vor seiner rechten Kante liegt; nur diese werden
+genau geprüft. Die Kosten hängen damit von der Dichte der Hindernisse in der Nähe
+des Spielers ab, nicht von ihrer Gesamtzahl.
+
+Da alle Hindernisse mit demselben Tempo nach links scrollen, ändert sich ihre
+Reihenfolge dabei nicht: Links herausgefallene Hindernisse bilden immer einen
+Anfang der Liste, neue werden rechts mit ``insert`` einsortiert.
+
+Das Modul hängt nicht von pygame ab. Die Koordinaten werden erst beim genauen Test wie
+bei ``pygame.Rect`` auf ganze Zahlen abgeschnitten; der Suchbereich hat dafür auf jeder
+Seite eine Einheit Spielraum.
+
+Benchmark (lineare Suche mit ``pygame.Rect`` gegen ``simulation.collides``)::
+
+    python -m dinorunner.broadphase
+"""
+import bisect
+
+
+def candidates(lefts, x, width, max_width):
+    """
+    Gibt den Indexbereich der Hindernisse zurück, die ein Rechteck auf der x-Achse schneiden können.
+
+    Args:
+        lefts (sequence): Die linken Kanten der Hindernisse, aufsteigend sortiert.
+        x (int): Die linke Kante des abgefragten Rechtecks.
+        width (int): Die Breite des abgefragten Rechtecks.
+        max_width (int): Die Breite des breitesten Hindernisses.
+
+    Returns:
+        tuple: (erster Index, Index hinter dem letzten Kandidaten)
+    """
+    low = bisect.bisect_left(lefts, x - max_width - 1)
+    return low, bisect.bisect_left(lefts, x + width + 1, low)
+
+
+def scroll(lefts, dx, limit):
+    """
+    Verschiebt alle Hindernisse nach links und entfernt die, die links aus dem Bild gefallen sind.
+
+    Args:
+        lefts (sequence): Die linken Kanten der Hindernisse, aufsteigend sortiert.
+        dx (float): Die Strecke.
+        limit (float): Hindernisse, deren linke Kante danach links davon liegt, werden entfernt.
+
+    Returns:
+        tuple: (verbleibende linke Kanten als sortierte Liste, Anzahl der entfernten Hindernisse)
+    """
+    moved = [left - dx for left in lefts]
+    # Das gleichmäßige Scrollen erhält die Reihenfolge, herausgefallen ist also nur ein Anfang der Liste
+    gone = bisect.bisect_left(moved, limit)
+    if gone:
+        del moved[:gone]
+    return moved, gone
+
+
+def insert(lefts, x):
+    """
+    Sortiert ein neues Hindernis ein. Neue Hindernisse erscheinen rechts, meist ist das ein Anhängen.
+
+    Args:
+        lefts (list): Die linken Kanten der Hindernisse, aufsteigend sortiert.
+        x (float): Die linke Kante des neuen Hindernisses.
+    """
+    bisect.insort(lefts, x)
+
+
+def _benchmark(counts=(3, 10, 100, 1000), queries=20000):
+    import random
+    import timeit
+
+    import pygame
+
+    from . import simulation as sim
+
+    player = pygame.Rect(sim.PLAYER_START_X, sim.OBSTACLE_Y, sim.PLAYER_SIZE, sim.PLAYER_SIZE)
+    print(f"{'Hindernisse':>11}  {'linear (Rect)':>14}  {'Broadphase':>11}  {'geprüft/Abfrage':>15}")
+    for count in counts:
+        rng = random.Random(count)
+        # Dicht verteilt über die Strecke, ohne das Hindernis unter dem Spieler
+        obstacles = tuple(sorted(rng.uniform(player.right + 1, 60 * count) for _ in range(count)))
+
+        def linear():
+            for obs_x in obstacles:
+                if player.colliderect(pygame.Rect(obs_x, sim.OBSTACLE_Y, sim.OBSTACLE_SIZE, sim.OBSTACLE_SIZE)):
+                    return True
+            return False
+
+        def query():
+            return sim.collides(player.x, player.y, obstacles)
+
+        low, high = candidates(obstacles, player.x, player.width, sim.OBSTACLE_SIZE)
+        linear_us = timeit.timeit(linear, number=queries) / queries * 1e6
+        query_us = timeit.timeit(query, number=queries) / queries * 1e6
+        print(f"{count:>11}  {linear_us:>11.2f} µs  {query_us:>8.2f} µs  {high - low:>15}")
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,33 @@
+"""
+Hilfsfunktionen für Dateien.
+"""
+import os
+import tempfile
+
+
+def write_file_atomic(path, data):
+    """
+    Schreibt Daten atomar in eine Datei.
+
+    Die Daten landen zuerst in einer temporären Datei im selben Verzeichnis, die dann
+    per ``os.replace`` umbenannt wird. Leser sehen so entweder die alte oder die neue
+    Datei, nie eine halb geschriebene.
+
+    Args:
+        path (str): Der Zielpfad.
+        data (bytes): Die zu schreibenden Daten.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.basename(path))
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
@@ -1,17 +1,20 @@
 import pygame
 import asyncio
 import os
-from .logic import Player, ObstacleManager, load_highscore, save_highscore
-from .gui import UI, GameController, BackgroundImage, Floor, get_ressources_path
+import random
+from . import simulation, savestate
+from .replay import ReplayRecorder, PIXEL_COLLISION, FACING_MASKS, FRAME_MASKS
+from .leaderboard import Leaderboard
+from .logic import Player, ObstacleManager, PixelCollider
+from .gui import UI, GameController, BackgroundImage, Floor, MainMenuScene, PauseScene, get_ressources_path
 from .sfx import sound_manager
-
-pygame.init()
-pygame.font.init()
-
-pygame.display.set_caption('dinorunner')
-icon_path = get_ressources_path('graphics\\favicon.png')
-icon = pygame.image.load(icon_path)
-pygame.display.set_icon(icon)
+from .gfx import text_cache
+from .assets import assets
+from .render import Renderer
+from .timing import FixedTimestep, FramePacer, IdleThrottle, enable_vsync
+from .profiler import profiler, startup
+from .inputs import input_queue, latency_probe
+from .scenes import Scene, SceneDirector
 
 
 # Game constants
@@ -24,130 +27,560 @@ RED = (255, 0, 0)
 # Game variables
 score = 0
 highscore_value = 0
-player_size = 20
-gravity = 1
-speed = 5
-obstacle_speed = 2
+player_size = simulation.PLAYER_SIZE
+gravity = simulation.GRAVITY
+speed = simulation.PLAYER_SPEED
+obstacle_speed = simulation.OBSTACLE_SPEED
 active = False
-last_speed_increase = -10
+# Kollision gegen die Sprite-Masken ("pixel") oder gegen die Rechtecke ("rect")
+collision_mode = "pixel"
 
 screen_width = 800
 screen_height = 600
-screen = pygame.display.set_mode((screen_width, screen_height))
-
 fps = 60
-font = pygame.font.SysFont("helvetica", 16)
-timer = pygame.time.Clock()
 
-sound_manager.load_jump_sound()
-sound_manager.load_death_sound()
-ui = UI(screen_width, screen_height)
-game_controller = GameController(screen)
+# Fenster, Schriften, Sounds und Spielobjekte entstehen erst in init_game(),
+# der Import dieses Moduls hat keine Seiteneffekte.
+screen = None
+font = None
+debug_font = None
+ui = None
+game_controller = None
+player = None
+obstacles = None
+background_layers = []
+floor = None
+renderer = None
+game_state = None
+recorder = None
+leaderboard = None
+narrowphase = None  # PixelCollider für collision_mode "pixel", entsteht mit dem ersten Lauf
+
+
+def init_game(render=True):
+    """
+    Initialisiert pygame und erstellt Fenster, Sounds und Spielobjekte.
+
+    Mehrfache Aufrufe haben keine weitere Wirkung. Die Dauer der einzelnen Phasen wird
+    im ``startup``-Profiler festgehalten (``--startup-profile``).
+
+    Args:
+        render (bool): Bei False wird kein Fenster geöffnet und weder Sound, Hintergrund
+            noch Boden geladen (headless).
+    """
+    global screen, font, debug_font, ui, game_controller, player, obstacles
+    global background_layers, floor, renderer, game_state, recorder, leaderboard
+    if player is not None:
+        return
+
+    with startup.phase("pygame.init"):
+        # Nur die benötigten Subsysteme, der Mixer folgt beim ersten Sound
+        pygame.display.init()
+        pygame.font.init()
+
+    if render:
+        with startup.phase("display"):
+            pygame.display.set_caption('dinorunner')
+            icon_path = get_ressources_path(os.path.join('graphics', 'favicon.ico'))
+            if os.path.exists(icon_path):
+                pygame.display.set_icon(pygame.image.load(icon_path))
+            screen = pygame.display.set_mode((screen_width, screen_height))
+
+        with startup.phase("fonts"):
+            font = pygame.font.SysFont("helvetica", 16)
+            debug_font = pygame.font.SysFont("monospace", 12)
+
+        with startup.phase("sounds"):
+            sound_manager.load_jump_sound()
+            sound_manager.load_death_sound()
+            # Die Musik wird im Hintergrund dekodiert, Trackwechsel warten danach nicht mehr auf die Platte
+            sound_manager.preload_music(["nguu.ogg", "somebody_told_you.ogg"])
+
+    with startup.phase("asset pack"):
+        # Vorberechnete Bilder (python -m dinorunner.pack), falls vorhanden
+        assets.open_pack(get_ressources_path("assets.pack"))
+
+    ui = UI(screen_width, screen_height)
+    if render:
+        game_controller = GameController(screen)
+
+    with startup.phase("player/obstacles"):
+        player = Player(50, screen_width - 100 - player_size, player_size, speed, gravity, ui)
+        obstacles = ObstacleManager(screen_width, player_size, obstacle_speed, ui)
+
+    if render:
+        with startup.phase("background"):
+            background_layers = [
+                BackgroundImage("graphics/Ingame_Layer_4.png", screen_width, screen_height, ui.get_ressources_path, scroll_speed=0.2),
+                BackgroundImage("graphics/Ingame_Layer_3.png", screen_width, screen_height, ui.get_ressources_path, scroll_speed=0.4),
+                BackgroundImage("graphics/Ingame_Layer_2.png", screen_width, screen_height, ui.get_ressources_path, scroll_speed=0.6),
+                BackgroundImage("graphics/Ingame_Layer_1.png", screen_width, screen_height, ui.get_ressources_path, scroll_speed=1.0),
+            ]
+            floor = Floor(screen, "graphics/floor.png", ui.get_ressources_path)
+            renderer = Renderer(screen, background_layers, floor)
+
+    game_state = simulation.new_game()
+    recorder = ReplayRecorder(0)
+    with startup.phase("leaderboard"):
+        leaderboard = Leaderboard(ui.get_ressources_path("leaderboard.sqlite3"))
+        leaderboard.import_legacy_highscore(ui.get_ressources_path("highscore.json"))
+
+
+def start_game(seed):
+    """
+    Startet einen neuen Lauf mit dem angegebenen Seed.
+
+    Args:
+        seed (int): Seed für das Spawnen der Hindernisse. Mit demselben Seed und denselben
+            Eingaben verläuft ein Lauf bitgenau gleich.
+    """
+    global score, active, player, obstacles, game_state, recorder, narrowphase
+    # Der alte Spieler gibt seine Assets zurück, der neue bekommt sie ohne Plattenzugriff wieder
+    player.release_assets()
+    player = Player(50, screen_height - 100 - player_size, player_size, speed, gravity, ui)
+    # Die Hindernisse bleiben im selben Pool, nur die Plätze werden neu belegt
+    obstacles.reset()
+    if collision_mode == "pixel" and narrowphase is None:
+        # Die Masken hängen nur von den (geteilten) Bildern ab und werden einmal berechnet
+        narrowphase = PixelCollider.for_objects(player, obstacles)
+    elif collision_mode != "pixel":
+        narrowphase = None
+    game_state = simulation.new_game(seed)
+    recorder = ReplayRecorder(seed, PIXEL_COLLISION | FACING_MASKS | FRAME_MASKS if narrowphase is not None else 0)
+    score = 0
+    active = True
+    print(f"Neuer Lauf mit Seed {seed}")
+
+
+class PlayScene(Scene):
+    """
+    Das laufende Spiel: Simulation mit festem Takt, interpoliertes Zeichnen und Ende eines Laufs.
+
+    Nach einem Lauf bleibt die Szene als Hintergrund liegen (ohne zu scrollen), darüber
+    zeigt ``GameOverScene`` den Startbildschirm.
+
+    Attributes:
+        seed (int): Seed des nächsten Laufs.
+        turbo (int): Faktor, um den die Simulation schneller als in Echtzeit läuft.
+        render (bool): Ob gezeichnet wird.
+        policy (callable or None): Bot-Strategie statt der Tastatur.
+        max_frames (int or None): Beendet einen Lauf nach so vielen Ticks.
+        profile (str): Profil für die Bestenliste.
+        pacer (FramePacer): Wartet auf den nächsten Frame.
+        stepper (FixedTimestep): Der Akkumulator des Simulationstakts.
+        on_pause (callable): Öffnet das Pause-Menü.
+        on_run_end (callable): Wird nach dem Ende eines Laufs aufgerufen.
+        savegame (str or None): Datei, in der ein beim Beenden laufender Lauf gespeichert und
+            beim nächsten Start fortgesetzt wird. None schaltet das ab.
+    """
+    def __init__(self, seed, turbo, render, policy, max_frames, profile, pacer, stepper,
+                 on_pause=None, on_run_end=None, savegame=None):
+        super().__init__()
+        self.seed = seed
+        self.turbo = turbo
+        self.render = render
+        self.policy = policy
+        self.max_frames = max_frames
+        self.profile = profile
+        self.pacer = pacer
+        self.stepper = stepper
+        self.on_pause = on_pause
+        self.on_run_end = on_run_end
+        self.savegame = savegame
+        self.previous_state = game_state
+        self.collision = False
+        self.steps = 0
+        self.frame_time = 0.0
+
+    def start_run(self):
+        """Setzt einen beim Beenden gespeicherten Lauf fort, sonst startet ein neuer Lauf mit dem nächsten Seed."""
+        snapshot = self._take_saved_run()
+        if snapshot is not None:
+            self.restore(snapshot)
+            print(f"Gespeicherter Lauf fortgesetzt: Seed {snapshot.seed}, Tick {snapshot.state.frame}")
+            return
+        start_game(self.seed)
+        self.seed += 1
+        self.collision = False
+        self.previous_state = game_state
+        self.stepper.reset()
+        input_queue.reset(pygame.key.get_pressed() if self.render else None)
+
+    def snapshot(self):
+        """
+        Hält den laufenden Lauf fest, z. B. zum Speichern beim Beenden oder Zurückspulen.
+
+        Returns:
+            savestate.Snapshot: Zustand und Stand der Aufzeichnung (ohne Surfaces).
+        """
+        return savestate.take(game_state, recorder)
+
+    def save_run(self):
+        """
+        Speichert einen noch laufenden Lauf (beim Beenden), damit ihn der nächste Start fortsetzt.
+        """
+        if self.savegame is None or not active:
+            return
+        try:
+            self.snapshot().save(self.savegame)
+        except OSError as e:
+            print(f"Fehler beim Speichern des Laufs: {e}")
+            return
+        print(f"Lauf gespeichert: Seed {recorder.seed}, Tick {game_state.frame}")
+
+    def _take_saved_run(self):
+        """Lädt den gespeicherten Lauf und löscht die Datei, damit er nur einmal fortgesetzt wird."""
+        if self.savegame is None or not os.path.exists(self.savegame):
+            return None
+        try:
+            snapshot = savestate.Snapshot.load(self.savegame)
+        except (OSError, savestate.SnapshotError) as e:
+            print(f"Gespeicherter Lauf nicht lesbar, starte neu: {e}")
+            snapshot = None
+        try:
+            os.remove(self.savegame)
+        except OSError as e:
+            print(f"Fehler beim Löschen des gespeicherten Laufs: {e}")
+        return snapshot
 
-player = Player(50, screen_width - 100 - player_size, player_size, speed, gravity, ui)
-obstacles = ObstacleManager(screen_width, player_size // 2, obstacle_speed, ui)
-background_layers = [
-    BackgroundImage("graphics/Ingame_Layer_4.png", screen_width, screen_height, ui.get_ressources_path, scroll_speed=0.2),
-    BackgroundImage("graphics/Ingame_Layer_3.png", screen_width, screen_height, ui.get_ressources_path, scroll_speed=0.4),
-    BackgroundImage("graphics/Ingame_Layer_2.png", screen_width, screen_height, ui.get_ressources_path, scroll_speed=0.6),
-    BackgroundImage("graphics/Ingame_Layer_1.png", screen_width, screen_height, ui.get_ressources_path, scroll_speed=1.0),
-]
-floor = Floor(screen, ui.get_ressources_path("graphics/floor.png"), ui.get_ressources_path)
+    def restore(self, snapshot):
+        """
+        Setzt den Lauf auf einen Schnappschuss zurück oder setzt einen gespeicherten Lauf fort.
+
+        Spieler und Hindernisse werden aus dem Zustand synchronisiert, die Aufzeichnung läuft
+        ab dem Stand des Schnappschusses weiter.
+
+        Args:
+            snapshot (savestate.Snapshot): Der Spielstand.
+        """
+        global score, active, game_state, recorder, narrowphase
+        game_state, recorder = savestate.restore(snapshot)
+        # Ein Lauf wird mit der Kollision fortgesetzt, mit der er aufgezeichnet wurde
+        if snapshot.flags & PIXEL_COLLISION and narrowphase is None:
+            narrowphase = PixelCollider.for_objects(player, obstacles)
+        elif not snapshot.flags & PIXEL_COLLISION:
+            narrowphase = None
+        score = game_state.score
+        active = not game_state.game_over
+        self.collision = game_state.game_over
+        self.previous_state = game_state
+        self.stepper.reset()
+        input_queue.reset(pygame.key.get_pressed() if self.render else None)
+        player.sync(game_state)
+        obstacles.sync(game_state)
+
+    def resume(self):
+        # Ein Menü hat den ganzen Bildschirm übermalt, und die Pause zählt nicht als Spielzeit
+        if self.render:
+            renderer.invalidate()
+        self.pacer.reset()
+        self.stepper.reset()
+        # Im Menü losgelassene Tasten hat die Warteschlange nicht mitbekommen
+        input_queue.reset(pygame.key.get_pressed())
+
+    def handle_event(self, event):
+        if not active or input_queue.handle_event(event):
+            return
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE and self.on_pause is not None:
+            # Ins Pause-Menü wechseln
+            print("Escape gedrückt, Spiel pausieren")  # Debugging
+            self.on_pause()
+
+    def update(self, frame_time):
+        global score, highscore_value, active, game_state
+        self.frame_time = frame_time
+        ticks = self.stepper.advance(frame_time) if self.render else 1
+        highscore_value = leaderboard.best()
+
+        self.steps = 0
+        if active:
+            # Die Regeln rechnet die Simulation, Spieler und Hindernisse stellen den Zustand nur dar.
+            # Im Turbo-Modus laufen entsprechend mehr Ticks pro Frame. Die Tastenereignisse
+            # dieses Frames sind bereits eingereiht und gelten ab dem ersten Tick.
+            jumped = False
+            for _ in range(ticks * self.turbo):
+                action = self.policy(game_state) if self.policy is not None else input_queue.action()
+                self.previous_state = game_state
+                recorder.record(action)
+                game_state, points, self.collision = simulation.step(game_state, action, narrowphase)
+                self.steps += 1
+                jumped_now = simulation.jumped(self.previous_state, game_state)
+                if self.policy is None:
+                    input_queue.advance(jumped_now)
+                jumped = jumped or jumped_now
+                if self.collision or (self.max_frames is not None and game_state.frame >= self.max_frames):
+                    break
+            # Beim Tod wird der letzte Zustand gezeigt, sonst zwischen den letzten beiden Ticks interpoliert
+            alpha = self.stepper.alpha if self.render and not self.collision else 1.0
+            player.sync(game_state, self.previous_state, alpha)
+            obstacles.sync(game_state, self.previous_state, alpha)
+            if jumped and self.render:
+                pressed_at = input_queue.last_jump_at if self.policy is None else None
+                sound_manager.play_jump_sound(requested_at=pressed_at)
+                latency_probe.mark(pressed_at)
+            score = game_state.score
+            if self.render:
+                sound_manager.play_background_music()  # Ingame-Musik abspielen
+            timed_out = self.max_frames is not None and game_state.frame >= self.max_frames
+            if self.collision or timed_out:
+                self._end_run()
+        profiler.lap("simulation")
+
+    def _end_run(self):
+        global highscore_value, active
+        print(f"Lauf beendet: Score {score}, Tick {game_state.frame}, "
+              f"Tempo {game_state.obstacle_speed}, Spieler-x {game_state.x}")
+        if self.render:
+            sound_manager.stop_music()  # Musik stoppen
+            sound_manager.play_death_sound()  # Tod-Sound abspielen
+            print("Kollision erkannt, stoppe Musik")  # Debugging
+        # Jeder Lauf kommt samt Replay in die Bestenliste, geschrieben wird im Hintergrund
+        leaderboard.submit(self.profile, score, game_state.frame, recorder.seed,
+                           recorder.finish(score).to_bytes())
+        highscore_value = leaderboard.best()
+        active = False
+        if self.render:
+            # Beim Spielende zurück zur Hauptmusik
+            print("Spiel vorbei: Zurück zur Hauptmusik (nguu.ogg)")  # Debugging
+            sound_manager.play_music("nguu.ogg", volume=0.5)  # Hauptmusik zurücksetzen
+            sound_manager.set_volume(0.5)  # Lautstärke zurück auf Standard
+        if self.on_run_end is not None:
+            self.on_run_end()
+
+    def draw(self, screen):
+        # Scrollt der Hintergrund nicht, werden nur die geänderten Bereiche neu gezeichnet
+        renderer.draw_background(scrolling=active, steps=self.steps)
+        self.steps = 0  # Unter einem Menü wird nicht weitergescrollt
+        profiler.lap("background")
+        rects = [text_cache.blit_number(screen, font, "Score: ", score, WHITE,
+                                        (screen_width - 25, 20), anchor="topright"),
+                 text_cache.blit_number(screen, font, "Highscore: ", highscore_value, WHITE, (20, 20))]
+        profiler.lap("text")
+        if not active:  # Im Lauf wählt player.sync den Frame passend zur Kollision
+            player.update_animation(self.frame_time)
+        self.frame_time = 0.0
+        profiler.lap("animation")
+        if active:
+            rects.extend(obstacles.draw(screen))
+            profiler.lap("obstacles")
+        rects.append(player.draw(screen))
+        profiler.lap("player")
+        return rects
+
+
+class GameOverScene(Scene):
+    """
+    Startbildschirm über dem stehenden Spiel, vor dem ersten und nach jedem Lauf.
+
+    Leertaste startet einen Lauf (oder setzt einen beim Beenden gespeicherten fort), ESC öffnet
+    das Hauptmenü. Im Leerlauf wird die Szene im langsamen Takt weitergezeichnet, damit die
+    Animation des Spielers nicht stehen bleibt.
+
+    Attributes:
+        play (PlayScene): Das Spiel darunter.
+        on_main_menu (callable): Öffnet das Hauptmenü.
+    """
+    transparent = True
+    idle = True
+    animating = True
+
+    def __init__(self, play, on_main_menu):
+        super().__init__()
+        self.play = play
+        self.on_main_menu = on_main_menu
+
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_SPACE:
+            # Spiel starten
+            print("Start game: Neue Musik abspielen")  # Debugging
+            sound_manager.play_music("somebody_told_you.ogg", volume=0.5)  # Zur Ingame-Musik überblenden
+            sound_manager.set_volume(0.5)  # Lautstärke auf Standard zurücksetzen
+            self.play.start_run()
+            self.director.pop()
+        elif event.key == pygame.K_ESCAPE:
+            # Ins Hauptmenü zurückkehren
+            print("Escape gedrückt, zurück ins Hauptmenü")  # Debugging
+            self.on_main_menu()
+
+    def update(self, frame_time):
+        # Ohne laufendes Spiel rechnet die Szene darunter nur die Animation weiter
+        self.play.update(frame_time)
+
+    def draw(self, screen):
+        rects = ui.start_screen(screen, screen_width, screen_height, font)
+        profiler.lap("text")
+        return rects
 
 
 # Hauptspiel-Schleife
-async def main():
-    global score, highscore_value, active, last_speed_increase, player, obstacles, speed
+async def main(seed=None, turbo=1, render=True, autoplay=None, max_frames=None, profile="default",
+               pacing="tick", max_fps=fps, frame_stats=None, collision="pixel", idle_after=5.0, idle_fps=10,
+               jump_buffer_ms=100, input_latency=False):
+    """
+    Hauptschleife des Spiels.
+
+    Die Simulation läuft mit festem Takt (``simulation.TICK_RATE``), unabhängig von der Bildrate.
+    Pro Frame werden die fälligen Ticks simuliert und Spieler und Hindernisse zwischen den
+    letzten beiden Zuständen interpoliert gezeichnet.
+
+    Hauptmenü, Spiel, Pause und Startbildschirm sind Szenen (``scenes.SceneDirector``), die alle
+    von dieser einen Schleife angetrieben werden. Nach jedem Frame gibt sie an ``asyncio`` ab,
+    Hintergrundaufgaben laufen so in jeder Szene weiter. In Menüs und auf dem Startbildschirm
+    wartet die Schleife blockierend auf Eingaben (``timing.IdleThrottle``) und zeichnet nur bei Bedarf.
+
+    Args:
+        seed (int, optional): Seed des ersten Laufs, jeder weitere Lauf nutzt den nächsten Wert.
+            Ohne Seed wird ein zufälliger gewählt (und ausgegeben).
+        turbo (int): Faktor, um den die Simulation schneller als in Echtzeit läuft.
+        render (bool): Bei False wird nichts gezeichnet und nicht auf die Bildrate gewartet;
+            der erste Lauf startet sofort und das Spiel endet mit ihm.
+        autoplay (str, optional): Name einer Bot-Strategie aus ``rollout.POLICIES``,
+            die statt der Tastatur spielt.
+        max_frames (int, optional): Beendet den Lauf nach so vielen Ticks.
+        profile (str): Profil, unter dem die Läufe in der Bestenliste gespeichert werden.
+        pacing (str): Wie auf den nächsten Frame gewartet wird: ``tick``, ``busy`` oder ``vsync``.
+        max_fps (int): Obergrenze der Bildrate, 0 für unbegrenzt.
+        frame_stats (str, optional): Misst die Dauer der Phasen jedes Frames und speichert die
+            Auswertung beim Beenden als JSON unter diesem Pfad. Mit F3 lässt sich das Messen
+            auch während des Spiels einschalten (gespeichert wird dann in ``ressources/frame_stats.json``).
+        collision (str): ``pixel`` prüft gegen die Masken der gezeichneten Sprites (Rechtecktest
+            vorab), ``rect`` nur gegen die Rechtecke von Spieler und Hindernissen.
+        idle_after (float): Sekunden ohne Eingabe, nach denen Menüs und Startbildschirm nur noch
+            mit ``idle_fps`` laufen. 0 schaltet den Leerlauf ab.
+        idle_fps (int): Takt im Leerlauf.
+        jump_buffer_ms (float): So lange bleibt ein Sprung, der in der Luft gedrückt wird, vorgemerkt.
+        input_latency (bool): Misst die Zeit vom Sprung-Tastendruck bis zum ausgegebenen Frame
+            und zeigt dabei einen Marker in der linken unteren Ecke (``inputs.LatencyProbe``).
+    """
+    global collision_mode
+    collision_mode = collision
 
-    # Musik im Hauptmenü starten (nguu.ogg)
-    sound_manager.play_music("nguu.ogg", volume=0.5)
+    if seed is None:
+        seed = random.getrandbits(32)
+    policy = None
+    if autoplay is not None:
+        from .rollout import POLICIES
+        policy = POLICIES[autoplay](seed)
 
-    ui.show_main_menu(game_controller)  # Hauptmenü anzeigen
-    pygame.time.delay(1000)  # Eventuell eine kleine Pause für den Start
+    init_game(render)
+    if render and pacing == "vsync" and not enable_vsync((screen_width, screen_height)):
+        pacing = "tick"
+    pacer = FramePacer(pacing, max_fps)
+    stepper = FixedTimestep()
+    throttle = IdleThrottle(max_fps, idle_fps, idle_after)
+    input_queue.configure(jump_buffer_ms)
+    latency_probe.enabled = input_latency
+    profiler.set_enabled(frame_stats is not None)
 
-    running = True
-    while running:
-        timer.tick(fps)
-        y_change = 0
-        highscore_value = load_highscore(ui)
-        for layer in background_layers:
+    director = SceneDirector()
+    # Nur ein Lauf von Hand wird beim Beenden gespeichert und beim nächsten Start fortgesetzt
+    savegame = get_ressources_path("savegame.dat") if render and policy is None else None
+    play = PlayScene(seed, turbo, render, policy, max_frames, profile, pacer, stepper, savegame=savegame)
+
+    if render:
+        def open_main_menu():
+            global active
             if active:
-                layer.update()
-            layer.blit(screen)
-        score_text = font.render(f"Score: {score}", True, WHITE)
-        screen.blit(score_text, (screen_width - score_text.get_width() - 25, 20))
-        highscore_text = font.render(f"Highscore: {highscore_value}", True, WHITE)
-        screen.blit(highscore_text, (20, 20))
+                # Ein abgebrochener Lauf kommt nicht in die Bestenliste
+                active = False
+                sound_manager.stop_music()  # Ingame-Musik stoppen
+            sound_manager.play_music("nguu.ogg", volume=0.5)  # Hauptmenü-Musik abspielen
+            director.reset(play, game_over, main_menu)
 
-        player.update_animation()
-        floor.update()
+        # Die Szenen (und ihre Buttons) werden einmal erstellt und bei jedem Öffnen wiederverwendet
+        game_over = GameOverScene(play, on_main_menu=open_main_menu)
+        main_menu = MainMenuScene(ui, on_start=director.pop, on_quit=director.quit)
+        pause_menu = PauseScene(ui, on_resume=director.pop, on_main_menu=open_main_menu, on_quit=director.quit)
+        play.on_pause = lambda: director.push(pause_menu)
+        play.on_run_end = lambda: director.push(game_over)
 
-        if active:
-            sound_manager.play_background_music()  # Ingame-Musik abspielen
-            obstacles.draw(screen)
+        # Während das Hauptmenü offen ist, die übrigen Bilder im Hintergrund dekodieren
+        director.start_task(asyncio.to_thread(assets.preload, ["graphics/background.jpg"], False), "asset preload")
+
+        # Musik im Hauptmenü starten (nguu.ogg)
+        with startup.phase("music"):
+            open_main_menu()
+    else:
+        play.on_run_end = director.quit
+        director.push(play)
+        play.start_run()
 
-        if not active:
-            ui.start_screen(screen, screen_width, screen_height, font)
+    top = None
+    while director.running:
+        profiler.start_frame()
+        if director.top is not top:
+            # Eine neue Szene wird mindestens einmal im vollen Takt gezeichnet
+            top = director.top
+            throttle.wake()
+        redraw = render
+        if not render:
+            frame_time = 0.0  # Headless wird nicht gewartet
+            events = pygame.event.get()
+        elif director.idle and throttle.enabled:
+            # Menüs und Startbildschirm: bis zur nächsten Eingabe schlafen
+            events, redraw = throttle.wait(director.animating or profiler.overlay)
+            frame_time = pacer.elapsed()
         else:
-            keys = pygame.key.get_pressed()
-            player.move(keys, screen_height - 100, screen_width - player_size * 2)
+            frame_time = pacer.wait()
+            events = pygame.event.get()
+        profiler.lap("wait")
 
-        for event in pygame.event.get():
-            game_controller.handle_input(event)
+        for event in events:
+            if render:
+                game_controller.handle_input(event)
+            if event.type == pygame.WINDOWEXPOSED or (event.type == pygame.KEYDOWN and event.key == pygame.K_F11):
+                renderer.invalidate()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.toggle_overlay()
+                renderer.invalidate()
             if event.type == pygame.QUIT:
-                running = False
+                director.quit()
                 print("Exit game")
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    if active:
-                        # Ins Pause-Menü wechseln
-                        print("Escape gedrückt, Spiel pausieren")  # Debugging
-                        sound_manager.set_volume(0.1)  # Lautstärke reduzieren, aber Musik läuft weiter
-                        ui.pause_menu(game_controller)  # Pause-Menü anzeigen
-                    else:
-                        # Ins Hauptmenü zurückkehren
-                        print("Escape gedrückt, zurück ins Hauptmenü")  # Debugging
-                        sound_manager.play_music("nguu.ogg", volume=0.5)  # Hauptmenü-Musik abspielen
-                        sound_manager.set_volume(0.5)  # Lautstärke auf 0.5 zurücksetzen
-                        active=False
-
-                if event.key == pygame.K_SPACE and not active:
-                    # Spiel starten
-                    print("Start game: Neue Musik abspielen")  # Debugging
-                    sound_manager.stop_music()  # Zuerst die aktuelle Musik stoppen
-                    sound_manager.play_music("somebody_told_you.ogg", volume=0.5)  # Neue Ingame-Musik abspielen
-                    sound_manager.set_volume(0.5)  # Lautstärke auf Standard zurücksetzen
-                    player = Player(50, screen_height - 100 - player_size, player_size, speed, gravity, ui)
-                    obstacles = ObstacleManager(screen_width, player_size, obstacle_speed, ui)
-                    score = 0
-                    active = True
-
-        if active:
-            score += obstacles.move_obstacles(active)
-
-            if obstacles.check_collision(player.get_rect()):
-                sound_manager.stop_music()  # Musik stoppen
-                sound_manager.play_death_sound()  # Tod-Sound abspielen
-                print("Kollision erkannt, stoppe Musik")  # Debugging
-                if score > highscore_value:
-                    highscore_value = score
-                    save_highscore(highscore_value, ui)
-                active = False
-                # Beim Spielende zurück zur Hauptmusik
-                print("Spiel vorbei: Zurück zur Hauptmusik (nguu.ogg)")  # Debugging
-                sound_manager.play_music("nguu.ogg", volume=0.5)  # Hauptmusik zurücksetzen
-                sound_manager.set_volume(0.5)  # Lautstärke zurück auf Standard
+                continue
+            director.handle_event(event)
+        profiler.lap("events")
 
-            if score >= last_speed_increase + 10:
-                obstacles.speed += 0.5
-                last_speed_increase = score
+        director.update(frame_time)
+        if not director.running:
+            break
 
-        screen.blit(player.image, (player.x, player.y - player_size))
-        ui.manager.draw_ui(screen)
+        if redraw:
+            renderer.mark(director.draw(screen))
+            if director.full_redraw:
+                renderer.invalidate()
+            ui.draw_ui(screen)
+            profiler.lap("draw_ui")
+            renderer.mark(profiler.draw_overlay(screen, debug_font))
+            renderer.mark(latency_probe.draw(screen))
+            profiler.lap("overlay")
 
-        pygame.display.flip()
+            renderer.present()
+            latency_probe.presented()
+            profiler.lap("present")
+        startup.first_frame()
+        profiler.end_frame()
         await asyncio.sleep(0)
 
+    director.cancel_tasks()
+    play.save_run()
+    if profiler.enabled:
+        stats_path = frame_stats or get_ressources_path("frame_stats.json")
+        profiler.dump(stats_path, extra={"music": sound_manager.music.stats(),
+                                         "sfx": sound_manager.voices.stats(),
+                                         "input": latency_probe.stats()})
+        print(f"Frame-Statistik gespeichert: {stats_path}")
+    if sound_manager.voices.measure:
+        audio = sound_manager.voices.stats()
+        print(f"Audio: {audio['played']} Effekte, {audio['stolen']} gestohlen, {audio['dropped']} verworfen; "
+              f"Latenz Eingabe -> Ausgabe p50 {audio['latency_p50_ms']} ms, max {audio['latency_max_ms']} ms "
+              f"(davon Mixer-Puffer {audio['buffer_ms']:.1f} ms)")
+    if latency_probe.enabled:
+        latency = latency_probe.stats()
+        print(f"Eingabe: {latency['samples']} Sprünge, Taste -> Bild p50 {latency['p50_ms']} ms, "
+              f"max {latency['max_ms']} ms; {input_queue.buffered_jumps} Sprünge aus dem Puffer")
+    leaderboard.close()
     pygame.quit()
 
 
@@ -1,3 +1,4 @@
+import collections
 import pygame
 import os
 
@@ -12,7 +13,7 @@ class SpriteSheet:
         frame_height (int): Die Höhe eines einzelnen Frames.
         frames (list): Eine Liste der extrahierten Frames als Pygame-Surfaces.
     """
-    def __init__(self, filename, frame_width, frame_height):
+    def __init__(self, filename, frame_width, frame_height, image=None, verbose=False):
         """
         Initialisiert ein SpriteSheet-Objekt, lädt das Bild und extrahiert die Frames.
 
@@ -20,11 +21,18 @@ class SpriteSheet:
             filename (str): Der Pfad zur Sprite-Sheet-Datei.
             frame_width (int): Die Breite jedes einzelnen Frames.
             frame_height (int): Die Höhe jedes einzelnen Frames.
+            image (pygame.Surface, optional): Bereits geladenes Sprite-Sheet (z. B. aus dem AssetManager).
+                Dann wird ``filename`` nicht gelesen.
+            verbose (bool): Debug-Ausgaben zu jedem extrahierten Frame.
         """
-        if os.path.exists(filename):
+        self.frame_width = frame_width
+        self.frame_height = frame_height
+        self.verbose = verbose
+        if image is not None:
+            self.spritesheet = image
+            self.frames = self._extract_frames()
+        elif os.path.exists(filename):
             self.spritesheet = pygame.image.load(filename).convert_alpha()
-            self.frame_width = frame_width
-            self.frame_height = frame_height
             self.frames = self._extract_frames()
         else:
             self.spritesheet = None
@@ -41,8 +49,9 @@ class SpriteSheet:
         frames = []
 
         # Debug: Zeige die Abmessungen des Spritesheets
-        print(f"SpriteSheet Größe: {sheet_width}x{sheet_height}")
-        print(f"Frame Größe: {self.frame_width}x{self.frame_height}")
+        if self.verbose:
+            print(f"SpriteSheet Größe: {sheet_width}x{sheet_height}")
+            print(f"Frame Größe: {self.frame_width}x{self.frame_height}")
 
         # Überprüfe, wie viele Frames wir in X und Y Richtung extrahieren können
         for y in range(0, sheet_height, self.frame_height):
@@ -52,10 +61,12 @@ class SpriteSheet:
                     frame = self.spritesheet.subsurface(pygame.Rect(x, y, self.frame_width, self.frame_height))
                     frames.append(frame)
                     # Debug: Ausgabe von jedem extrahierten Frame
-                    print(f"Frame extrahiert: {x}, {y} - Größe: {self.frame_width}x{self.frame_height}")
+                    if self.verbose:
+                        print(f"Frame extrahiert: {x}, {y} - Größe: {self.frame_width}x{self.frame_height}")
 
         # Debug: Ausgabe der Anzahl der extrahierten Frames
-        print(f"Anzahl extrahierter Frames: {len(frames)}")
+        if self.verbose:
+            print(f"Anzahl extrahierter Frames: {len(frames)}")
 
         return frames
 
@@ -72,3 +83,243 @@ class SpriteSheet:
         if self.frames:
             return self.frames[index % len(self.frames)]
         return None
+
+
+class AnimationAtlas:
+    """
+    Vorberechnete Animationsframes in Anzeigegröße, je Blickrichtung.
+
+    Alle Frames werden beim Erstellen einmal auf die endgültige Größe skaliert, in das
+    Pixelformat des Displays konvertiert und für die Blickrichtung nach links gespiegelt.
+    Zu jedem Frame wird dabei auch die Kollisionsmaske (``pygame.mask``) berechnet.
+    Beim Animieren wird danach nur noch ein Index gewählt.
+
+    Attributes:
+        size (tuple): Die Anzeigegröße der Frames (Breite, Höhe).
+        frame_duration (float): Anzeigedauer eines Frames in Sekunden.
+        frames (dict): (Zustand, nach rechts schauend) -> Liste der fertigen Surfaces.
+        masks (dict): (Zustand, nach rechts schauend) -> Liste der Masken, parallel zu ``frames``.
+    """
+    def __init__(self, frames_by_state, size, frame_duration=1 / 12):
+        """
+        Erstellt den Atlas.
+
+        Args:
+            frames_by_state (dict): Zustand (z. B. ``idle``) -> Liste der Quell-Surfaces.
+            size (tuple): Die Anzeigegröße (Breite, Höhe).
+            frame_duration (float): Anzeigedauer eines Frames in Sekunden.
+        """
+        self.size = size
+        self.frame_duration = frame_duration
+        self.frames = {}
+        self.masks = {}
+        convert = pygame.display.get_surface() is not None
+        for state, sources in frames_by_state.items():
+            right = []
+            for source in sources:
+                frame = pygame.transform.scale(source, size)
+                if convert:
+                    frame = frame.convert_alpha()
+                right.append(frame)
+            self.frames[(state, True)] = right
+            self.frames[(state, False)] = [pygame.transform.flip(frame, True, False) for frame in right]
+            for facing_right in (True, False):
+                self.masks[(state, facing_right)] = [pygame.mask.from_surface(frame)
+                                                     for frame in self.frames[(state, facing_right)]]
+
+    def frame(self, state, index, facing_right=True):
+        """
+        Gibt einen fertigen Frame zurück.
+
+        Args:
+            state (str): Der Animationszustand.
+            index (int): Der Frame-Index (wird auf die Anzahl der Frames begrenzt).
+            facing_right (bool): Blickrichtung.
+
+        Returns:
+            pygame.Surface: Der Frame.
+        """
+        frames = self.frames[(state, facing_right)]
+        return frames[index % len(frames)]
+
+    def mask(self, state, index, facing_right=True):
+        """
+        Gibt die Kollisionsmaske eines Frames zurück.
+
+        Args:
+            state (str): Der Animationszustand.
+            index (int): Der Frame-Index (wird auf die Anzahl der Frames begrenzt).
+            facing_right (bool): Blickrichtung.
+
+        Returns:
+            pygame.mask.Mask: Die Maske des Frames.
+        """
+        masks = self.masks[(state, facing_right)]
+        return masks[index % len(masks)]
+
+    def frame_count(self, state):
+        """
+        Returns:
+            int: Die Anzahl der Frames eines Zustands.
+        """
+        return len(self.frames[(state, True)])
+
+
+class TextCache:
+    """
+    LRU-Cache für gerenderte Texte.
+
+    Texte werden nach (Font, Größe, Fett, Text, Farbe) gecacht, sodass ``font.render`` nur beim
+    ersten Auftreten eines Textes läuft. Zahlen (z. B. der Punktestand) werden aus einzeln
+    gecachten Ziffern zusammengesetzt: ein neuer Punktestand kostet so ein paar kleine Blits
+    statt eines neuen Text-Renderings.
+
+    Attributes:
+        max_bytes (int): Speicherobergrenze für alle gecachten Surfaces in Bytes.
+        bytes_used (int): Aktuell belegter Speicher in Bytes.
+        hits (int): Anzahl der Cache-Treffer.
+        misses (int): Anzahl der Cache-Fehlschläge (tatsächliche Render-Aufrufe).
+        evictions (int): Anzahl der verdrängten Einträge.
+    """
+    def __init__(self, max_bytes=4 * 1024 * 1024):
+        """
+        Initialisiert einen leeren Cache.
+
+        Args:
+            max_bytes (int): Speicherobergrenze in Bytes.
+        """
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+
+    def render(self, font, text, color, size=None, bold=None, antialias=True):
+        """
+        Gibt den gerenderten Text aus dem Cache zurück oder rendert ihn.
+
+        Args:
+            font (pygame.font.Font): Der Font.
+            text (str): Der Text.
+            color (tuple): Die Textfarbe.
+            size (int, optional): Schriftgröße in Punkt, Standard ist die aktuelle Größe des Fonts.
+            bold (bool, optional): Fettdruck, Standard ist die aktuelle Einstellung des Fonts.
+            antialias (bool): Kantenglättung.
+
+        Returns:
+            pygame.Surface: Der gerenderte Text. Die Surface wird geteilt und darf nicht verändert werden.
+        """
+        current_size = _font_size(font)
+        current_bold = font.get_bold()
+        size = current_size if size is None else size
+        bold = current_bold if bold is None else bold
+        key = (font, size, bold, text, tuple(color), antialias)
+
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        # Größe und Fettdruck nur für das Rendern umstellen, danach wiederherstellen
+        if size != current_size:
+            font.set_point_size(size)
+        if bold != current_bold:
+            font.set_bold(bold)
+        try:
+            surface = font.render(text, antialias, color)
+        finally:
+            if size != current_size:
+                font.set_point_size(current_size)
+            if bold != current_bold:
+                font.set_bold(current_bold)
+
+        self._entries[key] = surface
+        self.bytes_used += surface.get_pitch() * surface.get_height()
+        while self.bytes_used > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes_used -= evicted.get_pitch() * evicted.get_height()
+            self.evictions += 1
+        return surface
+
+    def blit_text(self, target, font, text, color, position, anchor="topleft", size=None, bold=None):
+        """
+        Zeichnet einen gecachten Text.
+
+        Args:
+            target (pygame.Surface): Die Ziel-Surface.
+            font (pygame.font.Font): Der Font.
+            text (str): Der Text.
+            color (tuple): Die Textfarbe.
+            position (tuple): Die Position des Ankerpunkts.
+            anchor (str): Ankerpunkt des Textes, z. B. ``topleft``, ``topright`` oder ``midtop``.
+            size (int, optional): Schriftgröße in Punkt.
+            bold (bool, optional): Fettdruck.
+
+        Returns:
+            pygame.Rect: Der Bereich, in den gezeichnet wurde.
+        """
+        surface = self.render(font, text, color, size, bold)
+        rect = surface.get_rect(**{anchor: position})
+        target.blit(surface, rect)
+        return rect
+
+    def blit_number(self, target, font, prefix, value, color, position, anchor="topleft", size=None, bold=None):
+        """
+        Zeichnet ``prefix`` gefolgt von einer Zahl, zusammengesetzt aus gecachten Ziffern.
+
+        Args:
+            target (pygame.Surface): Die Ziel-Surface.
+            font (pygame.font.Font): Der Font.
+            prefix (str): Der Text vor der Zahl, z. B. ``"Score: "``.
+            value (int): Die Zahl.
+            color (tuple): Die Textfarbe.
+            position (tuple): Die Position des Ankerpunkts.
+            anchor (str): Ankerpunkt des gesamten Textes.
+            size (int, optional): Schriftgröße in Punkt.
+            bold (bool, optional): Fettdruck.
+
+        Returns:
+            pygame.Rect: Der Bereich, in den gezeichnet wurde.
+        """
+        parts = [self.render(font, prefix, color, size, bold)]
+        parts.extend(self.render(font, digit, color, size, bold) for digit in str(value))
+        width = sum(part.get_width() for part in parts)
+        height = max(part.get_height() for part in parts)
+        rect = pygame.Rect(0, 0, width, height)
+        setattr(rect, anchor, position)
+        x = rect.x
+        for part in parts:
+            target.blit(part, (x, rect.y))
+            x += part.get_width()
+        return rect
+
+    def stats(self):
+        """
+        Returns:
+            dict: Treffer, Fehlschläge, Verdrängungen, Anzahl der Einträge und belegter Speicher.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.bytes_used,
+        }
+
+    def clear(self):
+        """Leert den Cache (die Zähler bleiben erhalten)."""
+        self._entries.clear()
+        self.bytes_used = 0
+
+
+def _font_size(font):
+    """Gibt die Punktgröße eines Fonts zurück (pygame-ce), ersatzweise seine Zeilenhöhe."""
+    size = getattr(font, "point_size", None)
+    return size if size is not None else font.get_height()
+
+
+# Gemeinsamer Cache für alle Texte im Spiel
+text_cache = TextCache()
@@ -1,17 +1,20 @@
 import pygame
-import pygame_gui
 import sys
 import os
 from .sfx import sound_manager
+from .gfx import text_cache
+from .assets import assets, get_ressources_path
+from .profiler import startup
+from .scenes import Scene
 
-def get_ressources_path(filename):
-    """
-    Gibt den absolut korrekten Pfad zur Ressource zurück – funktioniert sowohl
-    im Entwicklungsmodus als auch in einer PyInstaller-exe.
-    """
-    # Pfad zur temporären Entpackung (PyInstaller) oder aktuelles Verzeichnis
-    base_path = getattr(sys, '_MEIPASS', os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-    return os.path.join(base_path, 'ressources', filename)
+
+def _pygame_gui():
+    """Importiert pygame_gui erst, wenn das erste Menü angezeigt wird."""
+    if "pygame_gui" not in sys.modules:
+        with startup.phase("import pygame_gui"):
+            import pygame_gui
+    import pygame_gui
+    return pygame_gui
 
 class UI:
     """
@@ -21,16 +24,54 @@ class UI:
     screen_height = 600
 
     def __init__(self, screen_width, screen_height):
-        pygame.init()
-        pygame.font.init()
+        # Das Fenster öffnet game.init_game; der UIManager (und damit pygame_gui) entsteht
+        # erst, wenn das erste Menü angezeigt wird.
 
         # tatsächliche Größe speichern (nicht nur die Klassen-Defaults)
         self.screen_width = screen_width
         self.screen_height = screen_height
 
-        self.screen = pygame.display.set_mode((screen_width, screen_height))
         self.fullscreen = False
-        self.font = pygame.font.SysFont('helvetica', 35, True, False)
+        self._font = None
+        self._manager = None
+
+        self.FPS = 60
+        self.volume = 0.5
+        self.volume_slider = None
+        self.sound_manager = sound_manager
+
+    @property
+    def screen(self):
+        """Die aktuelle Display-Surface."""
+        return pygame.display.get_surface()
+
+    @property
+    def font(self):
+        """Die Menüschrift, wird beim ersten Zugriff geladen."""
+        if self._font is None:
+            self._font = pygame.font.SysFont('helvetica', 35, True, False)
+        return self._font
+
+    @property
+    def manager(self):
+        """Der ``pygame_gui.UIManager``, wird beim ersten Zugriff erstellt."""
+        if self._manager is None:
+            with startup.phase("UIManager"):
+                self._manager = self._create_manager()
+        return self._manager
+
+    def draw_ui(self, surface):
+        """
+        Zeichnet die Elemente des UIManagers, falls er schon erstellt wurde.
+
+        Args:
+            surface (pygame.Surface): Die Zieloberfläche.
+        """
+        if self._manager is not None:
+            self._manager.draw_ui(surface)
+
+    def _create_manager(self):
+        pygame_gui = _pygame_gui()
 
         # Theme laden (global für ALLE Buttons)
         theme_path = self.get_ressources_path('ui/theme.json')
@@ -41,11 +82,11 @@ class UI:
             theme_dir = os.path.dirname(theme_path)
             try:
                 os.chdir(theme_dir)
-                self.manager = pygame_gui.UIManager((screen_width, screen_height), theme_path=theme_path)
+                manager = pygame_gui.UIManager((self.screen_width, self.screen_height), theme_path=theme_path)
             finally:
                 os.chdir(original_cwd)
         else:
-            self.manager = pygame_gui.UIManager((screen_width, screen_height))
+            manager = pygame_gui.UIManager((self.screen_width, self.screen_height))
         # >>>
 
         # --- Debug: prüfen, ob Theme und Images wirklich erreichbar sind ---
@@ -70,244 +111,189 @@ class UI:
         print("[A] Hover-Image  exists:", os.path.exists(img_a_hover),  "->", os.path.abspath(img_a_hover))
         print("[A] Press-Image  exists:", os.path.exists(img_a_press),  "->", os.path.abspath(img_a_press))
         # ------------------------------------------------------------------
-
-        self.FPS = 60
-        self.volume = 0.5
-        self.volume_slider = None
-        self.clock = pygame.time.Clock()
-        self.pause_menu_active = False
-        self.main_menu_elements = []
-        self.pause_menu_elements = []
-        self.sound_manager = sound_manager
+        return manager
 
     def get_ressources_path(self, filename):
         """
-        Pfad, der sowohl im Dev-Modus als auch in einer PyInstaller-EXE funktioniert.
-        Achtung: 'ressources' liegt eine Ebene über diesem Modul.
+        Pfad, der sowohl im Dev-Modus als auch in einer PyInstaller-EXE funktioniert
+        (siehe ``assets.get_ressources_path``).
         """
-        base = getattr(sys, '_MEIPASS', os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-        return os.path.join(base, 'ressources', filename)
+        return get_ressources_path(filename)
 
     def start_screen(self, screen, screen_width, screen_height, font):
         WHITE = (255, 255, 255)
-        font.set_point_size(32)
-        font.set_bold(True)
-        default_text = font.render("Press SPACE to start", True, (WHITE))
-        screen.blit(default_text, (screen_width // 2 - default_text.get_width() // 2, screen_height // 2 - 100))
-        default_text2 = font.render("Press SPACE to jump and A/D to move", True, WHITE)
-        screen.blit(default_text2, (screen_width // 2 - default_text2.get_width() // 2,
-                                    screen_height // 2 - default_text2.get_height() // 2 + default_text.get_height() - 80))
-        font.set_point_size(16)
-        font.set_bold(False)
-        copyright = font.render("© 2025 Jonas 'FireJSX' Vogel", True, WHITE)
-        screen.blit(copyright, (screen_width // 2 - copyright.get_width() // 2,
-                                screen_height - copyright.get_height() - 20))
-        font.set_bold(False)
-
-    def pause_menu(self, controller):
-        self.pause_menu_active = True
-        paused = True
-
-        # Lade den Hintergrund und das Overlay für das Pause-Menü
-        pause_background = pygame.image.load(self.get_ressources_path('graphics/background.jpg')).convert_alpha()
-        pause_background.set_alpha(250)
+        # Die Texte kommen aus dem Text-Cache, gerendert wird nur beim ersten Aufruf
+        default_text = text_cache.render(font, "Press SPACE to start", WHITE, size=32, bold=True)
+        rects = [screen.blit(default_text, (screen_width // 2 - default_text.get_width() // 2, screen_height // 2 - 100))]
+        default_text2 = text_cache.render(font, "Press SPACE to jump and A/D to move", WHITE, size=32, bold=True)
+        rects.append(screen.blit(default_text2, (screen_width // 2 - default_text2.get_width() // 2,
+                                    screen_height // 2 - default_text2.get_height() // 2 + default_text.get_height() - 80)))
+        copyright = text_cache.render(font, "© 2025 Jonas 'FireJSX' Vogel", WHITE, size=16, bold=False)
+        rects.append(screen.blit(copyright, (screen_width // 2 - copyright.get_width() // 2,
+                                screen_height - copyright.get_height() - 20)))
+        return rects
+
+    def _build_pause_background(self):
+        """
+        Baut den Hintergrund des Pause-Menüs: das Bild bildschirmfüllend skaliert und zentriert,
+        darüber das halbtransparente schwarze Overlay, zusammen in einer Surface.
 
+        Returns:
+            pygame.Surface: Der fertige Hintergrund in Bildschirmgröße.
+        """
         screen_width = self.screen.get_width()
         screen_height = self.screen.get_height()
-        original_width, original_height = pause_background.get_size()
-        scale_factor_x = screen_width / original_width
-        scale_factor_y = screen_height / original_height
-        scale_factor = max(scale_factor_x, scale_factor_y)
-        new_width = int(original_width * scale_factor)
-        new_height = int(original_height * scale_factor)
+        new_width, new_height = self.pause_background_size(assets.source_size('graphics/background.jpg'),
+                                                           (screen_width, screen_height))
         x_position = int((new_width - screen_width) / 2) * -1
         y_position = int((new_height - screen_height) / 2) * -1
-        scaled_pause_background = pygame.transform.scale(pause_background, (new_width, new_height))
+        # Das skalierte Bild wird nur hier gebraucht und gleich wieder freigegeben
+        background = pygame.Surface((screen_width, screen_height)).convert()
+        background.blit(assets.image('graphics/background.jpg', size=(new_width, new_height)), (x_position, y_position))
+        assets.release(assets.image_key('graphics/background.jpg', size=(new_width, new_height)))
 
         # Transparentes Overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
+        overlay = pygame.Surface((screen_width, screen_height))
         overlay.fill((0, 0, 0))  # Schwarze Füllung
         overlay.set_alpha(120)  # Transparenzwert
+        background.blit(overlay, (0, 0))
+        return background
 
-        # Buttons für das Pause-Menü
-        button_width = 200
-        button_height = 50
-        spacing = 20
-        center_x = screen_width // 2 - button_width // 2
-        start_y = screen_height // 2 - (button_height + spacing)
-
-        # Keine object_id -> Theme gilt GLOBAL
-        resume_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect((center_x, start_y), (button_width, button_height)),
-            text='Continue',
-            manager=self.manager
-        )
-
-        main_menu_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect((center_x, start_y + button_height + spacing), (button_width, button_height)),
-            text='Main Menu',
-            manager=self.manager
-        )
-
-        quit_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect((center_x, start_y + 2 * (button_height + spacing)),
-                                      (button_width, button_height)),
-            text='Exit game',
-            manager=self.manager
-        )
-
-        self.pause_menu_elements = [resume_button, main_menu_button, quit_button]
-
-        # Musikpause und Lautstärkeregelung
-        sound_manager.set_volume(0.1)  # Lautstärke verringern
-
-        while paused:
-            time_delta = self.clock.tick(self.FPS) / 1000.0
-
-            for event in pygame.event.get():
-                controller.handle_input(event)
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                    paused = False  # Pausieren abbrechen
-
-                if event.type == pygame.USEREVENT:
-                    if event.user_type == pygame_gui.UI_BUTTON_PRESSED:
-                        if event.ui_element == resume_button:
-                            paused = False
-                            sound_manager.set_volume(0.5)  # Lautstärke zurücksetzen
-                            sound_manager.resume_music()  # Musik fortsetzen
-                        elif event.ui_element == main_menu_button:
-                            self._clear_pause_menu_elements()
-                            self.pause_menu_active = False
-                            sound_manager.stop_music()  # Ingame-Musik stoppen
-                            sound_manager.play_music("nguu.ogg", volume=0.5)  # Hauptmenü-Musik abspielen
-                            self.show_main_menu(controller)  # Zum Hauptmenü wechseln
-                            return
-                        elif event.ui_element == quit_button:
-                            pygame.quit()
-                            sys.exit()
-
-                self.manager.process_events(event)
-
-            self.manager.update(time_delta)
-
-            # Hintergrund und Overlay anzeigen
-            self.screen.blit(scaled_pause_background, (x_position, y_position))
-            self.screen.blit(overlay, (0, 0))
-
-            self.manager.draw_ui(self.screen)
-            pygame.display.flip()
-
-        # Menü verlassen
-        sound_manager.set_volume(0.5)
-        for element in self.pause_menu_elements:
-            element.kill()
-        self.pause_menu_elements.clear()
-        self.pause_menu_active = False
-
-        # UIManager nach dem Menü neu mit Theme initialisieren
-        theme_path = self.get_ressources_path('ui/theme.json')
+    @staticmethod
+    def pause_background_size(source_size, screen_size):
+        """Gibt die Größe zurück, in der der Pause-Hintergrund den Bildschirm vollständig bedeckt."""
+        scale_factor = max(screen_size[0] / source_size[0], screen_size[1] / source_size[1])
+        return int(source_size[0] * scale_factor), int(source_size[1] * scale_factor)
 
-        # <<< auch hier kurz ins Theme-Verzeichnis wechseln
-        if os.path.exists(theme_path):
-            original_cwd = os.getcwd()
-            theme_dir = os.path.dirname(theme_path)
-            try:
-                os.chdir(theme_dir)
-                self.manager = pygame_gui.UIManager((self.screen_width, self.screen_height), theme_path=theme_path)
-            finally:
-                os.chdir(original_cwd)
+
+class MenuScene(Scene):
+    """
+    Basis der Menüs: eine Spalte Buttons über einem bildschirmfüllenden Hintergrund.
+
+    Die Szenen werden einmal erstellt und bei jedem Öffnen wiederverwendet. Die Buttons
+    entstehen beim ersten Öffnen und werden danach nur ein- und ausgeblendet, der
+    UIManager samt Theme bleibt derselbe.
+
+    Attributes:
+        ui (UI): Liefert UIManager und Bildschirmgröße.
+        actions (list): (Text, Funktion) je Button, von oben nach unten.
+    """
+    full_redraw = True
+    idle = True
+    button_width = 200
+    button_height = 50
+    spacing = 20
+
+    def __init__(self, ui, actions):
+        super().__init__()
+        self.ui = ui
+        self.actions = actions
+        self._buttons = None
+
+    def _build_buttons(self):
+        pygame_gui = _pygame_gui()
+        screen_width, screen_height = self.ui.screen.get_size()
+        center_x = screen_width // 2 - self.button_width // 2
+        start_y = screen_height // 2 - (self.button_height + self.spacing)
+        buttons = {}
+        for row, (text, action) in enumerate(self.actions):
+            # Keine object_id -> Theme gilt GLOBAL; unsichtbar bis zum Öffnen des Menüs
+            button = pygame_gui.elements.UIButton(
+                relative_rect=pygame.Rect((center_x, start_y + row * (self.button_height + self.spacing)),
+                                          (self.button_width, self.button_height)),
+                text=text,
+                manager=self.ui.manager,
+                visible=0
+            )
+            buttons[button] = action
+        return buttons
+
+    def enter(self):
+        if self._buttons is None:
+            self._buttons = self._build_buttons()
+        for button in self._buttons:
+            button.show()
+
+    def leave(self):
+        for button in self._buttons:
+            button.hide()
+
+    def handle_event(self, event):
+        if event.type == pygame.USEREVENT and event.user_type == _pygame_gui().UI_BUTTON_PRESSED:
+            action = self._buttons.get(event.ui_element)
+            if action is not None:
+                action()
+                return
+        self.ui.manager.process_events(event)
+
+    def update(self, frame_time):
+        self.ui.manager.update(frame_time)
+
+
+class MainMenuScene(MenuScene):
+    """
+    Das Hauptmenü (Start game, Exit game).
+
+    Attributes:
+        background (pygame.Surface or None): Der skalierte Hintergrund, geladen beim ersten Öffnen.
+    """
+    def __init__(self, ui, on_start, on_quit):
+        super().__init__(ui, [('Start game', on_start), ('Exit game', on_quit)])
+        self.background = None
+
+    def enter(self):
+        if self.background is None:
+            # Hintergrund nur beim ersten Öffnen laden und skalieren, danach bleibt er im Speicher
+            with startup.phase("menu background"):
+                self.background = assets.image('graphics/MainMenu.png', size=self.ui.screen.get_size(), alpha=False)
+        super().enter()
+
+    def draw(self, screen):
+        # Die Buttons zeichnet die Hauptschleife (UI.draw_ui)
+        if self.background:
+            screen.blit(self.background, (0, 0))
         else:
-            self.manager = pygame_gui.UIManager((self.screen_width, self.screen_height))
-        # >>>
+            screen.fill((30, 30, 30))
 
-    def _clear_pause_menu_elements(self):
-        for element in self.pause_menu_elements:
-            element.kill()
-        self.pause_menu_elements.clear()
 
-    def update(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.pause_menu()
-            self.manager.process_events(event)
-
-        time_delta = self.clock.tick(self.FPS) / 1000
-        self.manager.update(time_delta)
-        self.screen.fill((0, 0, 0))
-        if not self.pause_menu_active:
-            self.manager.draw_ui(self.screen)
-        pygame.display.flip()
-
-    def show_main_menu(self, controller):
-        self.main_menu_active = True
-
-        try:
-            background = pygame.image.load(self.get_ressources_path('graphics/MainMenu.png')).convert()
-            background = pygame.transform.scale(background, (self.screen.get_width(), self.screen.get_height()))
-        except:
-            background = None
-
-        button_width = 200
-        button_height = 50
-        spacing = 20
-        center_x = self.screen.get_width() // 2 - button_width // 2
-        start_y = self.screen.get_height() // 2 - (button_height + spacing)
-
-        # Buttons ohne object_id -> verwenden globale Theme-Regel "button"
-        start_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect((center_x, start_y), (button_width, button_height)),
-            text='Start game',
-            manager=self.manager
-        )
-
-        quit_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect((center_x, start_y + button_height + spacing), (button_width, button_height)),
-            text='Exit game',
-            manager=self.manager
-        )
-
-        self.main_menu_elements.extend([start_button, quit_button])
-
-        while self.main_menu_active:
-            time_delta = self.clock.tick(self.FPS) / 1000.0
-
-            for event in pygame.event.get():
-                controller.handle_input(event)
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if event.type == pygame.USEREVENT:
-                    if event.user_type == pygame_gui.UI_BUTTON_PRESSED:
-                        if event.ui_element.text == 'Start game':
-                            self.main_menu_active = False
-                            for element in self.main_menu_elements:
-                                element.kill()
-                            self.main_menu_elements.clear()
-
-                        elif event.ui_element.text == 'Exit game':
-                            pygame.quit()
-                            sys.exit()
-
-                self.manager.process_events(event)
-
-            self.manager.update(time_delta)
-
-            if background:
-                self.screen.blit(background, (0, 0))
-            else:
-                self.screen.fill((30, 30, 30))
-
-            self.manager.draw_ui(self.screen)
-            pygame.display.update()
+class PauseScene(MenuScene):
+    """
+    Das Pause-Menü (Continue, Main Menu, Exit game).
+
+    Solange die Szene offen ist, läuft die Musik leiser weiter; ESC oder "Continue" schließt sie.
+    Hintergrund und abdunkelndes Overlay liegen fertig übereinander in einer Surface.
+
+    Attributes:
+        on_resume (callable): Wird bei "Continue" oder ESC aufgerufen.
+    """
+    def __init__(self, ui, on_resume, on_main_menu, on_quit):
+        super().__init__(ui, [('Continue', on_resume), ('Main Menu', on_main_menu), ('Exit game', on_quit)])
+        self.on_resume = on_resume
+        self._background = None
+
+    def enter(self):
+        if self._background is None:
+            # Wird nur beim ersten Öffnen geladen, skaliert und abgedunkelt
+            screen_width, screen_height = self.ui.screen.get_size()
+            self._background = assets.get(("pause_background", screen_width, screen_height),
+                                          self.ui._build_pause_background)
+        super().enter()
+        # Musik leiser, aber sie läuft weiter
+        sound_manager.set_volume(0.1)
+
+    def leave(self):
+        super().leave()
+        sound_manager.set_volume(0.5)  # Lautstärke zurücksetzen
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.on_resume()
+            return
+        super().handle_event(event)
+
+    def draw(self, screen):
+        screen.blit(self._background, (0, 0))
+
 
 class GameController:
     def __init__(self, screen):
@@ -319,8 +305,8 @@ class GameController:
             if event.key == pygame.K_F11:
                 self.toggle_fullscreen()
             if event.key == pygame.K_F12:
-                pygame.quit()
-                sys.exit()
+                # Wie das Schließen des Fensters beenden, damit die Hauptschleife aufräumt und speichert
+                pygame.event.post(pygame.event.Event(pygame.QUIT))
 
     def toggle_fullscreen(self):
         fullscreen = not pygame.display.get_surface().get_flags() & pygame.FULLSCREEN
@@ -331,24 +317,29 @@ class GameController:
 
 class BackgroundImage:
     def __init__(self, filename, screen_width, screen_height, get_asset_path, scroll_speed=1.0):
-        self.image = pygame.image.load(get_asset_path(filename)).convert_alpha()
-        self.original_width, self.original_height = self.image.get_size()
+        # Die skalierte Ebene kommt aus dem AssetManager (mit Asset-Pack ohne Dekodieren und Skalieren)
+        self.original_width, self.original_height = assets.source_size(filename)
         self.scale_factor_x = screen_width / self.original_width
         self.scale_factor_y = screen_height / self.original_height
         self.scale_factor = self.scale_factor_y
-        self.new_width = int(self.original_width * self.scale_factor)
-        self.new_height = int(self.original_height * self.scale_factor)
-        self.scaled_image = pygame.transform.scale(self.image, (self.new_width, self.new_height))
+        self.new_width, self.new_height = self.scaled_size((self.original_width, self.original_height), screen_height)
+        self.scaled_image = assets.image(filename, size=(self.new_width, self.new_height))
 
         self.scroll_speed = scroll_speed
         self.scroll_offset = 0
         self.screen_width = screen_width
         self.screen_height = screen_height
 
-    def update(self):
-        self.scroll_offset += self.scroll_speed
+    @staticmethod
+    def scaled_size(source_size, screen_height):
+        """Gibt die Größe einer Ebene zurück, die auf Bildschirmhöhe skaliert wird."""
+        scale_factor = screen_height / source_size[1]
+        return int(source_size[0] * scale_factor), int(source_size[1] * scale_factor)
+
+    def update(self, steps=1):
+        self.scroll_offset += self.scroll_speed * steps
         if self.scroll_offset >= self.new_width:
-            self.scroll_offset = 0
+            self.scroll_offset %= self.new_width
 
     def blit(self, screen):
         x = -self.scroll_offset
@@ -362,14 +353,20 @@ class BackgroundImage:
 class Floor:
     def __init__(self, screen, image_path, get_asset_path):
         self.screen = screen
-        self.image = pygame.image.load(get_asset_path(image_path)).convert_alpha()
-        self.original_width, self.original_height = self.image.get_size()
+        self.original_width, self.original_height = assets.source_size(image_path)
         self.screen_width, self.screen_height = screen.get_size()
-        new_height = self.original_height * 0.69
-        scale_factor = new_height / self.original_height
-        new_width = int(self.original_width * scale_factor)
-        self.image = pygame.transform.scale(self.image, (new_width, int(new_height)))
+        self.image = assets.image(image_path, size=self.scaled_size((self.original_width, self.original_height)))
         self.rect = self.image.get_rect(bottomleft=(0, self.screen_height))
 
+    @staticmethod
+    def scaled_size(source_size):
+        """Gibt die Größe zurück, auf die der Boden skaliert wird (69 % der Originalhöhe)."""
+        new_height = source_size[1] * 0.69
+        scale_factor = new_height / source_size[1]
+        return int(source_size[0] * scale_factor), int(new_height)
+
     def update(self):
-        self.screen.blit(self.image, self.rect)
+        self.blit(self.screen)
+
+    def blit(self, target):
+        return target.blit(self.image, self.rect)
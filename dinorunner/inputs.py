@@ -0,0 +1,221 @@
+"""
+Eingabe-Pipeline: Tastenereignisse mit Zeitstempel für die Simulationsticks.
+
+Die Hauptschleife holt zu Beginn jedes Frames alle Events ab. ``InputQueue.handle_event``
+versieht die Tastenereignisse von A, D und Leertaste mit einem Zeitstempel und reiht sie
+ein; vor jedem Simulationstick macht ``InputQueue.action`` aus den eingereihten Events
+und den gehaltenen Tasten die Aktion dieses Ticks. Anders als mit ``pygame.key.get_pressed()``
+geht so auch ein Tastendruck nicht verloren, der innerhalb eines Frames gedrückt und
+wieder losgelassen wurde.
+
+Ein Sprung, der in der Luft gedrückt wird, bleibt ``jump_buffer`` Ticks lang vorgemerkt und
+wird im ersten Tick am Boden ausgeführt. Ins Replay kommt wie bisher die Aktion jedes Ticks,
+Replays bleiben damit bitgenau reproduzierbar.
+
+``LatencyProbe`` misst die Zeit vom Sprung-Tastendruck bis zum ausgegebenen Frame, der den
+Sprung zeigt (``--input-latency``).
+"""
+import collections
+import time
+
+import pygame
+
+from .simulation import Action, TICK_RATE
+
+# Tasten -> Bit der Aktion (A = LEFT, D = RIGHT, Leertaste = JUMP)
+KEY_ACTIONS = {
+    pygame.K_a: int(Action.LEFT),
+    pygame.K_d: int(Action.RIGHT),
+    pygame.K_SPACE: int(Action.JUMP),
+}
+_JUMP = int(Action.JUMP)
+_MOVE = int(Action.LEFT | Action.RIGHT)
+
+
+class InputQueue:
+    """
+    Sammelt Tastenereignisse und liefert die Aktion des nächsten Simulationsticks.
+
+    Attributes:
+        jump_buffer (int): So viele Ticks bleibt ein Sprung-Tastendruck in der Luft vorgemerkt.
+        held (int): Bitmaske der gerade gehaltenen Tasten.
+        last_jump_at (float or None): Zeitstempel (``time.perf_counter``) des Tastendrucks, der
+            den letzten Sprung ausgelöst hat; None, wenn er durch eine gehaltene Taste ausgelöst wurde.
+        buffered_jumps (int): Anzahl der Sprünge, die erst durch den Puffer möglich wurden.
+    """
+    def __init__(self, jump_buffer_ms=100, keymap=None):
+        """
+        Initialisiert die Warteschlange.
+
+        Args:
+            jump_buffer_ms (float): Dauer des Sprung-Puffers in Millisekunden.
+            keymap (dict, optional): Taste -> Bit der Aktion, Standard ist ``KEY_ACTIONS``.
+        """
+        self.keymap = KEY_ACTIONS if keymap is None else keymap
+        self.jump_buffer = 0
+        self.configure(jump_buffer_ms)
+        self.held = 0
+        self.last_jump_at = None
+        self.buffered_jumps = 0
+        self._events = collections.deque()
+        self._tapped = 0
+        self._jump_ticks = 0
+        self._jump_at = None
+
+    def configure(self, jump_buffer_ms):
+        """
+        Setzt die Dauer des Sprung-Puffers.
+
+        Args:
+            jump_buffer_ms (float): Dauer in Millisekunden, 0 schaltet den Puffer ab.
+        """
+        self.jump_buffer = max(0, round(jump_buffer_ms * TICK_RATE / 1000))
+
+    def reset(self, keys=None):
+        """
+        Verwirft alle eingereihten Events, z. B. beim Start eines Laufs oder nach einem Menü.
+
+        Args:
+            keys (list, optional): ``pygame.key.get_pressed()``; gehaltene Lauftasten werden übernommen,
+                die Sprungtaste nicht (sonst springt der Spieler mit der Starttaste sofort los).
+        """
+        self._events.clear()
+        self._tapped = 0
+        self._jump_ticks = 0
+        self._jump_at = None
+        self.held = 0
+        if keys is not None:
+            for key, bit in self.keymap.items():
+                if bit & _MOVE and keys[key]:
+                    self.held |= bit
+
+    def handle_event(self, event, now=None):
+        """
+        Reiht ein Tastenereignis mit Zeitstempel ein.
+
+        Args:
+            event (pygame.event.Event): Das Event.
+            now (float, optional): Zeitstempel, Standard ist ``time.perf_counter()``.
+
+        Returns:
+            bool: True, wenn das Event eine Spieltaste betrifft.
+        """
+        if event.type != pygame.KEYDOWN and event.type != pygame.KEYUP:
+            return False
+        bit = self.keymap.get(event.key)
+        if bit is None:
+            return False
+        self._events.append((time.perf_counter() if now is None else now, bit, event.type == pygame.KEYDOWN))
+        return True
+
+    def action(self):
+        """
+        Wendet die eingereihten Events an und gibt die Aktion des nächsten Ticks zurück.
+
+        Returns:
+            int: Die Bits der Aktion (``simulation.Action``).
+        """
+        while self._events:
+            stamp, bit, down = self._events.popleft()
+            if down:
+                self.held |= bit
+                # Kurz angetippte Tasten zählen mindestens für einen Tick
+                self._tapped |= bit
+                if bit == _JUMP:
+                    self._jump_ticks = self.jump_buffer + 1
+                    self._jump_at = stamp
+            else:
+                self.held &= ~bit
+        action = self.held | self._tapped
+        self._tapped = 0
+        if self._jump_ticks:
+            action |= _JUMP
+        return action
+
+    def advance(self, jumped):
+        """
+        Schließt einen Tick ab: Ein ausgeführter Sprung verbraucht den Puffer, sonst läuft er ab.
+
+        Args:
+            jumped (bool): Ob der Spieler in diesem Tick abgesprungen ist.
+        """
+        if jumped:
+            if self._jump_at is not None and self._jump_ticks <= self.jump_buffer:
+                self.buffered_jumps += 1
+            self.last_jump_at = self._jump_at
+            self._jump_ticks = 0
+            self._jump_at = None
+        elif self._jump_ticks:
+            self._jump_ticks -= 1
+            if not self._jump_ticks:
+                self._jump_at = None
+
+
+class LatencyProbe:
+    """
+    Misst die Zeit vom Sprung-Tastendruck bis zum ausgegebenen Frame, der den Sprung zeigt.
+
+    In diesem Frame wird zusätzlich ein weißes Quadrat (Marker) in die linke untere Ecke
+    gezeichnet. Gemessen wird bis nach der Ausgabe (``display.flip``); die Zeit vom Tastendruck
+    bis zum Licht lässt sich mit einer Fotodiode oder Highspeed-Kamera am Marker messen.
+
+    Attributes:
+        enabled (bool): Ob gemessen und der Marker gezeichnet wird.
+        size (int): Kantenlänge des Markers in Pixeln.
+        samples (collections.deque): Die letzten Latenzen in Millisekunden.
+    """
+    def __init__(self, enabled=False, size=24):
+        self.enabled = enabled
+        self.size = size
+        self.samples = collections.deque(maxlen=256)
+        self._pending = None
+        self._shown = None
+
+    def mark(self, pressed_at):
+        """
+        Meldet einen ausgeführten Sprung; der nächste Frame zeigt den Marker.
+
+        Args:
+            pressed_at (float or None): Zeitstempel des auslösenden Tastendrucks.
+        """
+        if self.enabled and pressed_at is not None:
+            self._pending = pressed_at
+
+    def draw(self, screen):
+        """
+        Zeichnet den Marker, falls ein Sprung gemeldet wurde.
+
+        Args:
+            screen (pygame.Surface): Die Zieloberfläche.
+
+        Returns:
+            pygame.Rect or None: Der Bereich des Markers.
+        """
+        if self._pending is None:
+            return None
+        self._shown, self._pending = self._pending, None
+        return screen.fill((255, 255, 255), (0, screen.get_height() - self.size, self.size, self.size))
+
+    def presented(self):
+        """Nach der Ausgabe eines Frames aufrufen; misst die Latenz, falls er den Marker zeigt."""
+        if self._shown is not None:
+            self.samples.append((time.perf_counter() - self._shown) * 1000.0)
+            self._shown = None
+
+    def stats(self):
+        """
+        Returns:
+            dict: Anzahl der Messungen sowie p50 und Maximum der Latenz in Millisekunden.
+        """
+        ordered = sorted(self.samples)
+        return {
+            "samples": len(ordered),
+            "p50_ms": round(ordered[len(ordered) // 2], 2) if ordered else None,
+            "max_ms": round(ordered[-1], 2) if ordered else None,
+        }
+
+
+# Gemeinsame Eingabe-Warteschlange des Spiels
+input_queue = InputQueue()
+# Latenzmessung Taste -> Bild (nur mit --input-latency)
+latency_probe = LatencyProbe()
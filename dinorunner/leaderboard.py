@@ -0,0 +1,319 @@
+"""
+SQLite-Bestenliste mit mehreren Profilen.
+
+Jeder Lauf wird mit Profil, Punktestand, Dauer (in Ticks), Seed, Zeitstempel und optional
+seinem Replay gespeichert. Indizes auf ``score`` und ``(profile_id, score)`` halten Top-K-
+und Profil-Bestwert-Abfragen auch bei Millionen Läufen schnell; für Perzentile wird zusätzlich
+eine Tabelle mit der Anzahl der Läufe je Punktestand gepflegt, sodass nur über die
+verschiedenen Punktestände und nicht über alle Läufe summiert werden muss.
+
+Geschrieben wird gebündelt von einem Hintergrund-Thread: viele Läufe (z. B. von Bots)
+landen in einer Transaktion statt in je einem fsync.
+
+Den besten Punktestand hält die Bestenliste im Speicher. Höchstens alle ``check_interval``
+Sekunden fragt ``best`` per ``PRAGMA data_version`` ab, ob eine andere Verbindung (etwa ein
+zweites Spiel oder ein Bot-Lauf) inzwischen geschrieben hat, und liest ihn nur dann neu.
+"""
+import atexit
+import collections
+import json
+import queue
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    score INTEGER NOT NULL,
+    duration INTEGER NOT NULL,
+    seed INTEGER,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS replays (
+    run_id INTEGER PRIMARY KEY REFERENCES runs(id),
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS score_counts (
+    score INTEGER PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_score ON runs(score DESC);
+CREATE INDEX IF NOT EXISTS runs_profile_score ON runs(profile_id, score DESC);
+"""
+
+LeaderboardEntry = collections.namedtuple("LeaderboardEntry", "run_id profile score duration seed created_at")
+LeaderboardEntry.__doc__ = """
+Ein Lauf in der Bestenliste.
+
+Attributes:
+    run_id (int): Die ID des Laufs.
+    profile (str): Der Name des Profils.
+    score (int): Der Punktestand.
+    duration (int): Die Dauer in Ticks.
+    seed (int or None): Der Seed des Laufs.
+    created_at (float): Zeitpunkt als Unix-Zeitstempel.
+"""
+
+
+def _connect(path):
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")  # Leser blockieren den Schreib-Thread nicht
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class Leaderboard:
+    """
+    Bestenliste in einer SQLite-Datenbank mit gebündeltem Schreiben im Hintergrund.
+
+    Attributes:
+        path (str): Pfad zur Datenbankdatei.
+        batch_size (int): Maximale Anzahl an Läufen pro Transaktion.
+        flush_interval (float): Maximale Wartezeit in Sekunden, bevor ein unvollständiger Batch geschrieben wird.
+        check_interval (float): Mindestabstand in Sekunden zwischen zwei Prüfungen auf Änderungen der Datenbank.
+    """
+    def __init__(self, path, batch_size=500, flush_interval=0.5, check_interval=1.0):
+        """
+        Öffnet (oder erstellt) die Datenbank.
+
+        Args:
+            path (str): Pfad zur Datenbankdatei.
+            batch_size (int): Maximale Anzahl an Läufen pro Transaktion.
+            flush_interval (float): Sekunden, die der Schreib-Thread auf weitere Läufe wartet.
+            check_interval (float): Sekunden zwischen zwei Prüfungen auf Änderungen der Datenbank.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.check_interval = check_interval
+        self._connection = _connect(path)
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+        self._best = self._query_best()
+        self._data_version = self._query_data_version()
+        self._last_check = time.monotonic()
+        self._pending = queue.Queue()
+        self._writer = None
+
+    ### Schreiben ###
+
+    def submit(self, profile, score, duration, seed=None, replay=None, created_at=None):
+        """
+        Reiht einen Lauf zum Speichern ein. Kehrt sofort zurück.
+
+        Args:
+            profile (str): Der Name des Profils.
+            score (int): Der Punktestand.
+            duration (int): Die Dauer in Ticks.
+            seed (int, optional): Der Seed des Laufs.
+            replay (bytes, optional): Das serialisierte Replay des Laufs.
+            created_at (float, optional): Zeitstempel, Standard ist jetzt.
+        """
+        if score > self._best:
+            self._best = score
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="leaderboard-writer", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
+        self._pending.put((profile, score, duration, seed, replay,
+                           created_at if created_at is not None else time.time()))
+
+    def flush(self):
+        """Wartet, bis alle eingereihten Läufe gespeichert sind."""
+        if self._writer is not None:
+            self._pending.join()
+
+    def close(self):
+        """Speichert ausstehende Läufe und beendet den Schreib-Thread."""
+        if self._writer is not None:
+            self._pending.put(None)
+            self._writer.join()
+            self._writer = None
+
+    def _write_loop(self):
+        connection = _connect(self.path)
+        profile_ids = {}
+        running = True
+        while running:
+            batch = [self._pending.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while batch[-1] is not None and len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._pending.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                running = False
+            runs = [run for run in batch if run is not None]
+            try:
+                if runs:
+                    self._insert(connection, profile_ids, runs)
+            except sqlite3.Error as e:
+                print(f"Fehler beim Speichern der Bestenliste: {e}")
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+        connection.close()
+
+    @staticmethod
+    def _insert(connection, profile_ids, runs):
+        with connection:
+            for name in {run[0] for run in runs} - profile_ids.keys():
+                connection.execute("INSERT OR IGNORE INTO profiles (name) VALUES (?)", (name,))
+                profile_ids[name] = connection.execute(
+                    "SELECT id FROM profiles WHERE name = ?", (name,)).fetchone()[0]
+            scores = collections.Counter()
+            for profile, score, duration, seed, replay, created_at in runs:
+                cursor = connection.execute(
+                    "INSERT INTO runs (profile_id, score, duration, seed, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (profile_ids[profile], score, duration, seed, created_at))
+                if replay is not None:
+                    connection.execute("INSERT INTO replays (run_id, data) VALUES (?, ?)",
+                                       (cursor.lastrowid, replay))
+                scores[score] += 1
+            connection.executemany(
+                "INSERT INTO score_counts (score, count) VALUES (?, ?) "
+                "ON CONFLICT(score) DO UPDATE SET count = count + excluded.count",
+                scores.items())
+
+    ### Abfragen ###
+
+    def best(self):
+        """
+        Gibt den besten Punktestand über alle Profile zurück.
+
+        Gelesen wird nur, wenn seit der letzten Prüfung (höchstens alle ``check_interval``
+        Sekunden) eine andere Verbindung in die Datenbank geschrieben hat.
+
+        Returns:
+            int: Der beste Punktestand, 0 wenn noch kein Lauf gespeichert ist.
+        """
+        now = time.monotonic()
+        if now - self._last_check >= self.check_interval:
+            self._last_check = now
+            data_version = self._query_data_version()
+            if data_version != self._data_version:
+                self._data_version = data_version
+                best = self._query_best()
+                # Ein eingereichter, noch nicht gespeicherter Lauf geht vor
+                if self._pending.unfinished_tasks == 0 or best > self._best:
+                    self._best = best
+        return self._best
+
+    def _query_best(self):
+        return self._connection.execute("SELECT MAX(score) FROM runs").fetchone()[0] or 0
+
+    def _query_data_version(self):
+        return self._connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def profile_best(self, profile):
+        """
+        Gibt den besten Punktestand eines Profils zurück.
+
+        Args:
+            profile (str): Der Name des Profils.
+
+        Returns:
+            int: Der beste Punktestand, 0 wenn das Profil keine Läufe hat.
+        """
+        row = self._connection.execute(
+            "SELECT MAX(runs.score) FROM runs JOIN profiles ON profiles.id = runs.profile_id "
+            "WHERE profiles.name = ?", (profile,)).fetchone()
+        return row[0] or 0
+
+    def top(self, k=10, profile=None):
+        """
+        Gibt die besten Läufe zurück.
+
+        Args:
+            k (int): Die Anzahl der Läufe.
+            profile (str, optional): Nur Läufe dieses Profils.
+
+        Returns:
+            list: Die Läufe als ``LeaderboardEntry``, bester zuerst.
+        """
+        query = ("SELECT runs.id, profiles.name, runs.score, runs.duration, runs.seed, runs.created_at "
+                 "FROM runs JOIN profiles ON profiles.id = runs.profile_id ")
+        if profile is None:
+            rows = self._connection.execute(query + "ORDER BY runs.score DESC LIMIT ?", (k,))
+        else:
+            rows = self._connection.execute(
+                query + "WHERE profiles.name = ? ORDER BY runs.score DESC LIMIT ?", (profile, k))
+        return [LeaderboardEntry(*row) for row in rows]
+
+    def percentile_rank(self, score):
+        """
+        Gibt an, wie viel Prozent aller Läufe einen niedrigeren Punktestand haben.
+
+        Args:
+            score (int): Der Punktestand.
+
+        Returns:
+            float: Der Perzentilrang zwischen 0 und 100 (0, wenn es noch keine Läufe gibt).
+        """
+        below, total = self._connection.execute(
+            "SELECT COALESCE(SUM(CASE WHEN score < ? THEN count END), 0), COALESCE(SUM(count), 0) "
+            "FROM score_counts", (score,)).fetchone()
+        return 100.0 * below / total if total else 0.0
+
+    def count(self):
+        """
+        Returns:
+            int: Die Anzahl der gespeicherten Läufe.
+        """
+        return self._connection.execute("SELECT COALESCE(SUM(count), 0) FROM score_counts").fetchone()[0]
+
+    def replay(self, run_id):
+        """
+        Gibt das gespeicherte Replay eines Laufs zurück.
+
+        Args:
+            run_id (int): Die ID des Laufs.
+
+        Returns:
+            bytes or None: Das serialisierte Replay, falls vorhanden.
+        """
+        row = self._connection.execute("SELECT data FROM replays WHERE run_id = ?", (run_id,)).fetchone()
+        return row[0] if row else None
+
+    def replays(self, run_id=None):
+        """
+        Gibt die gespeicherten Replays mit dem Punktestand ihres Laufs zurück.
+
+        Args:
+            run_id (int, optional): Nur das Replay dieses Laufs.
+
+        Returns:
+            list: Tupel (ID des Laufs, Punktestand, serialisiertes Replay), nach ID sortiert.
+        """
+        query = "SELECT runs.id, runs.score, replays.data FROM replays JOIN runs ON runs.id = replays.run_id "
+        if run_id is None:
+            return self._connection.execute(query + "ORDER BY runs.id").fetchall()
+        return self._connection.execute(query + "WHERE runs.id = ?", (run_id,)).fetchall()
+
+    def import_legacy_highscore(self, path, profile="legacy"):
+        """
+        Übernimmt den Wert aus einer alten ``highscore.json`` als Lauf, falls die Bestenliste leer ist.
+
+        Args:
+            path (str): Pfad zur alten Highscore-Datei.
+            profile (str): Profil, dem der Wert zugeordnet wird.
+        """
+        if self._best or self.count():
+            return
+        try:
+            with open(path, "r") as file:
+                value = json.load(file).get("highscore", 0)
+        except (OSError, ValueError, AttributeError):
+            return
+        if value > 0:
+            self.submit(profile, value, 0)
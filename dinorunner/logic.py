@@ -1,10 +1,8 @@
 import pygame
-import random
-import json
-from .sfx import sound_manager
-from .gfx import SpriteSheet
-from .gui import UI
-import os
+from .gfx import AnimationAtlas
+from .assets import assets as shared_assets
+from . import simulation
+from .pool import ObstaclePool, OBSTACLE_KINDS
 
 class Player:
     """
@@ -24,11 +22,12 @@ class Player:
         walk_images (list): Liste der Bilder für die Gehen-Animation.
         jump_images (list): Liste der Bilder für die Springen-Animation.
         idle_images (list): Liste der Bilder für die Idle-Animation.
-        animation_timer (float): Timer zur Steuerung der Animationsgeschwindigkeit.
-        animation_speed (float): Geschwindigkeit, mit der die Animationen wechseln.
+        assets (AssetManager): Quelle der geteilten Bilder.
+        atlas (AnimationAtlas): Vorberechnete Frames in Anzeigegröße, je Blickrichtung.
+        animation_timer (float): Seit dem letzten Framewechsel vergangene Zeit in Sekunden.
         walk_frame_index (int): Der Index des aktuellen Gehen-Frames.
     """
-    def __init__(self, x, y, size, speed, gravity, ui, idle_image=None):
+    def __init__(self, x, y, size, speed, gravity, ui, idle_image=None, assets=None):
         """
                 Initialisiert den Spieler mit den angegebenen Werten.
 
@@ -40,8 +39,10 @@ class Player:
                     gravity (int): Die Schwerkraft des Spiels.
                     ui (UI): Das Benutzerinterface für den Zugriff auf Assets.
                     idle_image (Surface, optional): Ein Bild für die Idle-Animation. Standard ist None.
+                    assets (AssetManager, optional): Quelle der Bilder. Standard ist der gemeinsame AssetManager.
                 """
         self.ui = ui
+        self.assets = assets if assets is not None else shared_assets
         self.x = x
         self.y = y
         self.size = size
@@ -57,146 +58,129 @@ class Player:
         self.walk_images = []
         self.jump_images = []
         self.idle_images = []
+        self.atlas = None
         self.animation_timer = 0
-        self.animation_speed = 0.2  # Geschwindigkeit der Animation (kann angepasst werden)
         self.walk_frame_index = 0  # Anfangsindex für den Walk-Frame
         self.jump_frame_index = 0
         self.idle_frame_index = 0
         self.facing_right = True
+        self.frame_key = ('idle', 0, True)  # Zustand, Index und Blickrichtung des angezeigten Frames
 
         # Prüfen, ob die Assets existieren
         self.load_assets()
 
     def load_assets(self):
         """
-                Lädt die benötigten Bilddateien für die verschiedenen Zustände des Spielers
-                (Idle, Walk, Jump). Wenn die Bilder nicht gefunden werden, wird ein Platzhalter verwendet.
+                Holt die Animationsframes des Spielers (Idle, Walk, Jump) aus dem AssetManager.
+
+                Beim ersten Spieler werden die Sprite-Sheets geladen und der Atlas gebaut, jeder
+                weitere Spieler (z. B. nach einem Neustart) bekommt denselben Atlas ohne Plattenzugriff.
+                Wenn die Bilder nicht gefunden werden, wird ein Platzhalter verwendet.
 
                 Sets:
+                    atlas (AnimationAtlas): Alle Frames in Anzeigegröße, je Blickrichtung.
                     idle_images (list): Liste der Idle-Frames.
                     walk_images (list): Liste der Walk-Frames.
                     jump_images (list): Liste der Jump-Frames.
                 """
-        # Lade die Assets und überprüfe, ob sie existieren
-        idle_path = self.ui.get_ressources_path("assets/dino_idle.png")
-        walk_path = self.ui.get_ressources_path("assets/dino_walk.png")
-        jump_path = self.ui.get_ressources_path("assets/dino_jump.png")
-
-        # Überprüfen, ob die Dateien existieren und sie laden
-        if os.path.exists(idle_path):
-            sprite_sheet = SpriteSheet(idle_path, 32, 32)
-            self.idle_images = [pygame.transform.scale(frame, (self.size*2.5, self.size*2.5)) for frame in sprite_sheet.frames]
-            print(f"Idle Image loaded: {idle_path}")
-        else:
-            print(f"Idle Image not found: {idle_path}")
-
-        if os.path.exists(walk_path):
-            sprite_sheet = SpriteSheet(walk_path, 32, 32)
-            self.walk_images = [pygame.transform.scale(frame, (self.size*2.5, self.size*2.5)) for frame in sprite_sheet.frames]
-            print(f"Walk Images loaded: {walk_path}")
-        else:
-            print(f"Walk Image not found: {walk_path}")
-
-        if os.path.exists(jump_path):
-            sprite_sheet = SpriteSheet(jump_path, 32, 32)
-            self.jump_images = [pygame.transform.scale(frame, (self.size*2.5, self.size*2.5)) for frame in sprite_sheet.frames]
-            print(f"Jump Image loaded: {jump_path}")
-        else:
-            print(f"Jump Image not found: {jump_path}")
-
-        # Wenn keine Assets geladen wurden, ersetze das Bild durch ein Platzhalter-Rechteck
-        if not self.idle_images:
-            self.idle_images = [pygame.Surface((self.size, self.size))]  # Platzhalter für Idle
-            self.idle_images[0].fill((0, 255, 0))  # Grün für den Platzhalter
-            print("Using placeholder idle image (green rectangle)")
-
-        if not self.jump_images:
-            self.jump_images = [pygame.Surface((self.size, self.size))]  # Platzhalter für Jump
-            self.jump_images[0].fill((255, 0, 0))  # Rot für den Platzhalter
-            print("Using placeholder jump image (red rectangle)")
-
-        if not self.walk_images:
-            self.walk_images = [pygame.Surface((self.size, self.size))]  # Platzhalter für Walk
-            self.walk_images[0].fill((0, 0, 255))  # Blau für den Platzhalter
-            print("Using placeholder walk image (blue rectangle)")
-
-        # Falls alles korrekt geladen wurde, setze das Standardbild auf Idle
-        if self.idle_images:
-            self.image = self.idle_images[0]  # Standard-Idle-Sprite (Erster Frame)
-
-    def move(self, keys, floor_top, width):
-        """
-        Bewegt den Spieler basierend auf den Benutzereingaben.
+        self.atlas = self.assets.get(self._atlas_key(), self._build_atlas)
+        self.idle_images = self.atlas.frames[('idle', True)]
+        self.walk_images = self.atlas.frames[('walk', True)]
+        self.jump_images = self.atlas.frames[('jump', True)]
 
-        Args:
-            keys (list): Eine Liste der gedrückten Tasten (z.B. pygame.K_a, pygame.K_d).
-            floor_top (int): Die Y-Position des Bodens, den der Spieler nicht überschreiten darf.
-            width (int): Die Breite des Bildschirms, um Kollision mit dem rechten Rand zu verhindern.
+        # Standardbild ist der erste Idle-Frame
+        self.image = self.idle_images[0]
+
+    def release_assets(self):
         """
-        if keys[pygame.K_a] and self.x>0:
-            self.x_change = -self.speed
-            self.state = 'walk'  # Wenn sich der Spieler nach links bewegt, wird der Walk-Zustand aktiviert
-        elif keys[pygame.K_d] and self.x<=width:
-            self.x_change = self.speed
-            self.state = 'walk'  # Wenn sich der Spieler nach rechts bewegt, wird der Walk-Zustand aktiviert
-        else:
-            self.x_change = 0
-            if self.on_ground:
-                self.state = 'idle'  # Wenn der Spieler still steht, wird der Idle-Zustand aktiviert
-
-        if keys[pygame.K_SPACE] and self.on_ground:
-            self.y_change = 18  # Sprungkraft
-            sound_manager.play_jump_sound()
-            self.on_ground = False
-            self.state = 'jump'  # Wenn der Spieler springt, wird der Jump-Zustand aktiviert
-
-        self.x += self.x_change
-        self.y -= self.y_change
-        self.y_change -= self.gravity
-
-        if self.y >= floor_top - self.size:
-            self.y = floor_top - self.size
-            self.y_change = 0
-            self.on_ground = True
-
-    def get_rect(self):
+        Gibt die Referenz auf den Atlas an den AssetManager zurück (z. B. bevor der Spieler ersetzt wird).
         """
-        Gibt das Rechteck des Spielers zurück, das für Kollisionserkennung verwendet wird.
+        if self.atlas is not None:
+            self.assets.release(self._atlas_key())
 
-        Returns:
-            pygame.Rect: Das Rechteck des Spielers.
+    def _atlas_key(self):
+        return ("player_atlas", self.size)
+
+    def _build_atlas(self):
         """
-        return pygame.Rect(self.x, self.y, self.size, self.size)
+        Lädt die Sprite-Sheets und baut daraus den Animations-Atlas.
 
-    def update_animation(self):
-        # Erhöhe den Animationstimer immer, unabhängig vom Zustand
-        self.animation_timer += self.animation_speed
-        if self.animation_timer >= 1:
-            self.animation_timer = 0  # Timer zurücksetzen
+        Returns:
+            AnimationAtlas: Der Atlas mit allen Frames in Anzeigegröße.
+        """
+        frames = {}
+        placeholder_colors = {'idle': (0, 255, 0), 'walk': (0, 0, 255), 'jump': (255, 0, 0)}
+        for state in ('idle', 'walk', 'jump'):
+            name = f"assets/dino_{state}.png"
+            frames[state] = list(self.assets.sheet(name, 32, 32))
+            self.assets.release(("sheet", name, 32, 32))  # Der Atlas hält eigene, skalierte Kopien
+
+            # Wenn keine Assets geladen wurden, ersetze das Bild durch ein Platzhalter-Rechteck
+            if frames[state]:
+                print(f"{state.capitalize()} Images loaded: {name}")
+            else:
+                print(f"{state.capitalize()} Image not found: {name}")
+                placeholder = pygame.Surface((self.size, self.size))
+                placeholder.fill(placeholder_colors[state])
+                frames[state] = [placeholder]
+                print(f"Using placeholder {state} image")
 
-            # Wähle die richtige Animationsframe basierend auf dem Zustand
-            if self.state == 'walk' and self.walk_images:
-                self.walk_frame_index = (self.walk_frame_index + 1) % len(self.walk_images)
-                new_image = self.walk_images[self.walk_frame_index]
+        # Alle Frames einmal in Anzeigegröße (und gespiegelt) vorberechnen,
+        # die Animation wählt danach nur noch einen Index
+        return AnimationAtlas(frames, (self.size * 2, self.size * 2))
 
-            elif self.state == 'jump' and self.jump_images:
-                self.jump_frame_index = (self.jump_frame_index + 1) % len(self.jump_images)
-                new_image = self.jump_images[self.jump_frame_index]
+    def sync(self, game_state, previous=None, alpha=1.0):
+        """
+        Übernimmt Position und Bewegungszustand aus dem Simulationszustand.
 
-            elif self.state == 'idle' and self.idle_images:
-                self.idle_frame_index = (self.idle_frame_index + 1) % len(self.idle_images)
-                new_image = self.idle_images[self.idle_frame_index]
+        Der Spieler dient dann nur noch der Darstellung; die Regeln rechnet ``simulation.step``.
+        Mit ``previous`` wird die Position zwischen den letzten beiden Ticks interpoliert,
+        damit die Bewegung auch bei Bildraten ungleich dem Simulationstakt flüssig bleibt.
+        Der Animationsframe folgt aus dem Tick, wie beim pixelgenauen Kollisionstest.
 
-            else:
-                new_image = None  # Falls kein Bild da ist
+        Args:
+            game_state (simulation.GameState): Der aktuelle Zustand der Simulation.
+            previous (simulation.GameState, optional): Der Zustand einen Tick davor.
+            alpha (float): Anteil (0 bis 1) zwischen ``previous`` und ``game_state``.
+        """
+        if previous is None:
+            previous = game_state
+        self.x = _lerp(previous.x, game_state.x, alpha)
+        self.y = _lerp(previous.y, game_state.y, alpha)
+        self.x_change = game_state.x_change
+        self.y_change = game_state.y_change
+        self.on_ground = game_state.on_ground
+        self.state = game_state.pose
+        self.facing_right = game_state.facing_right
+        self.frame_key = (self.state, game_state.frame // simulation.ANIMATION_TICKS, self.facing_right)
+        self.image = self.atlas.frame(*self.frame_key)
+
+    def update_animation(self, dt=None):
+        """
+        Schaltet die Animation zeitbasiert weiter (außerhalb eines Laufs, im Lauf bestimmt ``sync`` den Frame).
 
-            # Falls keine Animationen geladen sind, setze eine Standardfarbe
-            if new_image is None:
-                new_image = pygame.Surface((self.size, self.size))
-                new_image.fill((255, 255, 255))
+        Die Frames kommen fertig skaliert und gespiegelt aus dem Atlas, hier wird nur ein Index gewählt.
 
-            # Skaliere das Bild
-            new_image = pygame.transform.scale(new_image, (self.size * 2, self.size * 2))
+        Args:
+            dt (float, optional): Vergangene Zeit seit dem letzten Aufruf in Sekunden.
+                Ohne Angabe wird ein Frame bei 60 FPS angenommen.
+        """
+        # Erhöhe den Animationstimer immer, unabhängig vom Zustand
+        self.animation_timer += dt if dt is not None else 1 / 60
+        if self.animation_timer + 1e-9 >= self.atlas.frame_duration:
+            # Bei großen Zeitsprüngen nicht mehrere Frames nachholen
+            self.animation_timer = min(self.animation_timer - self.atlas.frame_duration, self.atlas.frame_duration)
+
+            # Wähle den nächsten Frame basierend auf dem Zustand
+            if self.state == 'walk':
+                self.walk_frame_index = (self.walk_frame_index + 1) % self.atlas.frame_count('walk')
+                index = self.walk_frame_index
+            elif self.state == 'jump':
+                self.jump_frame_index = (self.jump_frame_index + 1) % self.atlas.frame_count('jump')
+                index = self.jump_frame_index
+            else:
+                self.idle_frame_index = (self.idle_frame_index + 1) % self.atlas.frame_count('idle')
+                index = self.idle_frame_index
 
             # Überprüfe, ob sich die Blickrichtung geändert hat
             if self.x_change > 0:
@@ -204,12 +188,8 @@ class Player:
             elif self.x_change < 0:
                 self.facing_right = False
 
-            # Falls der Charakter nach links schaut, flippe das Bild **nur einmal**
-            if not self.facing_right:
-                new_image = pygame.transform.flip(new_image, True, False)
-
-            # Setze das finale Bild
-            self.image = new_image
+            self.frame_key = (self.state if self.state in ('walk', 'jump') else 'idle', index, self.facing_right)
+            self.image = self.atlas.frame(*self.frame_key)
 
     def draw(self, screen):
         """
@@ -217,22 +197,33 @@ class Player:
 
         Args:
             screen (pygame.Surface): Das Pygame-Oberflächenobjekt, auf dem der Spieler gezeichnet wird.
+
+        Returns:
+            pygame.Rect: Der Bereich, in den gezeichnet wurde.
         """
-        screen.blit(self.image, (self.x, self.y-self.size))
+        return screen.blit(self.image, (self.x, self.y-self.size))
 
 
 class ObstacleManager:
     """
-    Verwaltet die Hindernisse im Spiel, einschließlich deren Bewegung und Kollisionserkennung.
+    Stellt die Hindernisse der Simulation dar.
+
+    Bewegung, Respawn und Kollision rechnet ``simulation.step``; der Manager hält die Hindernisse
+    zum Zeichnen in einem ``ObstaclePool`` (Struct-of-Arrays). Die Hindernisse der Simulation
+    belegen feste Plätze, deren Positionen ``sync`` nur überschreibt. Von den Bildern nutzt die
+    Kollision nur die Maske (``PixelCollider.for_objects``). Zwischen zwei Läufen wird der
+    Manager mit ``reset`` wiederverwendet statt neu erstellt.
 
     Attributes:
-        obstacles (list): Die Positionen der Hindernisse auf der x-Achse.
-        obstacle_images (list): Die Bilder der Hindernisse.
+        pool (ObstaclePool): Positionen, Arten und Größen der Hindernisse.
+        obstacle_images (list): Die Bilder der Hindernisse, ein Eintrag je Art aus ``OBSTACLE_KINDS``.
+        obstacle_masks (list): Die Kollisionsmasken der Bilder, parallel zu ``obstacle_images``.
         width (int): Die Breite des Bildschirms.
         player_size (int): Die Größe des Spielers, um Hindernisse entsprechend zu skalieren.
         speed (int): Die Geschwindigkeit der Hindernisse.
+        assets (AssetManager): Quelle der geteilten Bilder.
     """
-    def __init__(self, width, player_size, speed, ui):
+    def __init__(self, width, player_size, speed, ui, assets=None, capacity=256):
         """
         Initialisiert den Hindernis-Manager.
 
@@ -241,74 +232,89 @@ class ObstacleManager:
             player_size (int): Die Größe des Spielers, die auch die Größe der Hindernisse bestimmt.
             speed (int): Die Geschwindigkeit der Hindernisse.
             ui (UI): Das Benutzerinterface für den Zugriff auf die Hindernis-Bilder.
+            assets (AssetManager, optional): Quelle der Bilder. Standard ist der gemeinsame AssetManager.
+            capacity (int): Maximale Anzahl gleichzeitiger Hindernisse.
         """
         self.ui = ui
-        self.obstacles = [width - 150, width, width + 150]  # Anfangsposition der Hindernisse
+        self.assets = assets if assets is not None else shared_assets
         self.width = width
         self.player_size = player_size
         self.speed = speed
+        self.pool = ObstaclePool(capacity)
         self.obstacle_images = []  # Liste für Hindernisbilder
+        self.obstacle_masks = []
+        self._sim_slots = []
         self.load_obstacle_assets()  # Lädt die Hindernisbilder
+        self.reset()
 
-    def load_obstacle_assets(self):
+    def reset(self, start_positions=None):
         """
-        Lädt das Hindernisbild und prüft, ob es vorhanden ist.
+        Leert den Pool und legt die Hindernisse für einen neuen Lauf an.
 
-        Falls das Bild nicht gefunden wird, wird ein Platzhalter-Bild verwendet.
-        """
-        # Lade die Hindernisbilder
-        obstacle_path = self.ui.get_ressources_path("assets/meteor_1.png")  # Pfad zu deinem Hindernisbilder
-
-        if os.path.exists(obstacle_path):
-            obstacle_image = pygame.image.load(obstacle_path)
-            obstacle_image = pygame.transform.scale(obstacle_image, (self.player_size, self.player_size))
-            self.obstacle_images.append(obstacle_image)
-            print(f"Obstacle Image loaded: {obstacle_path}")
-        else:
-            print(f"Obstacle Image not found: {obstacle_path}")
-            # Falls das Bild nicht gefunden wird, erstelle ein Platzhalter-Rechteck
-            placeholder_image = pygame.Surface((self.player_size, self.player_size))
-            placeholder_image.fill((255, 0, 0))  # Rot als Platzhalter
-            self.obstacle_images.append(placeholder_image)
-            print("Using placeholder obstacle image (red rectangle)")
-
-    def move_obstacles(self, active):
-        """
-        Bewegt die Hindernisse auf dem Bildschirm und lässt sie respawnen, wenn sie den Bildschirm verlassen.
+        Die Positionen (und das Respawnen) bestimmt allein die Simulation mit ihrem Seed.
 
         Args:
-            active (bool): Gibt an, ob die Hindernisse aktiv bewegt werden sollen.
+            start_positions (iterable, optional): x-Positionen der Hindernisse der Simulation.
+                Standard sind die Anfangspositionen aus ``simulation.new_game``.
+        """
+        if start_positions is None:
+            start_positions = (self.width - 150, self.width, self.width + 150)  # Anfangsposition der Hindernisse
+        self.pool.clear()
+        self._sim_slots = [self._spawn(0, obs_x) for obs_x in start_positions]
 
-        Returns:
-            int: Die Anzahl der Hindernisse, die den Bildschirm verlassen haben (Punkte).
+    def _spawn(self, kind, x):
+        """Belegt einen Platz im Pool für ein Hindernis der angegebenen Art, auf dem Boden liegend."""
+        width, height = OBSTACLE_KINDS[kind].size(self.player_size)
+        return self.pool.spawn(kind, x, 500 - height, width, height)
+
+    def load_obstacle_assets(self):
         """
-        points = 0  # Zähler für Punkte
-        if active:
-            for i in range(len(self.obstacles)):
-                self.obstacles[i] -= self.speed  # Bewege das Hindernis nach links
+        Holt die Bilder aller Hindernisarten aus dem AssetManager (geladen und skaliert wird nur beim ersten Mal).
 
-                # Wenn das Hindernis den linken Rand verlässt
-                if self.obstacles[i] < -self.player_size:
-                    self.obstacles[i] = random.randint(self.width + self.player_size, self.width + self.player_size * 3)
-                    points += 1  # Erhöhe den Punktestand um 1
+        Falls ein Bild nicht gefunden wird, wird ein Platzhalter-Bild verwendet.
+        """
+        self.obstacle_images = []
+        for kind in OBSTACLE_KINDS:
+            size = kind.size(self.player_size)
+            obstacle_image = self.assets.image(kind.sprite, size=size)
 
-        return points  # Punkte zurückgeben
+            if obstacle_image is not None:
+                self.obstacle_images.append(obstacle_image)
+            else:
+                print(f"Obstacle Image not found: {kind.sprite}")
+                # Falls das Bild nicht gefunden wird, erstelle ein Platzhalter-Rechteck
+                placeholder_image = pygame.Surface(size)
+                placeholder_image.fill((255, 0, 0))  # Rot als Platzhalter
+                self.obstacle_images.append(placeholder_image)
+                print("Using placeholder obstacle image (red rectangle)")
+        # Masken einmal pro Bild, nicht pro Frame
+        self.obstacle_masks = [pygame.mask.from_surface(image) for image in self.obstacle_images]
+
+    def release_assets(self):
+        """
+        Gibt die Referenzen auf die Hindernisbilder an den AssetManager zurück.
+        """
+        for kind in OBSTACLE_KINDS:
+            self.assets.release(self.assets.image_key(kind.sprite, size=kind.size(self.player_size)))
 
-    def check_collision(self, player_rect):
+    def sync(self, game_state, previous=None, alpha=1.0):
         """
-        Überprüft, ob der Spieler mit einem Hindernis kollidiert.
+        Übernimmt die Hindernispositionen und das Tempo aus dem Simulationszustand.
 
         Args:
-            player_rect (pygame.Rect): Das Rechteck des Spielers, das für die Kollisionserkennung verwendet wird.
-
-        Returns:
-            bool: True, wenn eine Kollision erkannt wurde, ansonsten False.
+            game_state (simulation.GameState): Der aktuelle Zustand der Simulation.
+            previous (simulation.GameState, optional): Der Zustand einen Tick davor, zum Interpolieren.
+            alpha (float): Anteil (0 bis 1) zwischen ``previous`` und ``game_state``.
         """
-        for obs_x in self.obstacles:
-            obstacle_rect = pygame.Rect(obs_x, 500 - self.player_size, self.player_size, self.player_size)
-            if player_rect.colliderect(obstacle_rect):
-                return True
-        return False
+        if len(self._sim_slots) != len(game_state.obstacles):
+            self.reset(game_state.obstacles)
+        x = self.pool.x
+        # Die Simulation hält die Hindernisse sortiert, ein Index steht also nicht für dasselbe
+        # Hindernis in beiden Zuständen; interpoliert wird über die im Tick gescrollte Strecke
+        behind = previous.obstacle_speed * (1.0 - alpha) if previous is not None else 0.0
+        for slot, new in zip(self._sim_slots, game_state.obstacles):
+            x[slot] = new + behind
+        self.speed = game_state.obstacle_speed
 
     def draw(self, screen):
         """
@@ -316,41 +322,75 @@ class ObstacleManager:
 
         Args:
             screen (pygame.Surface): Das Pygame-Oberflächenobjekt, auf dem die Hindernisse gezeichnet werden.
-        """
-        for obs_x in self.obstacles:
-            obstacle_rect = pygame.Rect(obs_x, 500 - self.player_size, self.player_size, self.player_size)
-            # Zeichne das Hindernisbild
-            screen.blit(self.obstacle_images[0], obstacle_rect)  # Wir nehmen hier das erste Hindernisbild
 
+        Returns:
+            list: Die Bereiche, in die gezeichnet wurde.
+        """
+        pool = self.pool
+        images = self.obstacle_images
+        return [screen.blit(images[pool.kind[slot]], (pool.x[slot], pool.y[slot])) for slot in pool.slots()]
 
-### Highscore-Funktionen ###
 
-def load_highscore(ui):
+class PixelCollider:
     """
-    Lädt den Highscore aus einer JSON-Datei.
+    Pixelgenauer Kollisionstest für die Simulation (``narrowphase`` von ``simulation.step``).
 
-    Args:
-        ui (UI): Das Benutzerinterface für den Zugriff auf die Highscore-Datei.
+    Verglichen wird die vorberechnete Maske des Frames, den ``Player.sync`` im selben Tick
+    anzeigt: Der Frame-Index folgt aus dem Tick (``simulation.ANIMATION_TICKS``), damit ein
+    Lauf headless bitgenau nachsimuliert werden kann.
 
-    Returns:
-        int: Der gespeicherte Highscore-Wert. Wenn keine Datei existiert oder ein Fehler auftritt, wird 0 zurückgegeben.
-    """
-    try:
-        highscore_path = ui.get_ressources_path("highscore.json")
-        with open(highscore_path, "r") as file:
-            data = json.load(file)
-            return data.get("highscore", 0)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return 0  # Falls die Datei nicht existiert oder fehlerhaft ist, setze Highscore auf 0.
-
-def save_highscore(highscore_value, ui):
+    Attributes:
+        masks (dict): (Zustand, nach rechts schauend) -> Liste der Masken je Frame (aus dem Atlas).
+        obstacle_mask (pygame.mask.Mask): Die Maske des Hindernisbilds.
+        tests (int): Anzahl der Maskenvergleiche (nur bei überlappenden Rechtecken).
     """
-    Speichert den aktuellen Highscore in einer JSON-Datei.
+    def __init__(self, atlas, obstacle_mask):
+        """
+        Übernimmt die Masken je Frame aus dem Atlas.
 
-    Args:
-        ui (UI): Das Benutzerinterface für den Zugriff auf die Highscore-Datei.
-        score (int): Der aktuelle Highscore, der gespeichert werden soll.
-    """
-    highscore_path = ui.get_ressources_path("highscore.json")
-    with open(highscore_path, "w") as file:
-        json.dump({"highscore": highscore_value}, file)
\ No newline at end of file
+        Args:
+            atlas (AnimationAtlas): Der Atlas des Spielers (mit Masken je Frame).
+            obstacle_mask (pygame.mask.Mask): Die Maske des Hindernisbilds.
+        """
+        self.masks = atlas.masks
+        self.obstacle_mask = obstacle_mask
+        self.tests = 0
+
+    @classmethod
+    def for_objects(cls, player, obstacles):
+        """
+        Erstellt den Test aus Spieler und Hindernis-Manager.
+
+        Args:
+            player (Player): Der Spieler (liefert den Atlas).
+            obstacles (ObstacleManager): Der Hindernis-Manager in Simulationsgröße.
+
+        Returns:
+            PixelCollider: Der Kollisionstest.
+        """
+        return cls(player.atlas, obstacles.obstacle_masks[0])
+
+    def __call__(self, pose, dx, dy, facing_right=True, frame=0):
+        """
+        Vergleicht die Masken von Sprite und Hindernis.
+
+        Args:
+            pose (str): Der Animationszustand des Spielers.
+            dx (int): x-Position des Hindernisses relativ zum Sprite.
+            dy (int): y-Position des Hindernisses relativ zum Sprite.
+            facing_right (bool): Die Blickrichtung des Spielers.
+            frame (int): Der Tick, aus dem der Animationsframe folgt.
+
+        Returns:
+            bool: True, wenn sich gesetzte Pixel überschneiden.
+        """
+        self.tests += 1
+        masks = self.masks.get((pose, facing_right))
+        if masks is None:
+            masks = self.masks[('idle', facing_right)]
+        mask = masks[frame // simulation.ANIMATION_TICKS % len(masks)]
+        return mask.overlap(self.obstacle_mask, (dx, dy)) is not None
+
+
+def _lerp(start, end, alpha):
+    return start + (end - start) * alpha
@@ -0,0 +1,265 @@
+"""
+Musik aus vorab dekodierten Tracks mit Überblenden.
+
+``pygame.mixer.music`` öffnet bei jedem Trackwechsel die Datei neu, das kostet im
+Frame des Wechsels (z. B. beim Tod des Spielers) mehrere Millisekunden. Der
+``MusicPlayer`` dekodiert die Tracks stattdessen einmal in einem Hintergrund-Thread
+zu ``pygame.mixer.Sound`` und spielt sie auf zwei reservierten Kanälen. Ein Wechsel
+ist dann nur noch ``Channel.play`` mit Einblenden auf dem einen und ``fadeout`` auf
+dem anderen Kanal – beides blendet der Mixer selbst, ohne die Hauptschleife zu blockieren.
+
+Ist ein Track beim Wechsel noch nicht dekodiert, startet ihn der Lade-Thread, sobald
+er fertig ist. Die Zeit vom Aufruf bis zum Start wird als Wechsel-Latenz gemessen.
+
+Dekodiert SDL im Spielprozess, hält es dabei die Mixer-Sperre; jedes ``Channel.play`` im
+Hauptthread wartet so lange (bei den Tracks des Spiels etwa eine Sekunde). Der Lade-Thread
+lässt die Dateien deshalb in einem eigenen Prozess mit stummem Mixer zu rohem PCM dekodieren
+und baut daraus nur noch den ``Sound`` (ein Kopieren von etwa 30 ms, einmal pro Track und
+meist noch im Menü). Lässt sich kein Prozess starten, wird wie bisher im Lade-Thread dekodiert.
+
+Dekodierte Tracks liegen als PCM im Speicher (bei 44,1 kHz Stereo etwa 10 MB pro Minute).
+"""
+import collections
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pygame
+
+# Kanäle 0 und 1 sind für die Musik reserviert (``SoundManager.init`` reserviert sie beim Mixer)
+MUSIC_CHANNELS = (0, 1)
+
+
+def _init_decoder(mixer_format):
+    """Initialisiert den Dekodier-Prozess mit einem Mixer ohne Audiogerät im Format des Spiels."""
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pygame.mixer.init(*mixer_format)
+
+
+def _decode(path):
+    """Dekodiert eine Datei im Dekodier-Prozess und gibt das rohe PCM zurück."""
+    return pygame.mixer.Sound(path).get_raw()
+
+
+class MusicPlayer:
+    """
+    Spielt vorab dekodierte Musik auf zwei Kanälen und blendet zwischen ihnen über.
+
+    Attributes:
+        resolve (callable): Wandelt einen Tracknamen in einen Dateipfad um.
+        crossfade_ms (int): Standarddauer des Überblendens in Millisekunden.
+        volume (float): Die Lautstärke der Musik.
+        current (str or None): Der laufende oder angeforderte Track.
+        paused (bool): Ob die Musik pausiert ist.
+        switch_latencies (collections.deque): Die letzten Wechsel-Latenzen in Millisekunden.
+    """
+    def __init__(self, resolve, crossfade_ms=400):
+        """
+        Initialisiert den Player. Der Mixer muss beim ersten Abspielen initialisiert sein.
+
+        Args:
+            resolve (callable): Funktion Trackname -> Dateipfad.
+            crossfade_ms (int): Standarddauer des Überblendens in Millisekunden.
+        """
+        self.resolve = resolve
+        self.crossfade_ms = crossfade_ms
+        self.volume = 0.5
+        self.current = None
+        self.paused = False
+        self.switch_latencies = collections.deque(maxlen=64)
+        self._tracks = {}
+        self._requested = set()
+        self._pending = None
+        # ``_lock`` schützt Tracks und ausstehenden Wechsel, ``_switch`` die Kanäle.
+        # Wer beide braucht, nimmt zuerst ``_switch``.
+        self._lock = threading.Lock()
+        self._switch = threading.Lock()
+        self._loads = queue.Queue()
+        self._loader = None
+        self._decoder = None
+        self._channels = None
+        self._active = 0
+
+    ### Laden ###
+
+    def preload(self, names):
+        """
+        Reiht Tracks zum Dekodieren im Hintergrund ein. Kehrt sofort zurück.
+
+        Args:
+            names (list): Die Tracknamen.
+        """
+        for name in names:
+            with self._lock:
+                if name in self._requested:
+                    continue
+                self._requested.add(name)
+            self._loads.put(name)
+        if self._loader is None:
+            self._loader = threading.Thread(target=self._load_loop, name="music-loader", daemon=True)
+            self._loader.start()
+
+    def is_loaded(self, name):
+        """
+        Returns:
+            bool: True, wenn der Track dekodiert bereitliegt.
+        """
+        return name in self._tracks
+
+    def _load_loop(self):
+        while True:
+            name = self._loads.get()
+            try:
+                sound = self._decode(name)
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Fehler beim Laden von {name}: {e}")
+                sound = None
+            with self._lock:
+                self._tracks[name] = sound
+                # Wurde der Track schon angefordert, startet er jetzt
+                request = None
+                if self._pending is not None and self._pending[0] == name:
+                    request, self._pending = self._pending, None
+            if request is not None:
+                with self._switch:
+                    self._start(*request)
+            if self._loads.empty():
+                self._close_decoder()
+
+    def _decode(self, name):
+        path = self.resolve(name)
+        if self._decoder is not False:
+            try:
+                if self._decoder is None:
+                    self._decoder = ProcessPoolExecutor(
+                        1, mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_decoder, initargs=(pygame.mixer.get_init(),))
+                return pygame.mixer.Sound(buffer=self._decoder.submit(_decode, path).result())
+            except (OSError, RuntimeError, BrokenProcessPool) as e:
+                print(f"Dekodier-Prozess nicht verfügbar, dekodiere im Spielprozess: {e}")
+                self._close_decoder()
+                self._decoder = False
+        return pygame.mixer.Sound(path)
+
+    def _close_decoder(self):
+        if self._decoder:
+            self._decoder.shutdown(wait=False)
+            self._decoder = None
+
+    ### Abspielen ###
+
+    def play(self, name, volume=None, fade_ms=None):
+        """
+        Wechselt zu einem Track und blendet über. Blockiert nie.
+
+        Args:
+            name (str): Der Trackname.
+            volume (float, optional): Neue Lautstärke der Musik.
+            fade_ms (int, optional): Dauer des Überblendens, Standard ist ``crossfade_ms``.
+        """
+        if volume is not None:
+            self.volume = volume
+        fade_ms = self.crossfade_ms if fade_ms is None else fade_ms
+        request = (name, fade_ms, time.perf_counter())
+        with self._switch:
+            with self._lock:
+                self.current = name
+                self.paused = False
+                loaded = name in self._tracks
+                self._pending = None if loaded else request
+            if loaded:
+                self._start(*request)
+                return
+        self.preload([name])
+
+    def _start(self, name, fade_ms, requested_at):
+        # Nur mit ``_switch`` aufrufen; ein inzwischen überholter Wechsel startet nicht mehr
+        sound = self._tracks.get(name)
+        if sound is None or name != self.current:
+            return
+        channels = self._get_channels()
+        previous = channels[self._active]
+        self._active = 1 - self._active
+        channel = channels[self._active]
+        channel.set_volume(self.volume)
+        channel.play(sound, loops=-1, fade_ms=fade_ms)
+        if previous.get_busy():
+            if fade_ms:
+                previous.fadeout(fade_ms)
+            else:
+                previous.stop()
+        self.switch_latencies.append((time.perf_counter() - requested_at) * 1000.0)
+
+    def _get_channels(self):
+        if self._channels is None:
+            self._channels = [pygame.mixer.Channel(index) for index in MUSIC_CHANNELS]
+        return self._channels
+
+    def stop(self, fade_ms=0):
+        """
+        Stoppt die Musik.
+
+        Args:
+            fade_ms (int): Ausblenden in Millisekunden, 0 stoppt sofort.
+        """
+        with self._switch:
+            with self._lock:
+                self._pending = None
+            self.paused = False
+            if self._channels is None:
+                return
+            for channel in self._channels:
+                if fade_ms:
+                    channel.fadeout(fade_ms)
+                else:
+                    channel.stop()
+
+    def busy(self):
+        """
+        Returns:
+            bool: True, wenn Musik läuft, pausiert ist oder auf das Dekodieren wartet.
+        """
+        if self._pending is not None or self.paused:
+            return True
+        return self._channels is not None and self._channels[self._active].get_busy()
+
+    def set_volume(self, volume):
+        """
+        Setzt die Lautstärke der laufenden Musik.
+
+        Args:
+            volume (float): Die Lautstärke (0.0 – 1.0).
+        """
+        self.volume = volume
+        if self._channels is not None:
+            self._channels[self._active].set_volume(volume)
+
+    def pause(self):
+        """Pausiert die Musik."""
+        if self._channels is not None and self._channels[self._active].get_busy():
+            self._channels[self._active].pause()
+            self.paused = True
+
+    def resume(self):
+        """Setzt die pausierte Musik fort."""
+        if self.paused and self._channels is not None:
+            self._channels[self._active].unpause()
+        self.paused = False
+
+    def stats(self):
+        """
+        Returns:
+            dict: Dekodierte Tracks, ob ein Wechsel aussteht, sowie letzte und maximale
+            Wechsel-Latenz in Millisekunden.
+        """
+        latencies = list(self.switch_latencies)
+        return {
+            "loaded": sorted(name for name, sound in self._tracks.items() if sound is not None),
+            "pending": self._pending[0] if self._pending is not None else None,
+            "last_switch_ms": latencies[-1] if latencies else None,
+            "max_switch_ms": max(latencies) if latencies else None,
+        }
@@ -0,0 +1,283 @@
+"""
+Vorberechnetes Asset-Pack.
+
+Beim Start kosten das Dekodieren der PNG/JPG-Dateien und das Skalieren auf
+Bildschirmgröße die meiste Ladezeit. Ein Bake-Schritt legt deshalb alle Bilder
+bereits skaliert als Pixelpuffer (``BGRA``, das Format von ``convert_alpha``) in
+einer Datei ab. Zur Laufzeit wird die Datei per ``mmap`` eingeblendet und jede
+Surface mit ``pygame.image.frombuffer`` direkt auf den Puffer gelegt – ohne
+Dekodieren, ohne Skalieren und ohne Kopie.
+
+Das Manifest speichert zu jeder Quelldatei Größe, Änderungszeit und SHA-256.
+Hat sich eine Quelldatei geändert, werden ihre Einträge ignoriert und das Bild wie
+gewohnt geladen, bis das Pack neu erstellt wird. Fehlt die Quelldatei (z. B. in
+einer PyInstaller-exe, die nur das Pack enthält), gilt das Pack als aktuell.
+
+Aufruf zum Erstellen::
+
+    python -m dinorunner.pack [--output datei.pack]
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+import pygame
+
+from .assets import get_ressources_path
+
+MAGIC = b"DRPK"
+VERSION = 1
+PIXEL_FORMAT = "BGRA"
+DEFAULT_PATH = "assets.pack"
+# Magic, Version, Länge des Manifests
+_HEADER = struct.Struct("<4sB3xI")
+# Pixeldaten beginnen auf 64-Byte-Grenzen
+_ALIGN = 64
+
+
+class PackError(ValueError):
+    """Wird ausgelöst, wenn eine Pack-Datei nicht gelesen werden kann."""
+
+
+def file_hash(path):
+    """
+    Berechnet den SHA-256 einer Datei.
+
+    Args:
+        path (str): Der Dateipfad.
+
+    Returns:
+        str: Der Hash als Hex-String.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _source_info(path):
+    stat = os.stat(path)
+    return {"sha256": file_hash(path), "bytes": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def default_recipes(screen_size=(800, 600), player_size=20):
+    """
+    Gibt die Bilder zurück, die das Spiel in diesen Größen lädt.
+
+    Args:
+        screen_size (tuple): Die Fenstergröße.
+        player_size (int): Die Größe des Spielers (bestimmt die Größe der Hindernisse).
+
+    Returns:
+        list: Einträge (Ressourcenname, Größenfunktion, Alphakanal). Die Größenfunktion
+        bekommt die Originalgröße und gibt die Zielgröße zurück (None = unskaliert).
+    """
+    from .gui import UI, BackgroundImage, Floor
+    from .pool import OBSTACLE_KINDS
+
+    screen_height = screen_size[1]
+    recipes = [(f"graphics/Ingame_Layer_{layer}.png",
+                lambda size: BackgroundImage.scaled_size(size, screen_height), True)
+               for layer in (1, 2, 3, 4)]
+    recipes += [
+        ("graphics/floor.png", Floor.scaled_size, True),
+        ("graphics/MainMenu.png", lambda size: screen_size, False),
+        ("graphics/background.jpg", lambda size: UI.pause_background_size(size, screen_size), True),
+        ("assets/dino_idle.png", lambda size: None, True),
+        ("assets/dino_walk.png", lambda size: None, True),
+        ("assets/dino_jump.png", lambda size: None, True),
+    ]
+    # Jede Hindernisart in ihrer Größe (relativ zur Spielergröße)
+    for size in sorted({kind.size(player_size) for kind in OBSTACLE_KINDS}):
+        for sprite in sorted({kind.sprite for kind in OBSTACLE_KINDS if kind.size(player_size) == size}):
+            recipes.append((sprite, lambda _, size=size: size, True))
+    return recipes
+
+
+def bake(path, recipes=None, resolve=get_ressources_path):
+    """
+    Erstellt ein Asset-Pack.
+
+    Args:
+        path (str): Pfad der Pack-Datei.
+        recipes (list, optional): Einträge wie von ``default_recipes``.
+        resolve (callable): Funktion Ressourcenname -> Dateipfad.
+
+    Returns:
+        dict: Das geschriebene Manifest.
+    """
+    from .fileutil import write_file_atomic
+
+    if recipes is None:
+        recipes = default_recipes()
+    sources = {}
+    entries = []
+    blobs = []
+    offset = 0
+    for name, sizing, alpha in recipes:
+        source_path = resolve(name)
+        if not os.path.exists(source_path):
+            print(f"Übersprungen, Datei fehlt: {name}")
+            continue
+        image = pygame.image.load(source_path)
+        if name not in sources:
+            sources[name] = dict(_source_info(source_path), size=list(image.get_size()))
+        size = sizing(image.get_size())
+        if size is not None:
+            image = pygame.transform.scale(image, size)
+        data = pygame.image.tobytes(image, PIXEL_FORMAT)
+        padding = -offset % _ALIGN
+        blobs.append(bytes(padding) + data)
+        offset += padding
+        entries.append({"name": name, "size": list(size) if size is not None else None, "alpha": alpha,
+                        "width": image.get_width(), "height": image.get_height(),
+                        "offset": offset, "length": len(data)})
+        offset += len(data)
+
+    manifest = {"version": VERSION, "format": PIXEL_FORMAT, "sources": sources, "entries": entries}
+    manifest_bytes = json.dumps(manifest).encode()
+    # Die Pixeldaten beginnen nach Header und Manifest auf einer 64-Byte-Grenze
+    data_start = _HEADER.size + len(manifest_bytes)
+    data_start += -data_start % _ALIGN
+    header = _HEADER.pack(MAGIC, VERSION, len(manifest_bytes))
+    body = header + manifest_bytes + bytes(data_start - _HEADER.size - len(manifest_bytes))
+    write_file_atomic(path, body + b"".join(blobs))
+    return manifest
+
+
+class AssetPack:
+    """
+    Ein per ``mmap`` geöffnetes Asset-Pack.
+
+    Attributes:
+        path (str): Pfad der Pack-Datei.
+        stale (set): Ressourcennamen, deren Quelldatei sich seit dem Bake geändert hat.
+    """
+    def __init__(self, path, resolve=get_ressources_path):
+        """
+        Öffnet ein Asset-Pack und prüft die Quelldateien.
+
+        Args:
+            path (str): Pfad der Pack-Datei.
+            resolve (callable): Funktion Ressourcenname -> Dateipfad, für die Prüfung der Quellen.
+
+        Raises:
+            PackError: Wenn die Datei kein gültiges Pack ist.
+            OSError: Wenn die Datei nicht geöffnet werden kann.
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            # Copy-on-write: Wer auf eine Surface zeichnet, ändert nicht die Datei
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        if len(self._map) < _HEADER.size:
+            raise PackError("Asset-Pack zu kurz")
+        magic, version, manifest_length = _HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            raise PackError("Kein Asset-Pack oder unbekannte Version")
+        try:
+            manifest = json.loads(self._map[_HEADER.size:_HEADER.size + manifest_length])
+        except ValueError as e:
+            raise PackError(f"Manifest nicht lesbar: {e}")
+        data_start = _HEADER.size + manifest_length
+        self._data_start = data_start + (-data_start % _ALIGN)
+        self._view = memoryview(self._map)
+        self._sources = manifest["sources"]
+        self._entries = {(entry["name"], tuple(entry["size"]) if entry["size"] else None, entry["alpha"]): entry
+                         for entry in manifest["entries"]}
+        self.stale = self._check_sources(resolve)
+
+    @classmethod
+    def open(cls, path, resolve=get_ressources_path):
+        """
+        Öffnet ein Asset-Pack, falls es existiert und gültig ist.
+
+        Args:
+            path (str): Pfad der Pack-Datei.
+            resolve (callable): Funktion Ressourcenname -> Dateipfad.
+
+        Returns:
+            AssetPack or None: Das Pack, None wenn es fehlt oder ungültig ist.
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            pack = cls(path, resolve)
+        except (OSError, PackError, KeyError) as e:
+            print(f"Asset-Pack wird nicht verwendet: {e}")
+            return None
+        if pack.stale:
+            print(f"Asset-Pack veraltet für {', '.join(sorted(pack.stale))} "
+                  f"(neu erstellen mit: python -m dinorunner.pack)")
+        return pack
+
+    def _check_sources(self, resolve):
+        stale = set()
+        for name, info in self._sources.items():
+            try:
+                stat = os.stat(resolve(name))
+            except OSError:
+                continue  # Ohne Quelldatei (z. B. in der exe) gilt das Pack
+            if stat.st_size == info["bytes"] and stat.st_mtime_ns == info["mtime_ns"]:
+                continue
+            # Größe oder Änderungszeit weichen ab: erst der Inhalt entscheidet
+            if stat.st_size != info["bytes"] or file_hash(resolve(name)) != info["sha256"]:
+                stale.add(name)
+        return stale
+
+    def covers(self, name):
+        """
+        Returns:
+            bool: True, wenn das Pack aktuelle Einträge für diese Ressource enthält.
+        """
+        return name in self._sources and name not in self.stale
+
+    def source_size(self, name):
+        """
+        Gibt die Originalgröße einer Ressource zurück.
+
+        Args:
+            name (str): Der Ressourcenname.
+
+        Returns:
+            tuple or None: (Breite, Höhe), None wenn die Ressource nicht (aktuell) im Pack ist.
+        """
+        if not self.covers(name):
+            return None
+        return tuple(self._sources[name]["size"])
+
+    def surface(self, name, size=None, alpha=True):
+        """
+        Gibt eine Surface direkt auf den Pixeldaten des Packs zurück.
+
+        Args:
+            name (str): Der Ressourcenname.
+            size (tuple, optional): Die Zielgröße.
+            alpha (bool): Mit Alphakanal.
+
+        Returns:
+            pygame.Surface or None: Die Surface, None wenn das Pack sie nicht (aktuell) enthält.
+        """
+        entry = self._entries.get((name, tuple(size) if size else None, alpha))
+        if entry is None or name in self.stale:
+            return None
+        start = self._data_start + entry["offset"]
+        surface = pygame.image.frombuffer(self._view[start:start + entry["length"]],
+                                          (entry["width"], entry["height"]), PIXEL_FORMAT)
+        if not alpha and pygame.display.get_surface() is not None:
+            surface = surface.convert()  # Nur Umkopieren ohne Alphakanal, kein Dekodieren
+        return surface
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Asset-Pack für dinorunner erstellen")
+    parser.add_argument("--output", default=get_ressources_path(DEFAULT_PATH),
+                        help="Pfad der Pack-Datei")
+    args = parser.parse_args()
+    baked = bake(args.output)
+    print(f"{len(baked['entries'])} Bilder aus {len(baked['sources'])} Dateien -> {args.output} "
+          f"({os.path.getsize(args.output) // 1024} KiB)")
@@ -0,0 +1,201 @@
+"""
+Objekt-Pool für Hindernisse als Struct-of-Arrays.
+
+Alle Hindernisse liegen in vorab angelegten ``array.array``-Puffern fester Kapazität
+(x, y, Art, Breite, Höhe, aktiv). Ein Hindernis ist nur ein Index in diese
+Puffer: Spawnen nimmt einen freien Index vom Stapel der freien Plätze und schreibt
+die Werte hinein, Entfernen legt ihn zurück. Im laufenden Spiel wird dabei weder ein
+Objekt erzeugt noch vom Garbage Collector aufgeräumt, auch nicht bei Tausenden von
+Hindernissen.
+
+Im Spiel ist der Pool der Speicher der Darstellung: Bewegt, gespawnt und auf Kollision
+geprüft werden die Hindernisse allein in ``simulation.step`` (unveränderliche Zustände,
+damit Replays, Batch-Simulation und Spielstände bitgenau bleiben). ``ObstacleManager.sync``
+schreibt die Positionen jedes Ticks in die festen Plätze des Pools, gezeichnet wird daraus.
+
+Das Modul hängt nicht von pygame ab.
+
+Benchmark (Tausende Hindernisse pro Frame freigeben, neu spawnen und Speicherbereinigungen zählen)::
+
+    python -m dinorunner.pool
+"""
+import array
+
+
+class ObstacleKind:
+    """
+    Eine Art von Hindernis.
+
+    Attributes:
+        name (str): Der Name der Art.
+        sprite (str): Das Bild aus ``ressources/`` (z. B. ``assets/meteor_1.png``).
+        scale (float): Größe relativ zur Hindernisgröße.
+    """
+    def __init__(self, name, sprite, scale=1.0):
+        self.name = name
+        self.sprite = sprite
+        self.scale = scale
+
+    def size(self, obstacle_size):
+        """
+        Args:
+            obstacle_size (int): Die Größe eines normalen Hindernisses.
+
+        Returns:
+            tuple: (Breite, Höhe) dieser Art in Pixeln.
+        """
+        side = max(1, int(obstacle_size * self.scale))
+        return side, side
+
+
+# Die Arten der Meteore; der Index ist der Wert im Puffer ``kind``. Die Simulation kennt nur Art 0.
+OBSTACLE_KINDS = (
+    ObstacleKind("meteor", "assets/meteor_1.png"),
+)
+
+
+class ObstaclePool:
+    """
+    Vorab angelegte Puffer für Hindernisse mit Stapel der freien Plätze.
+
+    Attributes:
+        capacity (int): Maximale Anzahl gleichzeitiger Hindernisse.
+        x (array.array): Linke Kanten.
+        y (array.array): Obere Kanten.
+        kind (array.array): Index in ``OBSTACLE_KINDS``.
+        width (array.array): Breiten.
+        height (array.array): Höhen.
+        active (array.array): 1 für belegte Plätze.
+        count (int): Anzahl der belegten Plätze.
+        high_water (int): Alle belegten Plätze liegen unterhalb dieses Index (Schleifen enden hier).
+        dropped (int): Anzahl der Spawns, die am vollen Pool gescheitert sind.
+    """
+    def __init__(self, capacity=256):
+        """
+        Legt alle Puffer an.
+
+        Args:
+            capacity (int): Maximale Anzahl gleichzeitiger Hindernisse.
+        """
+        self.capacity = capacity
+        self.x = array.array("d", bytes(8 * capacity))
+        self.y = array.array("d", bytes(8 * capacity))
+        self.kind = array.array("B", bytes(capacity))
+        self.width = array.array("H", bytes(2 * capacity))
+        self.height = array.array("H", bytes(2 * capacity))
+        self.active = array.array("B", bytes(capacity))
+        # Freie Plätze als Stapel, der kleinste Index liegt oben
+        self._free = array.array("i", range(capacity - 1, -1, -1))
+        self._free_count = capacity
+        self.count = 0
+        self.high_water = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, kind, x, y, width, height):
+        """
+        Belegt einen freien Platz.
+
+        Args:
+            kind (int): Index in ``OBSTACLE_KINDS``.
+            x (float): Die linke Kante.
+            y (float): Die obere Kante.
+            width (int): Die Breite.
+            height (int): Die Höhe.
+
+        Returns:
+            int: Der Platz, -1 wenn der Pool voll ist.
+        """
+        if self._free_count == 0:
+            self.dropped += 1
+            return -1
+        self._free_count -= 1
+        slot = self._free[self._free_count]
+        self.x[slot] = x
+        self.y[slot] = y
+        self.kind[slot] = kind
+        self.width[slot] = width
+        self.height[slot] = height
+        self.active[slot] = 1
+        self.count += 1
+        if slot >= self.high_water:
+            self.high_water = slot + 1
+        return slot
+
+    def release(self, slot):
+        """
+        Gibt einen Platz frei.
+
+        Args:
+            slot (int): Der Platz.
+        """
+        if not self.active[slot]:
+            return
+        self.active[slot] = 0
+        self._free[self._free_count] = slot
+        self._free_count += 1
+        self.count -= 1
+
+    def clear(self):
+        """Gibt alle Plätze frei."""
+        for slot in range(self.high_water):
+            self.active[slot] = 0
+        # Stapel neu ordnen, damit wieder die kleinsten Indizes zuerst vergeben werden
+        for index in range(self.capacity):
+            self._free[index] = self.capacity - 1 - index
+        self._free_count = self.capacity
+        self.count = 0
+        self.high_water = 0
+
+    def slots(self):
+        """
+        Liefert die belegten Plätze.
+
+        Yields:
+            int: Die Indizes der belegten Plätze, aufsteigend.
+        """
+        active = self.active
+        for slot in range(self.high_water):
+            if active[slot]:
+                yield slot
+
+
+def _benchmark(counts=(100, 1000, 5000), frames=300):
+    import gc
+    import random
+    import time
+
+    collections = [0]
+
+    def count_collections(phase, info):
+        if phase == "start":
+            collections[0] += 1
+
+    print(f"{'Hindernisse':>11}  {'pro Frame':>10}  {'GC-Läufe':>8}")
+    for count in counts:
+        rng = random.Random(count)
+        pool = ObstaclePool(count)
+        for _ in range(count):
+            pool.spawn(0, rng.uniform(0, 800), 480.0, 20, 20)
+        collections[0] = 0
+        gc.callbacks.append(count_collections)
+        start = time.perf_counter()
+        for _ in range(frames):
+            # Ein Viertel der Hindernisse freigeben und rechts neu spawnen, ohne etwas anzulegen
+            for slot in pool.slots():
+                if slot % 4 == 0:
+                    pool.release(slot)
+            while pool.count < count:
+                pool.spawn(0, 800.0, 480.0, 20, 20)
+            x = pool.x
+            for slot in pool.slots():
+                x[slot] -= 4.0
+        elapsed = (time.perf_counter() - start) / frames
+        gc.callbacks.remove(count_collections)
+        print(f"{count:>11}  {elapsed * 1000:>7.2f} ms  {collections[0]:>8}")
+
+
+if __name__ == "__main__":
+    _benchmark()
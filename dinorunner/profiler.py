@@ -0,0 +1,330 @@
+"""
+Frame-Profiler für die Hauptschleife.
+
+Die Hauptschleife ruft nach jeder Phase (Hintergrund, Texte, Events, ...) ``lap(name)``
+auf; die Dauer seit dem vorherigen ``lap`` landet im Ringpuffer der Phase. Aus den
+letzten ``capacity`` Frames werden p50/p95/p99 und der längste Frame samt Aufteilung
+auf die Phasen berechnet. Mit F3 wird ein Overlay mit Frame-Zeit-Graph eingeblendet,
+beim Beenden können die Daten als JSON gespeichert werden.
+
+Ausgeschaltet sind ``start_frame``, ``lap`` und ``end_frame`` leere Methoden, der
+Profiler kostet dann nur die Funktionsaufrufe.
+
+``StartupProfiler`` misst dagegen einmalig die Phasen des Programmstarts bis zum
+ersten angezeigten Frame (``--startup-profile``).
+"""
+import array
+import contextlib
+import json
+import time
+
+import pygame
+
+from .fileutil import write_file_atomic
+
+# Farben der Phasen im Overlay, weitere Phasen bekommen Grau
+_COLORS = {
+    "wait": (70, 70, 70),
+    "simulation": (230, 80, 80),
+    "background": (80, 140, 230),
+    "text": (230, 200, 80),
+    "animation": (200, 120, 230),
+    "events": (80, 200, 200),
+    "obstacles": (240, 150, 60),
+    "player": (120, 220, 100),
+    "draw_ui": (230, 230, 230),
+    "present": (160, 110, 70),
+}
+_GREY = (150, 150, 150)
+
+
+def _percentile(ordered, fraction):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class FrameProfiler:
+    """
+    Misst die Dauer der Phasen jedes Frames in Ringpuffern fester Größe.
+
+    Attributes:
+        capacity (int): Anzahl der Frames, die pro Phase gespeichert werden.
+        enabled (bool): Ob gemessen wird.
+        overlay (bool): Ob das Overlay gezeichnet wird.
+        frames (int): Anzahl der gemessenen Frames.
+        worst (dict or None): Der längste Frame: Nummer, Gesamtdauer und Dauer je Phase (in ms).
+    """
+    def __init__(self, capacity=600, enabled=False):
+        """
+        Initialisiert den Profiler.
+
+        Args:
+            capacity (int): Anzahl der Frames pro Ringpuffer.
+            enabled (bool): Sofort mit dem Messen beginnen.
+        """
+        self.capacity = capacity
+        self.overlay = False
+        self.frames = 0
+        self.worst = None
+        self._stages = {}
+        self._totals = array.array("d", bytes(8 * capacity))
+        self._current = {}
+        self._frame_start = 0.0
+        self._last = 0.0
+        self._overlay_surface = None
+        self._overlay_updated = 0.0
+        self.enabled = False
+        self.set_enabled(enabled)
+
+    def set_enabled(self, enabled):
+        """
+        Schaltet das Messen ein oder aus.
+
+        Args:
+            enabled (bool): True zum Einschalten.
+        """
+        self.enabled = enabled
+        if enabled:
+            # Instanzattribute verdecken die leeren Methoden der Klasse
+            self.start_frame = self._start_frame
+            self.lap = self._lap
+            self.end_frame = self._end_frame
+        else:
+            for name in ("start_frame", "lap", "end_frame"):
+                self.__dict__.pop(name, None)
+
+    def toggle_overlay(self):
+        """Blendet das Overlay ein oder aus; beim Einblenden wird das Messen eingeschaltet."""
+        self.overlay = not self.overlay
+        if self.overlay and not self.enabled:
+            self.set_enabled(True)
+
+    ### Messen ###
+
+    def start_frame(self):
+        """Beginnt einen neuen Frame."""
+
+    def lap(self, stage):
+        """
+        Schließt eine Phase ab.
+
+        Args:
+            stage (str): Der Name der Phase, die seit dem letzten Aufruf lief.
+        """
+
+    def end_frame(self):
+        """Schließt den Frame ab und aktualisiert den längsten Frame."""
+
+    def _start_frame(self):
+        self._frame_start = self._last = time.perf_counter()
+        self._current = {}
+
+    def _lap(self, stage):
+        now = time.perf_counter()
+        self._current[stage] = self._current.get(stage, 0.0) + (now - self._last) * 1000.0
+        self._last = now
+
+    def _end_frame(self):
+        total = (time.perf_counter() - self._frame_start) * 1000.0
+        index = self.frames % self.capacity
+        self._totals[index] = total
+        for stage in self._current.keys() - self._stages.keys():
+            # Phasen, die erst später auftauchen, haben in den früheren Frames 0 ms gedauert
+            self._stages[stage] = array.array("d", bytes(8 * self.capacity))
+        for stage, buffer in self._stages.items():
+            buffer[index] = self._current.get(stage, 0.0)
+        if self.worst is None or total > self.worst["total_ms"]:
+            self.worst = {"frame": self.frames, "total_ms": total, "stages": dict(self._current)}
+        self.frames += 1
+
+    ### Auswerten ###
+
+    def _filled(self, buffer):
+        count = min(self.frames, self.capacity)
+        return sorted(buffer[:count])
+
+    def summary(self):
+        """
+        Wertet die gespeicherten Frames aus.
+
+        Returns:
+            dict: Anzahl der Frames, p50/p95/p99/max der Frame-Zeit und je Phase (in ms)
+            sowie der längste Frame seit dem Start.
+        """
+        def stats(buffer):
+            ordered = self._filled(buffer)
+            return {
+                "p50": _percentile(ordered, 0.50),
+                "p95": _percentile(ordered, 0.95),
+                "p99": _percentile(ordered, 0.99),
+                "max": ordered[-1] if ordered else 0.0,
+            }
+        return {
+            "frames": self.frames,
+            "window": min(self.frames, self.capacity),
+            "frame": stats(self._totals),
+            "stages": {stage: stats(buffer) for stage, buffer in self._stages.items()},
+            "worst": self.worst,
+        }
+
+    def history(self):
+        """
+        Returns:
+            list: Die Frame-Zeiten (in ms) der gespeicherten Frames, ältester zuerst.
+        """
+        count = min(self.frames, self.capacity)
+        start = self.frames - count
+        return [self._totals[(start + i) % self.capacity] for i in range(count)]
+
+    def dump(self, path, extra=None):
+        """
+        Speichert Auswertung und Verlauf als JSON.
+
+        Args:
+            path (str): Der Dateipfad.
+            extra (dict, optional): Weitere Messwerte, die mit gespeichert werden.
+        """
+        data = self.summary()
+        data["history_ms"] = self.history()
+        if extra:
+            data.update(extra)
+        write_file_atomic(path, json.dumps(data, indent=2).encode())
+
+    ### Overlay ###
+
+    def draw_overlay(self, target, font, position=(10, 50), refresh=0.5):
+        """
+        Zeichnet Frame-Zeit-Graph und Perzentile der Phasen.
+
+        Das Overlay wird nur alle ``refresh`` Sekunden neu aufgebaut, dazwischen wird die
+        fertige Surface geblittet.
+
+        Args:
+            target (pygame.Surface): Die Zieloberfläche.
+            font (pygame.font.Font): Die Schrift für die Zahlen.
+            position (tuple): Die linke obere Ecke.
+            refresh (float): Sekunden zwischen zwei Aktualisierungen.
+
+        Returns:
+            pygame.Rect or None: Der Bereich, in den gezeichnet wurde.
+        """
+        if not self.overlay:
+            return None
+        now = time.perf_counter()
+        if self._overlay_surface is None or now - self._overlay_updated >= refresh:
+            self._overlay_surface = self._build_overlay(font)
+            self._overlay_updated = now
+        return target.blit(self._overlay_surface, position)
+
+    def _build_overlay(self, font, width=300, graph_height=80, budget_ms=1000.0 / 60):
+        summary = self.summary()
+        lines = [f"Frame  p50 {summary['frame']['p50']:5.2f}  p95 {summary['frame']['p95']:5.2f}  "
+                 f"p99 {summary['frame']['p99']:5.2f} ms"]
+        for stage, stats in sorted(summary["stages"].items(), key=lambda item: -item[1]["p95"]):
+            lines.append(f"{stage:<11} p50 {stats['p50']:5.2f}  p95 {stats['p95']:5.2f}  max {stats['max']:5.2f}")
+        if self.worst is not None:
+            lines.append(f"Worst: Frame {self.worst['frame']}, {self.worst['total_ms']:.1f} ms")
+        line_height = font.get_linesize()
+        surface = pygame.Surface((width, graph_height + line_height * len(lines) + 8), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 170))
+
+        # Ein Balken pro Frame, gestapelt nach Phasen; die Linie markiert das Budget eines Ticks
+        scale = graph_height / (budget_ms * 2)
+        history = self.history()[-width:]
+        offset = self.frames - len(history)
+        for column in range(len(history)):
+            index = (offset + column) % self.capacity
+            bottom = graph_height
+            for stage, buffer in self._stages.items():
+                height = buffer[index] * scale
+                if height >= 0.5:
+                    top = max(0, bottom - height)
+                    pygame.draw.line(surface, _COLORS.get(stage, _GREY), (column, bottom), (column, top))
+                    bottom = top
+        budget_y = graph_height - budget_ms * scale
+        pygame.draw.line(surface, (255, 255, 255), (0, budget_y), (width, budget_y))
+
+        for row, line in enumerate(lines):
+            text = font.render(line, True, (255, 255, 255))
+            surface.blit(text, (4, graph_height + 4 + row * line_height))
+        return surface
+
+
+class StartupProfiler:
+    """
+    Misst die Dauer der Startphasen bis zum ersten angezeigten Frame.
+
+    Attributes:
+        enabled (bool): Ob beim ersten Frame ein Bericht ausgegeben wird.
+        origin (float): Startzeitpunkt (``time.perf_counter``), ab dem gemessen wird.
+        phases (list): Die gemessenen Phasen als (Name, Dauer in Sekunden).
+        first_frame_at (float or None): Sekunden vom Start bis zum ersten Frame.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.phases = []
+        self.first_frame_at = None
+
+    def enable(self, origin=None):
+        """
+        Schaltet den Bericht ein.
+
+        Args:
+            origin (float, optional): Startzeitpunkt, z. B. vor dem Import der Spielmodule gemessen.
+        """
+        self.enabled = True
+        if origin is not None:
+            self.origin = origin
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Misst die Dauer eines Blocks als Startphase.
+
+        Args:
+            name (str): Der Name der Phase.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def add(self, name, seconds):
+        """
+        Trägt eine außerhalb gemessene Phase ein.
+
+        Args:
+            name (str): Der Name der Phase.
+            seconds (float): Die Dauer in Sekunden.
+        """
+        self.phases.append((name, seconds))
+
+    def first_frame(self):
+        """Merkt sich den Zeitpunkt des ersten angezeigten Frames; nur der erste Aufruf zählt."""
+        if self.first_frame_at is not None:
+            return
+        self.first_frame_at = time.perf_counter() - self.origin
+        if self.enabled:
+            print(self.report())
+
+    def report(self):
+        """
+        Returns:
+            str: Die Phasen mit ihrer Dauer und die Zeit bis zum ersten Frame.
+        """
+        width = max([len(name) for name, _ in self.phases] + [12])
+        lines = ["Startzeit je Phase:"]
+        for name, seconds in self.phases:
+            lines.append(f"  {name:<{width}} {seconds * 1000:8.1f} ms")
+        if self.first_frame_at is not None:
+            lines.append(f"  {'erster Frame':<{width}} {self.first_frame_at * 1000:8.1f} ms nach dem Start")
+        return "\n".join(lines)
+
+
+# Gemeinsamer Profiler für die Hauptschleife (ausgeschaltet, bis F3 oder --frame-stats)
+profiler = FrameProfiler()
+# Misst den Programmstart (Bericht nur mit --startup-profile)
+startup = StartupProfiler()
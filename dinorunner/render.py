@@ -0,0 +1,114 @@
+"""
+Render-Pipeline mit Dirty-Rectangles.
+
+Solange der Hintergrund nicht scrollt (Startbildschirm, Game Over), werden die
+Hintergrund-Ebenen und der Boden einmal zu einer statischen Surface zusammengesetzt.
+Pro Frame werden dann nur die Bereiche erneuert, in denen sich etwas geändert hat
+(Spieler, Hindernisse, Texte), und mit ``pygame.display.update(rects)`` ausgegeben.
+Nur während der Hintergrund scrollt, wird alles gezeichnet und mit ``flip`` ausgegeben.
+"""
+import pygame
+
+
+class Renderer:
+    """
+    Zeichnet Hintergrund und Sprites und gibt nur geänderte Bereiche aus.
+
+    Attributes:
+        screen (pygame.Surface): Die Display-Surface.
+        layers (list): Die Hintergrund-Ebenen (``BackgroundImage``), von hinten nach vorne.
+        floor (Floor): Der Boden, der über den Ebenen liegt.
+        static (pygame.Surface or None): Die vorberechnete Komposition aus Ebenen und Boden.
+        full_frames (int): Anzahl der vollständig ausgegebenen Frames.
+        partial_frames (int): Anzahl der Frames, die nur Dirty-Rectangles ausgegeben haben.
+    """
+    def __init__(self, screen, layers, floor):
+        """
+        Initialisiert den Renderer.
+
+        Args:
+            screen (pygame.Surface): Die Display-Surface.
+            layers (list): Die Hintergrund-Ebenen.
+            floor (Floor): Der Boden.
+        """
+        self.screen = screen
+        self.layers = layers
+        self.floor = floor
+        self.static = None
+        self.full_frames = 0
+        self.partial_frames = 0
+        self._full = True
+        self._previous = []
+        self._current = []
+
+    def invalidate(self):
+        """
+        Erzwingt im nächsten Frame eine vollständige Ausgabe.
+
+        Nötig, wenn außerhalb des Renderers auf den Bildschirm gezeichnet wurde (z. B. vom Pause-Menü)
+        oder das Fenster neu aufgebaut wurde.
+        """
+        self._full = True
+
+    def draw_background(self, scrolling, steps=1):
+        """
+        Zeichnet den Hintergrund für den aktuellen Frame.
+
+        Args:
+            scrolling (bool): Ob die Ebenen in diesem Frame weiterscrollen.
+            steps (int): Anzahl der Simulations-Ticks, um die die Ebenen weiterscrollen.
+        """
+        if scrolling:
+            for layer in self.layers:
+                layer.update(steps)
+                layer.blit(self.screen)
+            self.floor.blit(self.screen)
+            self.static = None
+            self._full = True
+            return
+
+        if self.static is None:
+            self._bake()
+            self._full = True
+        if self._full:
+            self.screen.blit(self.static, (0, 0))
+        else:
+            # Nur die Bereiche wiederherstellen, in die im letzten Frame gezeichnet wurde
+            for rect in self._previous:
+                self.screen.blit(self.static, rect, rect)
+
+    def mark(self, rects):
+        """
+        Meldet Bereiche, in die in diesem Frame gezeichnet wurde.
+
+        Args:
+            rects (pygame.Rect or list or None): Ein Rechteck, eine Liste von Rechtecken oder None.
+        """
+        if rects is None:
+            return
+        if isinstance(rects, pygame.Rect):
+            self._current.append(rects)
+        else:
+            self._current.extend(rects)
+
+    def present(self):
+        """
+        Gibt den Frame aus: vollständig per ``flip`` oder nur die geänderten Bereiche.
+        """
+        if self._full:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            # Alte Positionen (jetzt wieder Hintergrund) und neue Positionen ausgeben
+            pygame.display.update(self._previous + self._current)
+            self.partial_frames += 1
+        self._previous = [rect.clip(self.screen.get_rect()) for rect in self._current]
+        self._current = []
+        self._full = False
+
+    def _bake(self):
+        """Setzt Ebenen und Boden in ihrer aktuellen Scroll-Position zu einer Surface zusammen."""
+        self.static = pygame.Surface(self.screen.get_size()).convert()
+        for layer in self.layers:
+            layer.blit(self.static)
+        self.floor.blit(self.static)
@@ -0,0 +1,365 @@
+"""
+Kompakte Aufzeichnung und Wiedergabe von Läufen.
+
+Ein Lauf ist durch seinen Seed und die Eingaben jedes Ticks vollständig bestimmt.
+Die Eingaben (A, D, Leertaste als ``simulation.Action``-Bits) werden lauflängenkodiert
+als Varints gespeichert, ein typischer Lauf braucht so nur einige Dutzend Bytes.
+Zum Prüfen wird der Lauf headless mit voller Geschwindigkeit nachsimuliert.
+Läufe mit pixelgenauer Kollision sind im Header markiert und werden mit demselben
+Maskentest nachsimuliert.
+
+Aufruf zum Prüfen von Replay-Dateien oder der Replays in der Bestenliste (jeweils gegen
+den dort gespeicherten Punktestand)::
+
+    python -m dinorunner.replay datei.replay [...]
+    python -m dinorunner.replay --leaderboard [leaderboard.sqlite3] [--run-id N]
+"""
+import struct
+import sys
+
+from . import simulation as sim
+
+MAGIC = b"DRRP"
+VERSION = 2
+# Magic, Version, Flags, Seed, Anzahl Ticks, Endstand
+_HEADER = struct.Struct("<4sBBqII")
+# Version 1 hatte noch keine Flags
+_HEADER_V1 = struct.Struct("<4sBqII")
+_ACTION_BITS = 3
+# Flags
+PIXEL_COLLISION = 1
+# Pixelkollision mit der Maske der aktuellen Blickrichtung (ältere Replays nutzten beide Richtungen vereinigt)
+FACING_MASKS = 2
+# Pixelkollision mit der Maske des angezeigten Frames (ältere Replays nutzten alle Frames vereinigt)
+FRAME_MASKS = 4
+
+
+class ReplayError(ValueError):
+    """Wird ausgelöst, wenn eine Replay-Datei nicht gelesen werden kann."""
+
+
+class Replay:
+    """
+    Ein aufgezeichneter Lauf.
+
+    Attributes:
+        seed (int): Der Seed des Laufs.
+        runs (list): Die Eingaben als Liste von (Aktions-Bits, Anzahl Ticks).
+        frames (int): Die Anzahl der Ticks des Laufs.
+        score (int): Der aufgezeichnete Endstand.
+        flags (int): Einstellungen des Laufs, z. B. ``PIXEL_COLLISION``.
+    """
+    def __init__(self, seed, runs, frames, score, flags=0):
+        self.seed = seed
+        self.runs = runs
+        self.frames = frames
+        self.score = score
+        self.flags = flags
+
+    def actions(self):
+        """
+        Liefert die Aktionen Tick für Tick.
+
+        Yields:
+            int: Die Aktions-Bits eines Ticks.
+        """
+        for bits, length in self.runs:
+            for _ in range(length):
+                yield bits
+
+    def to_bytes(self):
+        """
+        Serialisiert das Replay in das Binärformat.
+
+        Returns:
+            bytes: Header gefolgt von den lauflängenkodierten Eingaben.
+        """
+        body = bytearray()
+        for bits, length in self.runs:
+            _write_varint(body, (length << _ACTION_BITS) | bits)
+        return _HEADER.pack(MAGIC, VERSION, self.flags, self.seed, self.frames, self.score) + bytes(body)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Liest ein Replay aus dem Binärformat.
+
+        Args:
+            data (bytes): Die serialisierten Daten.
+
+        Returns:
+            Replay: Das gelesene Replay.
+
+        Raises:
+            ReplayError: Wenn die Daten kein gültiges Replay sind.
+        """
+        if len(data) < _HEADER_V1.size:
+            raise ReplayError("Replay zu kurz")
+        if data[4] == 1:
+            magic, version, seed, frames, score = _HEADER_V1.unpack_from(data)
+            flags = 0
+            position = _HEADER_V1.size
+        elif len(data) >= _HEADER.size:
+            magic, version, flags, seed, frames, score = _HEADER.unpack_from(data)
+            position = _HEADER.size
+        else:
+            raise ReplayError("Replay zu kurz")
+        if magic != MAGIC or version not in (1, VERSION):
+            raise ReplayError("Kein Replay oder unbekannte Version")
+        runs = []
+        while position < len(data):
+            value, position = _read_varint(data, position)
+            runs.append((value & ((1 << _ACTION_BITS) - 1), value >> _ACTION_BITS))
+        if sum(length for _, length in runs) != frames:
+            raise ReplayError("Anzahl der Ticks passt nicht zum Header")
+        return cls(seed, runs, frames, score, flags)
+
+    def save(self, path):
+        """
+        Speichert das Replay in eine Datei.
+
+        Args:
+            path (str): Der Dateipfad.
+        """
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """
+        Lädt ein Replay aus einer Datei.
+
+        Args:
+            path (str): Der Dateipfad.
+
+        Returns:
+            Replay: Das geladene Replay.
+        """
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+class ReplayRecorder:
+    """
+    Zeichnet die Eingaben eines laufenden Spiels auf.
+
+    Attributes:
+        seed (int): Der Seed des aufgezeichneten Laufs.
+        runs (list): Die bisherigen Eingaben als (Aktions-Bits, Anzahl Ticks).
+        frames (int): Die Anzahl der aufgezeichneten Ticks.
+        flags (int): Einstellungen des Laufs, z. B. ``PIXEL_COLLISION``.
+    """
+    def __init__(self, seed, flags=0):
+        self.seed = seed
+        self.flags = flags
+        self.runs = []
+        self.frames = 0
+        self._bits = None
+        self._length = 0
+
+    def record(self, action):
+        """
+        Zeichnet die Aktion eines Ticks auf.
+
+        Args:
+            action (Action): Die an ``simulation.step`` übergebene Aktion.
+        """
+        bits = int(action)
+        self.frames += 1
+        if bits == self._bits:
+            self._length += 1
+            return
+        if self._length:
+            self.runs.append((self._bits, self._length))
+        self._bits = bits
+        self._length = 1
+
+    def mark(self):
+        """
+        Merkt sich den Stand der Aufzeichnung, z. B. für einen Schnappschuss.
+
+        Returns:
+            tuple: Der Stand für ``rewind``.
+        """
+        return tuple(self.runs), self._bits, self._length, self.frames
+
+    def rewind(self, mark):
+        """
+        Setzt die Aufzeichnung auf einen mit ``mark`` gemerkten Stand zurück.
+
+        Args:
+            mark (tuple): Der Stand.
+        """
+        runs, self._bits, self._length, self.frames = mark
+        self.runs = list(runs)
+
+    @classmethod
+    def resume(cls, replay):
+        """
+        Setzt die Aufzeichnung eines Replays fort (z. B. beim Fortsetzen eines gespeicherten Laufs).
+
+        Args:
+            replay (Replay): Das bisherige Replay.
+
+        Returns:
+            ReplayRecorder: Ein Recorder mit den Eingaben des Replays.
+        """
+        recorder = cls(replay.seed, replay.flags)
+        recorder.runs = list(replay.runs)
+        recorder.frames = replay.frames
+        if recorder.runs:
+            # Der letzte Lauf bleibt offen, damit gleiche Eingaben weiter zusammengefasst werden
+            recorder._bits, recorder._length = recorder.runs.pop()
+        return recorder
+
+    def finish(self, score):
+        """
+        Schließt die Aufzeichnung ab.
+
+        Args:
+            score (int): Der Endstand des Laufs.
+
+        Returns:
+            Replay: Das fertige Replay.
+        """
+        runs = list(self.runs)
+        if self._length:
+            runs.append((self._bits, self._length))
+        return Replay(self.seed, runs, self.frames, score, self.flags)
+
+
+def simulate(replay, narrowphase=None):
+    """
+    Simuliert ein Replay headless mit voller Geschwindigkeit nach.
+
+    Args:
+        replay (Replay): Das Replay.
+        narrowphase (callable, optional): Der pixelgenaue Kollisionstest, nötig bei ``PIXEL_COLLISION``.
+
+    Returns:
+        GameState: Der Zustand nach dem letzten aufgezeichneten Tick.
+
+    Raises:
+        ReplayError: Wenn das Replay pixelgenaue Kollision braucht, aber kein Test übergeben wurde,
+            oder mit der alten, nicht mehr unterstützten Pixelkollision aufgezeichnet wurde.
+    """
+    if not replay.flags & PIXEL_COLLISION:
+        narrowphase = None
+    elif not replay.flags & FACING_MASKS:
+        raise ReplayError("Replay wurde mit der alten Pixelkollision (beide Blickrichtungen) aufgezeichnet")
+    elif not replay.flags & FRAME_MASKS:
+        raise ReplayError("Replay wurde mit der alten Pixelkollision (alle Frames vereinigt) aufgezeichnet")
+    elif narrowphase is None:
+        raise ReplayError("Replay wurde mit pixelgenauer Kollision aufgezeichnet")
+    state = sim.new_game(replay.seed)
+    step = sim.step
+    for bits, length in replay.runs:
+        for _ in range(length):
+            state = step(state, bits, narrowphase)[0]
+    return state
+
+
+def verify(replay, narrowphase=None):
+    """
+    Prüft, ob ein Replay beim Nachsimulieren den aufgezeichneten Endstand erreicht.
+
+    Args:
+        replay (Replay): Das Replay.
+        narrowphase (callable, optional): Der pixelgenaue Kollisionstest, nötig bei ``PIXEL_COLLISION``.
+
+    Returns:
+        bool: True, wenn Endstand und Anzahl der Ticks übereinstimmen.
+    """
+    state = simulate(replay, narrowphase)
+    return state.score == replay.score and state.frame == replay.frames
+
+
+def _write_varint(buffer, value):
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data, position):
+    value = 0
+    shift = 0
+    while True:
+        if position >= len(data):
+            raise ReplayError("Replay endet mitten in einem Wert")
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def load_pixel_collider():
+    """
+    Lädt Sprites und Hindernisbild headless und baut daraus den pixelgenauen Kollisionstest.
+
+    Returns:
+        logic.PixelCollider: Der Test, wie ihn das Spiel verwendet.
+    """
+    from .logic import Player, ObstacleManager, PixelCollider
+
+    player = Player(0, 0, sim.PLAYER_SIZE, sim.PLAYER_SPEED, sim.GRAVITY, None)
+    obstacles = ObstacleManager(sim.SCREEN_WIDTH, sim.OBSTACLE_SIZE, sim.OBSTACLE_SPEED, None)
+    return PixelCollider.for_objects(player, obstacles)
+
+
+def _check(label, replay, collider, stored_score=None):
+    """Prüft ein Replay, gibt das Ergebnis aus und lädt den Pixeltest bei Bedarf nach."""
+    if replay.flags & PIXEL_COLLISION and collider[0] is None:
+        collider[0] = load_pixel_collider()
+    try:
+        ok = verify(replay, collider[0])
+    except ReplayError as e:
+        print(f"FAIL {label}: {e}")
+        return False
+    if stored_score is not None and stored_score != replay.score:
+        ok = False
+        label += f" (gespeichert {stored_score})"
+    print(f"{'OK  ' if ok else 'FAIL'} {label}: Seed {replay.seed}, Score {replay.score}, "
+          f"{replay.frames} Ticks, {len(replay.to_bytes())} Bytes")
+    return ok
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from .assets import get_ressources_path
+
+    parser = argparse.ArgumentParser(description="Replays von dinorunner nachsimulieren und prüfen")
+    parser.add_argument("paths", nargs="*", help="Replay-Dateien")
+    parser.add_argument("--leaderboard", nargs="?", const=get_ressources_path("leaderboard.sqlite3"),
+                        help="Replays aus der Bestenliste prüfen (Standard: ressources/leaderboard.sqlite3)")
+    parser.add_argument("--run-id", type=int, help="Nur das Replay dieses Laufs aus der Bestenliste")
+    args = parser.parse_args()
+    if args.run_id is not None and args.leaderboard is None:
+        parser.error("--run-id braucht --leaderboard")
+
+    failed = 0
+    collider = [None]
+    for path in args.paths:
+        failed += not _check(path, Replay.load(path), collider)
+    if args.leaderboard is not None:
+        from .leaderboard import Leaderboard
+
+        board = Leaderboard(args.leaderboard)
+        rows = board.replays(args.run_id)
+        board.close()
+        if not rows:
+            print("Keine Replays gefunden" if args.run_id is None else f"Kein Replay für Lauf {args.run_id}")
+            failed += args.run_id is not None
+        for run_id, score, data in rows:
+            label = f"Lauf {run_id}"
+            try:
+                replay = Replay.from_bytes(data)
+            except ReplayError as e:
+                print(f"FAIL {label}: {e}")
+                failed += 1
+                continue
+            failed += not _check(label, replay, collider, score)
+    sys.exit(1 if failed else 0)
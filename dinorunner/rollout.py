@@ -0,0 +1,183 @@
+"""
+Parallele Auswertung von Bot-Strategien auf der headless Simulation.
+
+Die Episoden werden in Batches auf einen ``ProcessPoolExecutor`` verteilt. Jeder
+Worker hält die Simulation und die Strategien warm und schickt die Ergebnisse
+über eine begrenzte Queue zurück, sodass schnelle Worker nicht beliebig viel
+Speicher im Hauptprozess belegen können.
+"""
+import collections
+import multiprocessing
+import os
+import queue
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from . import simulation as sim
+
+# Höchstdauer einer Episode in Ticks (30 Minuten bei 60 FPS), damit gute Strategien nicht endlos laufen
+MAX_FRAMES = 60 * 60 * 30
+
+EpisodeResult = collections.namedtuple("EpisodeResult", "policy seed score frames death_x")
+EpisodeResult.__doc__ = """
+Ergebnis einer simulierten Episode.
+
+Attributes:
+    policy (str): Name der Strategie.
+    seed (int): Seed der Episode.
+    score (int): Erreichter Punktestand.
+    frames (int): Anzahl der überlebten Ticks.
+    death_x (int or None): x-Position des Spielers beim Tod, None wenn MAX_FRAMES erreicht wurde.
+"""
+
+
+### Strategien ###
+# Eine Strategie ist eine Fabrik, die für einen Seed eine Funktion state -> Action liefert.
+
+def idle_policy(seed):
+    """Bleibt stehen und springt nie."""
+    return lambda state: sim.Action.NONE
+
+
+def random_policy(seed, jump_chance=0.05):
+    """Springt zufällig mit der Wahrscheinlichkeit ``jump_chance`` pro Tick."""
+    rng = random.Random(seed)
+    return lambda state: sim.Action.JUMP if rng.random() < jump_chance else sim.Action.NONE
+
+
+def jumper_policy(seed):
+    """Springt, sobald das nächste Hindernis vor dem Spieler in Reichweite ist."""
+    def act(state):
+        right = state.x + sim.PLAYER_SIZE
+        reach = state.obstacle_speed * 6
+        for obs_x in state.obstacles:
+            if 0 <= obs_x - right <= reach:
+                return sim.Action.JUMP
+        return sim.Action.NONE
+    return act
+
+
+POLICIES = {
+    "idle": idle_policy,
+    "random": random_policy,
+    "jumper": jumper_policy,
+}
+
+
+def run_episode(policy_name, seed, max_frames=MAX_FRAMES):
+    """
+    Spielt eine Episode mit der angegebenen Strategie.
+
+    Args:
+        policy_name (str): Name der Strategie aus ``POLICIES``.
+        seed (int): Seed der Episode (für Hindernisse und Strategie).
+        max_frames (int): Maximale Anzahl an Ticks.
+
+    Returns:
+        EpisodeResult: Das Ergebnis der Episode.
+    """
+    policy = POLICIES[policy_name](seed)
+    state = sim.new_game(seed)
+    step = sim.step
+    collision = False
+    while not collision and state.frame < max_frames:
+        state, _, collision = step(state, policy(state))
+    return EpisodeResult(policy_name, seed, state.score, state.frame, state.x if collision else None)
+
+
+### Worker ###
+
+_results = None
+_max_frames = MAX_FRAMES
+
+
+def _init_worker(results, max_frames):
+    """Initialisiert einen Worker-Prozess und wärmt Simulation und Strategien auf."""
+    global _results, _max_frames
+    _results = results
+    _max_frames = max_frames
+    for name in POLICIES:
+        run_episode(name, 0, max_frames=60)
+
+
+def _run_batch(policy_name, seeds):
+    """Spielt einen Batch von Episoden und legt die Ergebnisse in die Queue."""
+    _results.put([run_episode(policy_name, seed, _max_frames) for seed in seeds])
+    return len(seeds)
+
+
+class RolloutRunner:
+    """
+    Verteilt Episoden auf mehrere Prozesse und liefert die Ergebnisse als Stream.
+
+    Attributes:
+        workers (int): Anzahl der Worker-Prozesse.
+        batch_size (int): Anzahl der Episoden pro Auftrag an einen Worker.
+        queue_size (int): Maximale Anzahl an Batches, die auf Abholung warten dürfen.
+        max_frames (int): Maximale Dauer einer Episode in Ticks.
+    """
+    def __init__(self, workers=None, batch_size=256, queue_size=None, max_frames=MAX_FRAMES):
+        """
+        Initialisiert den Runner.
+
+        Args:
+            workers (int, optional): Anzahl der Prozesse. Standard ist die Anzahl der CPU-Kerne.
+            batch_size (int): Episoden pro Batch.
+            queue_size (int, optional): Größe der Ergebnis-Queue. Standard ist 4 Batches pro Worker.
+            max_frames (int): Maximale Dauer einer Episode in Ticks.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.queue_size = queue_size or self.workers * 4
+        self.max_frames = max_frames
+
+    def run(self, policy_names, seeds):
+        """
+        Spielt jede Strategie auf allen Seeds und liefert die Ergebnisse in Ankunftsreihenfolge.
+
+        Es sind höchstens ``queue_size`` Batches gleichzeitig in Arbeit; ein neuer Batch
+        wird erst vergeben, wenn ein Ergebnis abgeholt wurde.
+
+        Args:
+            policy_names (list): Namen der Strategien aus ``POLICIES``.
+            seeds (iterable): Die Seeds der Episoden.
+
+        Yields:
+            EpisodeResult: Die Ergebnisse der einzelnen Episoden.
+        """
+        for name in policy_names:
+            if name not in POLICIES:
+                raise ValueError(f"Unbekannte Strategie: {name}")
+        seeds = list(seeds)
+        batches = ((name, seeds[i:i + self.batch_size])
+                   for name in policy_names
+                   for i in range(0, len(seeds), self.batch_size))
+
+        context = multiprocessing.get_context()
+        results = context.Queue(self.queue_size)
+        with ProcessPoolExecutor(self.workers, mp_context=context, initializer=_init_worker,
+                                 initargs=(results, self.max_frames)) as executor:
+            futures = []
+            pending = 0
+            for name, batch in batches:
+                futures.append(executor.submit(_run_batch, name, batch))
+                pending += 1
+                if pending >= self.queue_size:
+                    break
+
+            while pending:
+                try:
+                    episodes = results.get(timeout=0.5)
+                except queue.Empty:
+                    # Fehler in einem Worker würden sonst zu endlosem Warten führen
+                    for future in futures:
+                        if future.done() and future.exception() is not None:
+                            raise future.exception()
+                    continue
+                pending -= 1
+                futures = [future for future in futures if not future.done()]
+                for name, batch in batches:
+                    futures.append(executor.submit(_run_batch, name, batch))
+                    pending += 1
+                    break
+                yield from episodes
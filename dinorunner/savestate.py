@@ -0,0 +1,206 @@
+"""
+Schnappschüsse laufender Spiele: Speichern und Fortsetzen, Zurückspulen, Vorausschau.
+
+Der spielrelevante Zustand steckt vollständig im ``simulation.GameState`` (``__slots__``,
+nur Zahlen und ein Tupel der Hindernisse). ``Player`` und ``ObstacleManager`` stellen ihn
+nur dar und werden nach dem Zurücksetzen aus ihm synchronisiert, Surfaces werden also nie
+kopiert. Da ``simulation.step`` jeden Zustand neu erzeugt statt ihn zu verändern, hält ein
+``Snapshot`` den Zustand einfach fest; dazu kommt der Stand der Aufzeichnung, damit das
+Replay eines zurückgespulten oder fortgesetzten Laufs gültig bleibt.
+
+Serialisiert werden Zustand (``GameState.to_bytes``) und bisheriges Replay, zusammen meist
+unter 200 Bytes. Eine CRC32 im Header erkennt beschädigte Dateien.
+
+Das Spiel speichert einen Lauf, der beim Beenden noch läuft (auch aus dem Pause-Menü), mit
+``PlayScene.save_run`` in ``ressources/savegame.dat``. Der nächste Start (Leertaste auf dem
+Startbildschirm) setzt ihn mit ``PlayScene.restore`` fort und löscht die Datei. Zurückspulen
+bietet das Spiel nicht an.
+
+Benchmark (Festhalten, Zurücksetzen, Serialisieren und Prüfen des Zurückspulens)::
+
+    python -m dinorunner.savestate
+"""
+import struct
+import zlib
+
+from . import simulation as sim
+from .fileutil import write_file_atomic
+from .replay import Replay, ReplayError, ReplayRecorder
+
+MAGIC = b"DRSS"
+VERSION = 2
+# Magic, Version, Länge des Zustands, CRC32 von Zustand und Replay; danach Zustand und Replay
+_HEADER = struct.Struct("<4sBHI")
+
+
+class SnapshotError(ValueError):
+    """Wird ausgelöst, wenn ein gespeicherter Spielstand nicht gelesen werden kann."""
+
+
+class Snapshot:
+    """
+    Ein festgehaltener Spielstand.
+
+    Attributes:
+        state (simulation.GameState): Der Zustand (wird nicht verändert, nur geteilt).
+        seed (int): Der Seed des Laufs.
+        flags (int): Einstellungen der Aufzeichnung, z. B. ``replay.PIXEL_COLLISION``.
+        recording (tuple): Der Stand der Aufzeichnung (``ReplayRecorder.mark``).
+    """
+    __slots__ = ("state", "seed", "flags", "recording")
+
+    def __init__(self, state, seed, flags, recording):
+        self.state = state
+        self.seed = seed
+        self.flags = flags
+        self.recording = recording
+
+    def replay(self):
+        """
+        Returns:
+            Replay: Die Eingaben bis zu diesem Stand.
+        """
+        recorder = ReplayRecorder(self.seed, self.flags)
+        recorder.rewind(self.recording)
+        return recorder.finish(self.state.score)
+
+    def to_bytes(self):
+        """
+        Serialisiert den Spielstand.
+
+        Returns:
+            bytes: Header, Zustand und Replay.
+        """
+        state = self.state.to_bytes()
+        payload = state + self.replay().to_bytes()
+        return _HEADER.pack(MAGIC, VERSION, len(state), zlib.crc32(payload)) + payload
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Liest einen Spielstand aus dem Binärformat.
+
+        Args:
+            data (bytes): Die serialisierten Daten.
+
+        Returns:
+            Snapshot: Der gelesene Spielstand.
+
+        Raises:
+            SnapshotError: Wenn die Daten kein gültiger Spielstand sind.
+        """
+        if len(data) < _HEADER.size:
+            raise SnapshotError("Spielstand zu kurz")
+        magic, version, length, checksum = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise SnapshotError("Kein Spielstand oder unbekannte Version")
+        start = _HEADER.size
+        if zlib.crc32(data[start:]) != checksum:
+            raise SnapshotError("Prüfsumme stimmt nicht, Spielstand ist beschädigt")
+        try:
+            state = sim.GameState.from_bytes(data[start:start + length])
+            replay = Replay.from_bytes(data[start + length:])
+        except (ValueError, ReplayError) as e:
+            raise SnapshotError(str(e)) from e
+        if replay.frames != state.frame:
+            raise SnapshotError("Anzahl der Ticks passt nicht zum Zustand")
+        return cls(state, replay.seed, replay.flags, ReplayRecorder.resume(replay).mark())
+
+    def save(self, path):
+        """
+        Speichert den Spielstand in eine Datei (atomar, ein Absturz hinterlässt keine halbe Datei).
+
+        Args:
+            path (str): Der Dateipfad.
+        """
+        write_file_atomic(path, self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """
+        Lädt einen Spielstand aus einer Datei.
+
+        Args:
+            path (str): Der Dateipfad.
+
+        Returns:
+            Snapshot: Der geladene Spielstand.
+        """
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+def take(state, recorder):
+    """
+    Hält einen Lauf fest. Kopiert wird nur die Liste der aufgezeichneten Eingaben.
+
+    Args:
+        state (simulation.GameState): Der aktuelle Zustand.
+        recorder (ReplayRecorder): Die Aufzeichnung des Laufs.
+
+    Returns:
+        Snapshot: Der Spielstand.
+    """
+    return Snapshot(state, recorder.seed, recorder.flags, recorder.mark())
+
+
+def restore(snapshot):
+    """
+    Stellt einen Lauf aus einem Spielstand wieder her.
+
+    Args:
+        snapshot (Snapshot): Der Spielstand.
+
+    Returns:
+        tuple: (GameState, ReplayRecorder), mit dem der Lauf weiterläuft.
+    """
+    recorder = ReplayRecorder(snapshot.seed, snapshot.flags)
+    recorder.rewind(snapshot.recording)
+    return snapshot.state, recorder
+
+
+def _benchmark(ticks=3000, repeat=20000):
+    import timeit
+
+    from .rollout import POLICIES
+
+    # Ein Lauf mit dem Bot, festgehalten in der Mitte
+    policy = POLICIES["jumper"](7)
+    state = sim.new_game(7)
+    recorder = ReplayRecorder(7)
+    actions = []
+    snapshot = None
+    for tick in range(ticks):
+        if tick == ticks // 2:
+            snapshot = take(state, recorder)
+        action = policy(state)
+        actions.append(action)
+        recorder.record(action)
+        state = sim.step(state, action)[0]
+        if state.game_over:
+            break
+    data = snapshot.to_bytes()
+
+    def measure(function):
+        return timeit.timeit(function, number=repeat) / repeat * 1e6
+
+    print(f"Spielstand bei Tick {snapshot.state.frame}: {len(data)} Bytes "
+          f"(Zustand {len(snapshot.state.to_bytes())}, Replay {len(snapshot.replay().to_bytes())})")
+    print(f"take        {measure(lambda: take(state, recorder)):6.2f} µs")
+    print(f"restore     {measure(lambda: restore(snapshot)):6.2f} µs")
+    print(f"to_bytes    {measure(snapshot.to_bytes):6.2f} µs")
+    print(f"from_bytes  {measure(lambda: Snapshot.from_bytes(data)):6.2f} µs")
+
+    # Zurückspulen und mit denselben Eingaben weiterrechnen muss denselben Lauf ergeben
+    resumed, resumed_recorder = restore(Snapshot.from_bytes(data))
+    for action in actions[resumed.frame:]:
+        resumed_recorder.record(action)
+        resumed = sim.step(resumed, action)[0]
+    same = resumed.to_bytes() == state.to_bytes()
+    replay_ok = resumed_recorder.finish(resumed.score).to_bytes() == recorder.finish(state.score).to_bytes()
+    print(f"Zurückgespult und weitergerechnet: {'gleich' if same and replay_ok else 'ABWEICHUNG'} "
+          f"(Tick {resumed.frame}, Score {resumed.score})")
+
+
+if __name__ == "__main__":
+    _benchmark()
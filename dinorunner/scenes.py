@@ -0,0 +1,239 @@
+"""
+Szenen und ihr Scheduler.
+
+Hauptmenü, Spiel, Pause und Spielende sind Szenen auf einem Stapel. Eine einzige
+asynchrone Hauptschleife (``game.main``) reicht pro Frame die Events an die oberste
+Szene weiter, lässt sie einen Frame weiterrechnen und zeichnet die sichtbaren Szenen
+von unten nach oben. Keine Szene hat eine eigene Schleife; nach jedem Frame gibt die
+Hauptschleife an ``asyncio`` ab, sodass Hintergrundaufgaben (``SceneDirector.start_task``)
+in jeder Szene weiterlaufen – auch während ein Menü offen ist.
+"""
+import asyncio
+
+
+class Scene:
+    """
+    Basisklasse einer Szene. Alle Methoden sind optional.
+
+    Attributes:
+        director (SceneDirector or None): Der Scheduler, solange die Szene auf dem Stapel liegt.
+        transparent (bool): Die Szene darunter wird zuerst gezeichnet (z. B. Texte über dem Spiel).
+        full_redraw (bool): Die Szene übermalt den ganzen Bildschirm, der Frame wird vollständig ausgegeben.
+        idle (bool): Die Szene ändert sich nur durch Eingaben, die Hauptschleife darf auf sie warten.
+        animating (bool): Die Szene bewegt sich auch ohne Eingabe (wird im Leerlauf im langsamen Takt gezeichnet).
+    """
+    transparent = False
+    full_redraw = False
+    idle = False
+    animating = False
+
+    def __init__(self):
+        self.director = None
+
+    def enter(self):
+        """Wird aufgerufen, wenn die Szene auf den Stapel kommt."""
+
+    def leave(self):
+        """Wird aufgerufen, wenn die Szene vom Stapel genommen wird."""
+
+    def pause(self):
+        """Wird aufgerufen, wenn eine andere Szene darüber gelegt wird."""
+
+    def resume(self):
+        """Wird aufgerufen, wenn die Szene wieder die oberste ist."""
+
+    def handle_event(self, event):
+        """
+        Verarbeitet ein Event (nur die oberste Szene bekommt Events).
+
+        Args:
+            event (pygame.event.Event): Das Event.
+        """
+
+    def update(self, frame_time):
+        """
+        Rechnet einen Frame weiter (nur die oberste Szene).
+
+        Args:
+            frame_time (float): Die seit dem letzten Frame vergangene Zeit in Sekunden.
+        """
+
+    def draw(self, screen):
+        """
+        Zeichnet die Szene.
+
+        Args:
+            screen (pygame.Surface): Die Zieloberfläche.
+
+        Returns:
+            list or pygame.Rect or None: Die Bereiche, in die gezeichnet wurde (für den Renderer).
+        """
+        return None
+
+
+class SceneDirector:
+    """
+    Stapel der Szenen und laufende Hintergrundaufgaben.
+
+    Attributes:
+        stack (list): Die Szenen, die oberste zuletzt.
+        running (bool): False, sobald das Spiel beendet werden soll.
+        tasks (dict): Name -> laufender ``asyncio.Task``.
+    """
+    def __init__(self):
+        self.stack = []
+        self.running = True
+        self.tasks = {}
+
+    @property
+    def top(self):
+        """Die oberste Szene oder None."""
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene):
+        """
+        Legt eine Szene auf den Stapel; die bisher oberste wird pausiert.
+
+        Args:
+            scene (Scene): Die neue Szene.
+        """
+        if self.stack:
+            self.stack[-1].pause()
+        scene.director = self
+        self.stack.append(scene)
+        scene.enter()
+
+    def pop(self):
+        """
+        Nimmt die oberste Szene vom Stapel; die darunter wird fortgesetzt.
+
+        Returns:
+            Scene or None: Die entfernte Szene.
+        """
+        if not self.stack:
+            return None
+        scene = self.stack.pop()
+        scene.leave()
+        scene.director = None
+        if self.stack:
+            self.stack[-1].resume()
+        return scene
+
+    def reset(self, *scenes):
+        """
+        Ersetzt den Stapel. Szenen, die schon darauf liegen, bleiben erhalten und werden nicht neu betreten.
+
+        Args:
+            *scenes (Scene): Die Szenen, die unterste zuerst.
+        """
+        # Abbauen, bis der Stapel ein Anfang der gewünschten Reihenfolge ist
+        while self.stack and self.stack != list(scenes[:len(self.stack)]):
+            self.pop()
+        for scene in scenes[len(self.stack):]:
+            self.push(scene)
+
+    def quit(self):
+        """Beendet die Hauptschleife nach dem aktuellen Frame."""
+        self.running = False
+
+    ### Hintergrundaufgaben ###
+
+    def start_task(self, awaitable, name):
+        """
+        Startet eine Hintergrundaufgabe, die in jeder Szene weiterläuft.
+
+        Läuft bereits eine Aufgabe mit diesem Namen, wird keine zweite gestartet.
+
+        Args:
+            awaitable (awaitable): Die Coroutine, z. B. ``asyncio.to_thread(...)``.
+            name (str): Name der Aufgabe.
+
+        Returns:
+            asyncio.Task: Die Aufgabe.
+        """
+        task = self.tasks.get(name)
+        if task is not None and not task.done():
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            return task
+        task = asyncio.ensure_future(awaitable)
+        self.tasks[name] = task
+        task.add_done_callback(lambda done: self._task_done(name, done))
+        return task
+
+    def _task_done(self, name, task):
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Hintergrundaufgabe {name} fehlgeschlagen: {task.exception()}")
+
+    def pending_tasks(self):
+        """
+        Returns:
+            list: Die Namen der noch laufenden Aufgaben.
+        """
+        return [name for name, task in self.tasks.items() if not task.done()]
+
+    def cancel_tasks(self):
+        """Bricht alle laufenden Aufgaben ab (beim Beenden)."""
+        for task in self.tasks.values():
+            task.cancel()
+
+    ### Frame ###
+
+    def handle_event(self, event):
+        """
+        Gibt ein Event an die oberste Szene weiter.
+
+        Args:
+            event (pygame.event.Event): Das Event.
+        """
+        if self.stack:
+            self.stack[-1].handle_event(event)
+
+    def update(self, frame_time):
+        """
+        Rechnet die oberste Szene einen Frame weiter.
+
+        Args:
+            frame_time (float): Die seit dem letzten Frame vergangene Zeit in Sekunden.
+        """
+        if self.stack:
+            self.stack[-1].update(frame_time)
+
+    def draw(self, screen):
+        """
+        Zeichnet die sichtbaren Szenen von unten nach oben.
+
+        Args:
+            screen (pygame.Surface): Die Zieloberfläche.
+
+        Returns:
+            list: Die Bereiche, in die gezeichnet wurde.
+        """
+        first = len(self.stack) - 1
+        while first > 0 and self.stack[first].transparent:
+            first -= 1
+        rects = []
+        for scene in self.stack[max(first, 0):]:
+            drawn = scene.draw(screen)
+            if drawn is None:
+                continue
+            if isinstance(drawn, list):
+                rects.extend(drawn)
+            else:
+                rects.append(drawn)
+        return rects
+
+    @property
+    def idle(self):
+        """True, wenn die oberste Szene nur auf Eingaben wartet."""
+        return self.top is not None and self.top.idle
+
+    @property
+    def animating(self):
+        """True, wenn sich die oberste Szene auch ohne Eingabe bewegt."""
+        return self.top is not None and self.top.animating
+
+    @property
+    def full_redraw(self):
+        """True, wenn eine sichtbare Szene den ganzen Bildschirm übermalt."""
+        return self.top is not None and self.top.full_redraw
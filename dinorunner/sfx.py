@@ -1,5 +1,121 @@
+import collections
 import os
+import time
 import pygame
+from .assets import assets
+from .music import MusicPlayer, MUSIC_CHANNELS
+
+
+class VoicePool:
+    """
+    Spielt Soundeffekte auf einer festen Anzahl reservierter Kanäle.
+
+    Jeder Effekt hat eine Priorität. Ist kein Kanal frei, wird die Stimme mit der
+    niedrigsten Priorität (bei Gleichstand die älteste) gestohlen – aber nur, wenn sie
+    nicht wichtiger ist als der neue Effekt; sonst wird der neue Effekt verworfen.
+    Die Lautstärke wird beim Registrieren einmal am ``Sound`` gesetzt, nicht bei jedem Abspielen.
+
+    Attributes:
+        voices (int): Anzahl der Kanäle im Pool.
+        first_channel (int): Index des ersten Kanals im Pool.
+        measure (bool): Ob die Latenz von der Eingabe bis zur Audioausgabe gemessen wird.
+        buffer_ms (float): Dauer des Mixer-Puffers in Millisekunden (Teil der gemessenen Latenz).
+        played (int): Anzahl gespielter Effekte.
+        stolen (int): Anzahl gestohlener Stimmen.
+        dropped (int): Anzahl verworfener Effekte.
+        latencies (collections.deque): Gemessene Latenzen in Millisekunden.
+    """
+    def __init__(self, voices=4, first_channel=len(MUSIC_CHANNELS)):
+        """
+        Initialisiert den Pool. Die Kanäle werden beim ersten Abspielen geholt.
+
+        Args:
+            voices (int): Anzahl der Kanäle im Pool.
+            first_channel (int): Index des ersten Kanals (davor liegen die Musikkanäle).
+        """
+        self.voices = voices
+        self.first_channel = first_channel
+        self.measure = False
+        self.buffer_ms = 0.0
+        self.played = 0
+        self.stolen = 0
+        self.dropped = 0
+        self.latencies = collections.deque(maxlen=1000)
+        self._effects = {}
+        self._channels = None
+        self._priorities = [0] * voices
+        self._started = [0.0] * voices
+
+    def register(self, name, sound, priority=0, volume=None):
+        """
+        Registriert einen Effekt.
+
+        Args:
+            name (str): Der Name des Effekts.
+            sound (pygame.mixer.Sound): Der Sound.
+            priority (int): Die Priorität, höhere Werte verdrängen niedrigere.
+            volume (float, optional): Die Lautstärke, einmalig am Sound gesetzt.
+        """
+        if volume is not None:
+            sound.set_volume(volume)
+        self._effects[name] = (sound, priority)
+
+    def play(self, name, requested_at=None):
+        """
+        Spielt einen Effekt auf einem freien oder gestohlenen Kanal.
+
+        Args:
+            name (str): Der Name des Effekts.
+            requested_at (float, optional): Zeitpunkt (``time.perf_counter``) der auslösenden Eingabe,
+                für die Latenzmessung.
+
+        Returns:
+            pygame.mixer.Channel or None: Der Kanal, None wenn der Effekt verworfen wurde.
+        """
+        effect = self._effects.get(name)
+        if effect is None:
+            return None
+        sound, priority = effect
+        channels = self._get_channels()
+        index = next((i for i, channel in enumerate(channels) if not channel.get_busy()), None)
+        if index is None:
+            # Die unwichtigste, älteste Stimme stehlen, falls sie nicht wichtiger ist
+            index = min(range(self.voices), key=lambda i: (self._priorities[i], self._started[i]))
+            if self._priorities[index] > priority:
+                self.dropped += 1
+                return None
+            self.stolen += 1
+        channel = channels[index]
+        channel.play(sound)
+        now = time.perf_counter()
+        self._priorities[index] = priority
+        self._started[index] = now
+        self.played += 1
+        if self.measure and requested_at is not None:
+            # Bis zum Lautsprecher kommt mindestens noch ein Mixer-Puffer dazu
+            self.latencies.append((now - requested_at) * 1000.0 + self.buffer_ms)
+        return channel
+
+    def _get_channels(self):
+        if self._channels is None:
+            self._channels = [pygame.mixer.Channel(self.first_channel + i) for i in range(self.voices)]
+        return self._channels
+
+    def stats(self):
+        """
+        Returns:
+            dict: Gespielte, gestohlene und verworfene Effekte sowie p50/max der Latenz in Millisekunden.
+        """
+        latencies = sorted(self.latencies)
+        return {
+            "played": self.played,
+            "stolen": self.stolen,
+            "dropped": self.dropped,
+            "latency_p50_ms": latencies[len(latencies) // 2] if latencies else None,
+            "latency_max_ms": latencies[-1] if latencies else None,
+            "buffer_ms": self.buffer_ms,
+        }
+
 
 class SoundManager:
     """
@@ -14,14 +130,28 @@ class SoundManager:
         jump_sound_volume (float): Lautstärke des Sprung-Sounds.
         jump_sound (pygame.mixer.Sound): Geladener Sprung-Sound.
         death_sound (pygame.mixer.Sound): Geladener Todes-Sound.
+        music (MusicPlayer): Spielt die vorab dekodierten Musiktracks.
+        voices (VoicePool): Spielt die Soundeffekte auf reservierten Kanälen.
+        frequency (int): Abtastrate des Mixers in Hz.
+        buffer (int): Puffergröße des Mixers in Samples (kleiner = weniger Latenz, aber Knackser
+            auf langsamen Rechnern).
     """
-    def __init__(self):
+    def __init__(self, frequency=44100, buffer=256, voices=4):
         """
-        Initialisiert den SoundManager und lädt die Sounddateien.
+        Initialisiert den SoundManager.
+
+        Der Mixer wird erst beim ersten Laden oder Abspielen initialisiert, damit der Import
+        des Pakets kein Audiogerät öffnet.
+
+        Args:
+            frequency (int): Abtastrate des Mixers in Hz.
+            buffer (int): Puffergröße des Mixers in Samples.
+            voices (int): Anzahl der Kanäle für Soundeffekte.
         """
-        pygame.init()
-        pygame.mixer.init()
+        self.frequency = frequency
+        self.buffer = buffer
         self.volume = 0.5
+        self.music_paused = False
 
         # Verzeichnis des aktuellen Scripts
         self.sound_dir = os.path.join(os.path.dirname(__file__), "../ressources/sound")
@@ -35,104 +165,174 @@ class SoundManager:
         self.jump_sound = None
         self.death_sound = None
 
+        # Musik wird vorab dekodiert und ohne Nachladen gewechselt
+        self.music = MusicPlayer(lambda filename: os.path.join(self.sound_dir, filename))
+        self.music.volume = self.volume
+        self.voices = VoicePool(voices)
+
+    def configure(self, frequency=None, buffer=None, voices=None, measure_latency=None):
+        """
+        Ändert die Mixer-Einstellungen. Wirkt nur, solange der Mixer noch nicht initialisiert ist.
+
+        Args:
+            frequency (int, optional): Abtastrate in Hz.
+            buffer (int, optional): Puffergröße in Samples.
+            voices (int, optional): Anzahl der Kanäle für Soundeffekte.
+            measure_latency (bool, optional): Latenz von der Eingabe bis zur Audioausgabe messen.
+        """
+        if pygame.mixer.get_init():
+            print("Mixer läuft bereits, Einstellungen werden ignoriert")
+            return
+        if frequency is not None:
+            self.frequency = frequency
+        if buffer is not None:
+            self.buffer = buffer
+        if voices is not None:
+            self.voices = VoicePool(voices)
+        if measure_latency is not None:
+            self.voices.measure = measure_latency
+
+    def init(self):
+        """
+        Initialisiert den Mixer, falls das noch nicht geschehen ist.
+
+        Returns:
+            bool: True, wenn der Mixer bereit ist (False z. B. ohne Audiogerät).
+        """
+        if pygame.mixer.get_init():
+            return True
+        try:
+            pygame.mixer.init(frequency=self.frequency, size=-16, channels=2, buffer=self.buffer)
+        except pygame.error as e:
+            print("Mixer konnte nicht initialisiert werden:", e)
+            return False
+        # Musik- und Effektkanäle reservieren, damit Sound.play() sie nie belegt
+        reserved = len(MUSIC_CHANNELS) + self.voices.voices
+        if pygame.mixer.get_num_channels() < reserved:
+            pygame.mixer.set_num_channels(reserved)
+        pygame.mixer.set_reserved(reserved)
+        frequency = pygame.mixer.get_init()[0]
+        self.voices.buffer_ms = 1000.0 * self.buffer / frequency
+        return True
+
     def standard_volume(self):
         """
         Setzt die Lautstärke der Hintergrundmusik auf den Standardwert.
         """
-        pygame.mixer.music.set_volume(self.volume)
+        if not self.init():
+            return
+        self.music.set_volume(self.volume)
 
     def load_music(self):
         """
-        Lädt die Hintergrundmusik, falls die Datei existiert.
+        Dekodiert die Hintergrundmusik im Hintergrund vorab.
         """
-        try:
-            if not os.path.exists(self.background_music_file):
-                raise FileNotFoundError(f"Musikdatei nicht gefunden: {self.background_music_file}")
-            pygame.mixer.music.load(self.background_music_file)
-            print("Musik geladen:", self.background_music_file)
-        except Exception as e:
-            print("Fehler beim Laden der Musik:", e)
+        self.preload_music([os.path.basename(self.background_music_file)])
+
+    def preload_music(self, filenames):
+        """
+        Dekodiert Musiktracks im Hintergrund, damit spätere Wechsel nicht warten müssen.
+
+        Args:
+            filenames (list): Dateinamen im Soundverzeichnis (z. B. "nguu.ogg").
+        """
+        if not self.init():
+            return
+        self.music.preload(filenames)
 
     def play_background_music(self):
         """
-        Startet die Hintergrundmusik in einer Endlosschleife.
+        Startet die Hintergrundmusik in einer Endlosschleife, falls gerade keine Musik läuft.
         """
-        if self.background_music_file and not pygame.mixer.music.get_busy():
-            pygame.mixer.music.play(-1, 0.0)
+        if not self.init():
+            return
+        if self.background_music_file and not self.music.busy():
+            self.music.play(self.music.current or os.path.basename(self.background_music_file))
             print("Hintergrundmusik spielt.")
 
     def load_jump_sound(self):
         """
-        Lädt den Sprung-Sound aus der Datei.
+        Holt den Sprung-Sound aus dem AssetManager (von der Platte gelesen wird nur beim ersten Mal).
         """
-        if not os.path.exists(self.jump_sound_file):
+        if not self.init() or self.jump_sound is not None:
+            return
+        self.jump_sound = assets.sound("sound/jump-sound.ogg")
+        if self.jump_sound is None:
             raise FileNotFoundError(f"Jump-Sound nicht gefunden: {self.jump_sound_file}")
-        self.jump_sound = pygame.mixer.Sound(self.jump_sound_file)
+        self.voices.register("jump", self.jump_sound, priority=1, volume=self.jump_sound_volume)
 
-    def play_jump_sound(self):
+    def play_jump_sound(self, requested_at=None):
         """
         Spielt den geladenen Sprung-Sound ab.
+
+        Args:
+            requested_at (float, optional): Zeitpunkt der auslösenden Eingabe (für die Latenzmessung).
         """
         if self.jump_sound:
-            self.jump_sound.set_volume(self.jump_sound_volume)
-            self.jump_sound.play()
+            self.voices.play("jump", requested_at)
 
     def load_death_sound(self):
         """
-        Lädt den Todes-Sound aus der Datei.
+        Holt den Todes-Sound aus dem AssetManager (von der Platte gelesen wird nur beim ersten Mal).
         """
-        if not os.path.exists(self.death_sound_file):
+        if not self.init() or self.death_sound is not None:
+            return
+        self.death_sound = assets.sound("sound/death-sound.ogg")
+        if self.death_sound is None:
             raise FileNotFoundError(f"Death-Sound nicht gefunden: {self.death_sound_file}")
-        self.death_sound = pygame.mixer.Sound(self.death_sound_file)
+        self.voices.register("death", self.death_sound, priority=2)
 
     def play_death_sound(self):
         """
         Spielt den geladenen Todes-Sound ab.
         """
         if self.death_sound:
-            self.death_sound.play()
+            self.voices.play("death")
 
     def play_music(self, filename, volume=None):
         """
-        Spielt eine Musikdatei aus dem Soundverzeichnis.
+        Spielt eine Musikdatei aus dem Soundverzeichnis und blendet von der laufenden über.
+
+        Blockiert nicht: Ist der Track noch nicht dekodiert, startet er, sobald er fertig ist.
 
         Args:
             filename (str): Dateiname der Musikdatei (z. B. "nguu.ogg")
             volume (float): Optionaler Lautstärkewert (0.0 – 1.0)
         """
-        try:
-            music_path = os.path.join(self.sound_dir, filename)
-            if not os.path.exists(music_path):
-                raise FileNotFoundError(f"Musikdatei nicht gefunden: {music_path}")
-
-            pygame.mixer.music.load(music_path)
-            pygame.mixer.music.set_volume(volume if volume is not None else self.volume)
-            pygame.mixer.music.play(-1)
-            print(f"🎵 Musik abgespielt: {filename}")
-        except Exception as e:
-            print(f"Fehler beim Abspielen von {filename}: {e}")
+        if not self.init():
+            return
+        self.music.play(filename, volume if volume is not None else self.volume)
+        print(f"🎵 Musik abgespielt: {filename}")
 
     def set_volume(self, value):
+        if not self.init():
+            return
         self.volume = value
-        pygame.mixer.music.set_volume(self.volume)
+        self.music.set_volume(self.volume)
 
     def pause_music(self):
         """Pausiert die Musik."""
-        if pygame.mixer.music.get_busy():
-            pygame.mixer.music.pause()
+        if not self.init():
+            return
+        if self.music.busy():
+            self.music.pause()
             self.music_paused = True
             print("Musik pausiert.")
 
     def resume_music(self):
         """Setzt die pausierte Musik fort."""
+        if not self.init():
+            return
         if self.music_paused:
-            pygame.mixer.music.unpause()
+            self.music.resume()
             self.music_paused = False
             print("Musik fortgesetzt.")
 
     def stop_music(self):
         """Stoppt die Hintergrundmusik."""
-        pygame.mixer.music.stop()
+        if not self.init():
+            return
+        self.music.stop()
         self.music_paused = False
         print("Musik gestoppt.")
 
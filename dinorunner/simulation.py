@@ -0,0 +1,425 @@
+"""
+Headless Spielkern von dinorunner.
+
+Dieses Modul enthält die Spielregeln (Physik des Spielers, Hindernisse, Punkte,
+Kollision) ohne jede Abhängigkeit von pygame. Ein Spielzustand wird als
+``GameState`` gehalten und mit ``step(state, action)`` um genau einen Tick
+weitergerechnet. Grafik und Sound beobachten den Zustand nur.
+
+Die Hindernisse bleiben nach x sortiert, die Kollision prüft über die ``broadphase``
+nur die Hindernisse in der Nähe des Spielers.
+"""
+import enum
+import struct
+
+from . import broadphase
+
+# Spielkonstanten (entsprechen den Werten aus game.py)
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+PLAYER_SIZE = 20
+PLAYER_SPEED = 5
+GRAVITY = 1
+JUMP_IMPULSE = 18
+OBSTACLE_SPEED = 2
+OBSTACLE_SPEED_STEP = 0.5
+POINTS_PER_SPEED_STEP = 10
+FLOOR_TOP = SCREEN_HEIGHT - 100
+PLAYER_START_X = 50
+PLAYER_MAX_X = SCREEN_WIDTH - PLAYER_SIZE * 2
+OBSTACLE_SIZE = PLAYER_SIZE
+OBSTACLE_Y = 500 - OBSTACLE_SIZE
+# Das Sprite des Spielers ist doppelt so groß wie sein Rechteck und um eine Spielergröße nach oben versetzt
+SPRITE_SIZE = PLAYER_SIZE * 2
+SPRITE_OFFSET_Y = -PLAYER_SIZE
+# Alle Geschwindigkeiten sind in Pixeln pro Tick angegeben, ein Tick dauert 1/TICK_RATE Sekunden
+TICK_RATE = 60
+# So viele Ticks wird ein Animationsframe des Spielers angezeigt (12 Bilder/s wie ``AnimationAtlas``);
+# der Frame ergibt sich damit aus ``GameState.frame`` und ist beim Nachsimulieren derselbe
+ANIMATION_TICKS = 5
+
+_MASK32 = 0xFFFFFFFF
+
+# Animationszustände des Spielers; ``GameState.to_bytes`` speichert den Index
+POSES = ('idle', 'walk', 'jump')
+# x, y, x_change, y_change, on_ground, Pose, obstacle_speed, score, last_speed_increase, rng, frame,
+# game_over, facing_right, Anzahl der Hindernisse; danach die Hindernisse als double
+_STATE = struct.Struct("<iiiiBBdIiIIBBB")
+
+# Bitwerte der Aktionen als einfache ints (Enum-Operationen sind im inneren Loop zu langsam)
+_LEFT = 1
+_RIGHT = 2
+_JUMP = 4
+
+
+class Action(enum.IntFlag):
+    """
+    Eingaben eines Ticks. Die Werte lassen sich kombinieren (z. B. ``LEFT | JUMP``).
+    """
+    NONE = 0
+    LEFT = 1   # Taste A
+    RIGHT = 2  # Taste D
+    JUMP = 4   # Leertaste
+
+
+class GameState:
+    """
+    Vollständiger, pygame-freier Zustand eines laufenden Spiels.
+
+    Attributes:
+        x (int): Die x-Position des Spielers.
+        y (int): Die y-Position des Spielers.
+        x_change (int): Horizontale Bewegung im letzten Tick.
+        y_change (int): Vertikale Geschwindigkeit (positiv = nach oben).
+        on_ground (bool): Gibt an, ob der Spieler den Boden berührt.
+        pose (str): Animationszustand des Spielers (idle, walk, jump).
+        facing_right (bool): Blickrichtung des Spielers (bestimmt die Maske der pixelgenauen Kollision).
+        obstacles (tuple): Die x-Positionen der Hindernisse, aufsteigend sortiert.
+        obstacle_speed (float): Die aktuelle Geschwindigkeit der Hindernisse.
+        score (int): Der aktuelle Punktestand.
+        last_speed_increase (int): Punktestand bei der letzten Temposteigerung.
+        rng (int): Zustand des Zufallsgenerators (xorshift32).
+        frame (int): Anzahl der bisher simulierten Ticks.
+        game_over (bool): True, sobald der Spieler ein Hindernis berührt hat.
+    """
+    __slots__ = ("x", "y", "x_change", "y_change", "on_ground", "pose", "obstacles",
+                 "obstacle_speed", "score", "last_speed_increase", "rng", "frame", "game_over", "facing_right")
+
+    def __init__(self, x, y, x_change, y_change, on_ground, pose, obstacles,
+                 obstacle_speed, score, last_speed_increase, rng, frame, game_over, facing_right=True):
+        self.x = x
+        self.y = y
+        self.x_change = x_change
+        self.y_change = y_change
+        self.on_ground = on_ground
+        self.pose = pose
+        self.obstacles = obstacles
+        self.obstacle_speed = obstacle_speed
+        self.score = score
+        self.last_speed_increase = last_speed_increase
+        self.rng = rng
+        self.frame = frame
+        self.game_over = game_over
+        self.facing_right = facing_right
+
+    def copy(self):
+        """
+        Gibt eine flache Kopie des Zustands zurück.
+
+        Returns:
+            GameState: Die Kopie.
+        """
+        return GameState(self.x, self.y, self.x_change, self.y_change, self.on_ground, self.pose,
+                         self.obstacles, self.obstacle_speed, self.score, self.last_speed_increase,
+                         self.rng, self.frame, self.game_over, self.facing_right)
+
+    def to_bytes(self):
+        """
+        Serialisiert den Zustand kompakt (45 Bytes plus 8 je Hindernis).
+
+        Returns:
+            bytes: Die Daten.
+        """
+        obstacles = self.obstacles
+        return (_STATE.pack(self.x, self.y, self.x_change, self.y_change, self.on_ground,
+                            POSES.index(self.pose), self.obstacle_speed, self.score, self.last_speed_increase,
+                            self.rng, self.frame, self.game_over, self.facing_right, len(obstacles))
+                + struct.pack(f"<{len(obstacles)}d", *obstacles))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Liest einen mit ``to_bytes`` serialisierten Zustand.
+
+        Tempo und Hindernisse kommen als float zurück; die Simulation rechnet damit bitgenau
+        gleich weiter. Die Hindernisse werden sortiert (ältere Zustände speicherten sie unsortiert).
+
+        Args:
+            data (bytes): Die Daten.
+
+        Returns:
+            GameState: Der Zustand.
+
+        Raises:
+            ValueError: Wenn die Daten kein gültiger Zustand sind.
+        """
+        try:
+            (x, y, x_change, y_change, on_ground, pose, obstacle_speed, score, last_speed_increase,
+             rng, frame, game_over, facing_right, count) = _STATE.unpack_from(data)
+            obstacles = tuple(sorted(struct.unpack_from(f"<{count}d", data, _STATE.size)))
+            pose = POSES[pose]
+        except (struct.error, IndexError) as e:
+            raise ValueError(f"Ungültiger Spielzustand: {e}") from e
+        return cls(x, y, x_change, y_change, bool(on_ground), pose, obstacles, obstacle_speed,
+                   score, last_speed_increase, rng, frame, bool(game_over), bool(facing_right))
+
+    def __repr__(self):
+        return (f"GameState(frame={self.frame}, score={self.score}, x={self.x}, y={self.y}, "
+                f"obstacles={self.obstacles}, game_over={self.game_over})")
+
+
+def seed_rng(seed):
+    """
+    Erzeugt aus einem beliebigen Integer-Seed einen gültigen xorshift32-Zustand.
+
+    Args:
+        seed (int): Der Seed.
+
+    Returns:
+        int: Ein Zustand ungleich 0.
+    """
+    state = (seed * 0x9E3779B1 + 0x7F4A7C15) & _MASK32
+    return state or 0x6D2B79F5
+
+
+def next_rng(state):
+    """
+    Berechnet den nächsten Zustand des xorshift32-Generators.
+
+    Args:
+        state (int): Der aktuelle Zustand.
+
+    Returns:
+        int: Der neue Zustand (gleichzeitig die Zufallszahl).
+    """
+    state ^= (state << 13) & _MASK32
+    state ^= state >> 17
+    state ^= (state << 5) & _MASK32
+    return state
+
+
+def randint(state, low, high):
+    """
+    Zieht eine ganze Zahl aus [low, high] (wie ``random.randint``).
+
+    Args:
+        state (int): Der aktuelle Zustand des Generators.
+        low (int): Die untere Grenze.
+        high (int): Die obere Grenze (inklusive).
+
+    Returns:
+        tuple: (Zufallszahl, neuer Zustand des Generators).
+    """
+    state = next_rng(state)
+    return low + state % (high - low + 1), state
+
+
+def new_game(seed=0):
+    """
+    Erzeugt den Anfangszustand eines neuen Spiels.
+
+    Args:
+        seed (int): Seed für das Spawnen der Hindernisse.
+
+    Returns:
+        GameState: Der Startzustand.
+    """
+    return GameState(
+        x=PLAYER_START_X,
+        y=FLOOR_TOP - PLAYER_SIZE,
+        x_change=0,
+        y_change=0,
+        on_ground=False,
+        pose='idle',
+        obstacles=(SCREEN_WIDTH - 150, SCREEN_WIDTH, SCREEN_WIDTH + 150),
+        obstacle_speed=OBSTACLE_SPEED,
+        score=0,
+        last_speed_increase=-POINTS_PER_SPEED_STEP,
+        rng=seed_rng(seed),
+        frame=0,
+        game_over=False,
+        facing_right=True,
+    )
+
+
+def move_player(x, y, x_change, y_change, on_ground, pose, action,
+                floor_top=FLOOR_TOP, width=PLAYER_MAX_X, size=PLAYER_SIZE,
+                speed=PLAYER_SPEED, gravity=GRAVITY):
+    """
+    Bewegt den Spieler um einen Tick (Laufen, Springen, Schwerkraft, Boden).
+
+    Args:
+        x (int): Die x-Position des Spielers.
+        y (int): Die y-Position des Spielers.
+        x_change (int): Die bisherige horizontale Bewegung.
+        y_change (int): Die bisherige vertikale Geschwindigkeit.
+        on_ground (bool): Gibt an, ob der Spieler den Boden berührt.
+        pose (str): Der bisherige Animationszustand.
+        action (Action): Die Eingaben dieses Ticks.
+        floor_top (int): Die Y-Position des Bodens.
+        width (int): Die rechte Grenze für die x-Position.
+        size (int): Die Größe des Spielers.
+        speed (int): Die Laufgeschwindigkeit.
+        gravity (int): Die Schwerkraft.
+
+    Returns:
+        tuple: (x, y, x_change, y_change, on_ground, pose, jumped)
+    """
+    action = int(action)
+    if action & _LEFT and x > 0:
+        x_change = -speed
+        pose = 'walk'
+    elif action & _RIGHT and x <= width:
+        x_change = speed
+        pose = 'walk'
+    else:
+        x_change = 0
+        if on_ground:
+            pose = 'idle'
+
+    jumped = False
+    if action & _JUMP and on_ground:
+        y_change = JUMP_IMPULSE
+        on_ground = False
+        pose = 'jump'
+        jumped = True
+
+    x += x_change
+    y -= y_change
+    y_change -= gravity
+
+    if y >= floor_top - size:
+        y = floor_top - size
+        y_change = 0
+        on_ground = True
+
+    return x, y, x_change, y_change, on_ground, pose, jumped
+
+
+def move_obstacles(obstacles, speed, rng, width=SCREEN_WIDTH, size=OBSTACLE_SIZE):
+    """
+    Bewegt die Hindernisse nach links und lässt sie rechts neu erscheinen.
+
+    Die Hindernisse bleiben dabei sortiert. Welches herausgefallene Hindernis welche neue
+    Position bekommt, spielt keine Rolle: Die Zufallszahlen werden in derselben Anzahl gezogen.
+
+    Args:
+        obstacles (tuple): Die x-Positionen der Hindernisse, aufsteigend sortiert.
+        speed (float): Die Geschwindigkeit der Hindernisse.
+        rng (int): Der Zustand des Zufallsgenerators.
+        width (int): Die Breite des Bildschirms.
+        size (int): Die Größe der Hindernisse.
+
+    Returns:
+        tuple: (neue Positionen, Punkte, neuer Zustand des Generators)
+    """
+    moved, points = broadphase.scroll(obstacles, speed, -size)
+    for _ in range(points):
+        obs_x, rng = randint(rng, width + size, width + size * 3)
+        broadphase.insert(moved, obs_x)
+    return tuple(moved), points, rng
+
+
+def collides(x, y, obstacles, size=PLAYER_SIZE, obstacle_size=OBSTACLE_SIZE, obstacle_y=OBSTACLE_Y):
+    """
+    Prüft, ob das Rechteck des Spielers ein Hindernis schneidet.
+
+    Die Koordinaten werden wie bei ``pygame.Rect`` auf ganze Zahlen abgeschnitten,
+    damit das Ergebnis exakt ``Rect.colliderect`` entspricht. Geprüft werden nur die
+    Hindernisse, die ``broadphase.candidates`` in der Nähe des Spielers findet.
+
+    Returns:
+        bool: True, wenn eine Kollision vorliegt.
+    """
+    px = int(x)
+    py = int(y)
+    if not (py < obstacle_y + obstacle_size and obstacle_y < py + size):
+        return False
+    low, high = broadphase.candidates(obstacles, px, size, obstacle_size)
+    for index in range(low, high):
+        ox = int(obstacles[index])
+        if px < ox + obstacle_size and ox < px + size:
+            return True
+    return False
+
+
+def collides_precise(x, y, pose, obstacles, narrowphase, obstacle_size=OBSTACLE_SIZE, obstacle_y=OBSTACLE_Y,
+                     facing_right=True, frame=0):
+    """
+    Prüft die Kollision gegen das gezeichnete Sprite statt gegen das Rechteck des Spielers.
+
+    Zuerst wird das Rechteck des Sprites gegen die Hindernisse aus ``broadphase.candidates``
+    geprüft; nur wenn sich Rechtecke überschneiden, entscheidet ``narrowphase`` (z. B. ein
+    Maskenvergleich).
+
+    Args:
+        x (int): Die x-Position des Spielers.
+        y (int): Die y-Position des Spielers.
+        pose (str): Der Animationszustand des Spielers.
+        obstacles (tuple): Die x-Positionen der Hindernisse, aufsteigend sortiert.
+        narrowphase (callable): Funktion (Pose, dx, dy, Blickrichtung, Tick) -> bool; dx/dy ist die Position
+            des Hindernisses relativ zur linken oberen Ecke des Sprites, aus dem Tick folgt der
+            angezeigte Animationsframe (siehe ``ANIMATION_TICKS``).
+        obstacle_size (int): Die Größe der Hindernisse.
+        obstacle_y (int): Die y-Position der Hindernisse.
+        facing_right (bool): Die Blickrichtung des Spielers.
+        frame (int): Der Tick, für den geprüft wird.
+
+    Returns:
+        bool: True, wenn eine Kollision vorliegt.
+    """
+    px = int(x)
+    py = int(y) + SPRITE_OFFSET_Y
+    if not (py < obstacle_y + obstacle_size and obstacle_y < py + SPRITE_SIZE):
+        return False
+    low, high = broadphase.candidates(obstacles, px, SPRITE_SIZE, obstacle_size)
+    for index in range(low, high):
+        ox = int(obstacles[index])
+        if (px < ox + obstacle_size and ox < px + SPRITE_SIZE
+                and narrowphase(pose, ox - px, obstacle_y - py, facing_right, frame)):
+            return True
+    return False
+
+
+def step(state, action, narrowphase=None):
+    """
+    Rechnet das Spiel um genau einen Tick weiter.
+
+    Der übergebene Zustand wird nicht verändert.
+
+    Args:
+        state (GameState): Der aktuelle Zustand.
+        action (Action): Die Eingaben dieses Ticks.
+        narrowphase (callable, optional): Pixelgenauer Test für ``collides_precise``. Ohne
+            wird mit den Rechtecken geprüft (``collides``).
+
+    Returns:
+        tuple: (neuer GameState, erzielte Punkte, Kollision ja/nein)
+    """
+    if state.game_over:
+        return state, 0, False
+
+    x, y, x_change, y_change, on_ground, pose, _ = move_player(
+        state.x, state.y, state.x_change, state.y_change, state.on_ground, state.pose, action)
+    facing_right = x_change > 0 if x_change else state.facing_right
+
+    speed = state.obstacle_speed
+    obstacles, points, rng = move_obstacles(state.obstacles, speed, state.rng)
+
+    if narrowphase is None:
+        collision = collides(x, y, obstacles)
+    else:
+        collision = collides_precise(x, y, pose, obstacles, narrowphase, facing_right=facing_right,
+                                     frame=state.frame + 1)
+
+    score = state.score + points
+    last_speed_increase = state.last_speed_increase
+    if score >= last_speed_increase + POINTS_PER_SPEED_STEP:
+        speed += OBSTACLE_SPEED_STEP
+        last_speed_increase = score
+
+    new_state = GameState(x, y, x_change, y_change, on_ground, pose, obstacles, speed,
+                          score, last_speed_increase, rng, state.frame + 1, collision, facing_right)
+    return new_state, points, collision
+
+
+def jumped(previous, state):
+    """
+    Gibt an, ob der Spieler zwischen zwei Zuständen abgesprungen ist.
+
+    Wird von der Sound-Ausgabe genutzt, um den Sprung-Sound abzuspielen.
+
+    Returns:
+        bool: True bei einem Absprung.
+    """
+    return previous.on_ground and not state.on_ground
@@ -0,0 +1,230 @@
+"""
+Fester Simulationstakt und Bildraten-Steuerung.
+
+Die Simulation läuft immer mit ``simulation.TICK_RATE`` Ticks pro Sekunde, egal wie
+schnell gezeichnet wird. ``FixedTimestep`` sammelt die vergangene Zeit in einem
+Akkumulator und gibt an, wie viele Ticks in diesem Frame fällig sind; der Rest wird
+als ``alpha`` zum Interpolieren zwischen den letzten beiden Zuständen genutzt.
+``FramePacer`` wartet auf den nächsten Frame – per ``Clock.tick``, per
+``Clock.tick_busy_loop`` oder gar nicht, wenn ``display.flip`` auf VSync wartet.
+``IdleThrottle`` ersetzt das Warten in Szenen, die sich nur durch Eingaben ändern.
+"""
+import time
+
+import pygame
+
+from . import simulation
+
+
+class FixedTimestep:
+    """
+    Akkumulator für einen festen Simulationstakt.
+
+    Attributes:
+        tick_rate (int): Ticks pro Sekunde.
+        dt (float): Dauer eines Ticks in Sekunden.
+        max_ticks (int): Höchstens so viele Ticks werden pro Frame nachgeholt.
+        accumulator (float): Noch nicht simulierte Zeit in Sekunden.
+        dropped (float): Verworfene Zeit in Sekunden, weil mehr als ``max_ticks`` fällig waren.
+    """
+    def __init__(self, tick_rate=simulation.TICK_RATE, max_ticks=5):
+        """
+        Initialisiert den Akkumulator.
+
+        Args:
+            tick_rate (int): Ticks pro Sekunde.
+            max_ticks (int): Obergrenze der nachgeholten Ticks pro Frame. Ist ein Frame so
+                langsam, dass mehr fällig wären, läuft das Spiel kurz langsamer, statt in
+                immer längeren Frames immer mehr Ticks nachholen zu müssen.
+        """
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_ticks = max_ticks
+        self.accumulator = 0.0
+        self.dropped = 0.0
+
+    def advance(self, frame_time):
+        """
+        Addiert die Dauer eines Frames und gibt die fälligen Ticks zurück.
+
+        Args:
+            frame_time (float): Die seit dem letzten Frame vergangene Zeit in Sekunden.
+
+        Returns:
+            int: Anzahl der Ticks, die in diesem Frame simuliert werden müssen.
+        """
+        self.accumulator += frame_time
+        ticks = int(self.accumulator / self.dt)
+        if ticks > self.max_ticks:
+            self.dropped += (ticks - self.max_ticks) * self.dt
+            ticks = self.max_ticks
+            # Nur der angefangene Tick bleibt übrig, die übrigen fälligen Ticks werden verworfen
+            self.accumulator %= self.dt
+        else:
+            self.accumulator -= ticks * self.dt
+        return ticks
+
+    @property
+    def alpha(self):
+        """
+        Returns:
+            float: Anteil (0 bis 1) des angefangenen Ticks, zum Interpolieren beim Zeichnen.
+        """
+        return min(max(self.accumulator / self.dt, 0.0), 1.0)
+
+    def reset(self):
+        """Verwirft die angesammelte Zeit, z. B. nach einem Menü oder beim Start eines Laufs."""
+        self.accumulator = 0.0
+
+
+class FramePacer:
+    """
+    Begrenzt die Bildrate und misst die Dauer der Frames.
+
+    Attributes:
+        mode (str): ``tick`` (schläft, sparsam), ``busy`` (``tick_busy_loop``, genauer, aber
+            belegt einen Kern) oder ``vsync`` (``display.flip`` wartet auf den Bildschirm).
+        fps (int): Obergrenze der Bildrate, 0 für unbegrenzt. Bei ``vsync`` ohne Wirkung.
+    """
+    MODES = ("tick", "busy", "vsync")
+
+    def __init__(self, mode="tick", fps=60):
+        """
+        Initialisiert den Pacer.
+
+        Args:
+            mode (str): Eine der ``MODES``.
+            fps (int): Obergrenze der Bildrate, 0 für unbegrenzt.
+
+        Raises:
+            ValueError: Wenn der Modus unbekannt ist.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unbekannter Pacing-Modus: {mode}")
+        self.mode = mode
+        self.fps = fps
+        self.clock = pygame.time.Clock()
+
+    def wait(self):
+        """
+        Wartet bis zum nächsten Frame.
+
+        Returns:
+            float: Die seit dem letzten Aufruf vergangene Zeit in Sekunden.
+        """
+        if self.mode == "busy":
+            milliseconds = self.clock.tick_busy_loop(self.fps)
+        elif self.mode == "vsync":
+            milliseconds = self.clock.tick()  # Gewartet hat bereits display.flip
+        else:
+            milliseconds = self.clock.tick(self.fps)
+        return milliseconds / 1000.0
+
+    def elapsed(self):
+        """
+        Misst die Zeit seit dem letzten Frame, ohne zu warten.
+
+        Returns:
+            float: Die seit dem letzten Aufruf vergangene Zeit in Sekunden.
+        """
+        return self.clock.tick() / 1000.0
+
+    def reset(self):
+        """Startet die Zeitmessung neu, damit eine Pause nicht als ein langer Frame zählt."""
+        self.clock.tick()
+
+    def get_fps(self):
+        """
+        Returns:
+            float: Die gemessene Bildrate.
+        """
+        return self.clock.get_fps()
+
+
+class IdleThrottle:
+    """
+    Leerlauf für Szenen, die nur auf Eingaben warten (Menüs, Startbildschirm).
+
+    Statt mit voller Bildrate zu zeichnen, blockiert die Hauptschleife in ``pygame.event.wait``
+    bis zur nächsten Eingabe, höchstens aber einen Takt lang. Bis ``idle_after`` Sekunden nach
+    der letzten Eingabe ist der Takt die normale Bildrate, damit Hover-Effekte der Buttons
+    flüssig bleiben; danach sinkt er auf ``idle_fps``. Gezeichnet wird dann nur noch, wenn
+    Eingaben kommen oder die Szene sich von selbst bewegt.
+
+    Attributes:
+        fps (int): Takt kurz nach einer Eingabe.
+        idle_fps (int): Takt ohne Eingabe.
+        idle_after (float): Sekunden ohne Eingabe bis zum langsamen Takt, 0 schaltet den Leerlauf ab.
+        last_input (float): Zeitpunkt der letzten Eingabe (``time.perf_counter``).
+        wakeups (int): Anzahl der Durchläufe im Leerlauf.
+        redraws (int): Davon die Durchläufe, in denen gezeichnet werden musste.
+    """
+    def __init__(self, fps=60, idle_fps=10, idle_after=5.0):
+        """
+        Initialisiert den Leerlauf.
+
+        Args:
+            fps (int): Takt kurz nach einer Eingabe, 0 steht für 60.
+            idle_fps (int): Takt ohne Eingabe.
+            idle_after (float): Sekunden ohne Eingabe bis zum langsamen Takt.
+        """
+        self.fps = fps or 60
+        self.idle_fps = max(1, idle_fps)
+        self.idle_after = idle_after
+        self.last_input = time.perf_counter()
+        self.wakeups = 0
+        self.redraws = 0
+
+    @property
+    def enabled(self):
+        """True, wenn die Hauptschleife im Leerlauf blockieren darf."""
+        return self.idle_after > 0
+
+    def wake(self):
+        """Zählt wie eine Eingabe, z. B. wenn eine andere Szene oben liegt."""
+        self.last_input = time.perf_counter()
+
+    def wait(self, animating=False):
+        """
+        Wartet auf die nächste Eingabe oder das Ende des Takts.
+
+        Args:
+            animating (bool): Die Szene bewegt sich auch ohne Eingabe und wird in jedem Takt gezeichnet.
+
+        Returns:
+            tuple: (Liste der Events, ob gezeichnet werden muss)
+        """
+        fresh = time.perf_counter() - self.last_input < self.idle_after
+        rate = self.fps if fresh else self.idle_fps
+        event = pygame.event.wait(max(1, 1000 // rate))
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        if events:
+            self.wake()
+        redraw = bool(events) or fresh or animating
+        self.wakeups += 1
+        self.redraws += redraw
+        return events, redraw
+
+
+def enable_vsync(size, flags=0):
+    """
+    Öffnet das Fenster neu mit VSync.
+
+    VSync setzt in pygame den SDL-Renderer voraus, daher wird ``SCALED`` gesetzt.
+    Das Display-Objekt bleibt dasselbe, bestehende Verweise darauf bleiben gültig.
+
+    Args:
+        size (tuple): Die Fenstergröße.
+        flags (int): Weitere Flags für ``set_mode``.
+
+    Returns:
+        bool: True, wenn VSync aktiviert werden konnte.
+    """
+    try:
+        pygame.display.set_mode(size, flags | pygame.SCALED, vsync=1)
+    except pygame.error as e:
+        print(f"VSync nicht verfügbar: {e}")
+        pygame.display.set_mode(size, flags)
+        return False
+    return True
@@ -7,12 +7,73 @@
 #  "pytmx"
 # ]
 # ///
+import argparse
 import asyncio
-from dinorunner.game import main
+import time
+
+_START = time.perf_counter()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="dinorunner starten")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Seed des ersten Laufs (zum Reproduzieren eines Laufs)")
+    parser.add_argument("--turbo", type=int, default=1, metavar="K",
+                        help="Simulation K-mal schneller als in Echtzeit laufen lassen")
+    parser.add_argument("--headless", action="store_true",
+                        help="Nichts zeichnen und nicht auf die Bildrate warten (ein Lauf, dann Ende)")
+    parser.add_argument("--autoplay", default=None, metavar="POLICY",
+                        help="Bot-Strategie statt Tastatur (idle, random, jumper)")
+    parser.add_argument("--max-frames", type=int, default=None,
+                        help="Lauf nach so vielen Ticks beenden")
+    parser.add_argument("--profile", default="default",
+                        help="Profilname für die Bestenliste")
+    parser.add_argument("--pacing", choices=("tick", "busy", "vsync"), default="tick",
+                        help="Warten auf den nächsten Frame: tick (schlafen), busy (genauer) oder vsync")
+    parser.add_argument("--fps", type=int, default=60,
+                        help="Obergrenze der Bildrate, 0 für unbegrenzt (die Simulation läuft immer mit 60 Ticks/s)")
+    parser.add_argument("--idle-after", type=float, default=5.0, metavar="SECONDS",
+                        help="Menüs und Startbildschirm nach so vielen Sekunden ohne Eingabe drosseln, 0 schaltet das ab")
+    parser.add_argument("--idle-fps", type=int, default=10,
+                        help="Bildrate von Menüs und Startbildschirm im Leerlauf")
+    parser.add_argument("--frame-stats", default=None, metavar="PATH",
+                        help="Dauer der Phasen jedes Frames messen und beim Beenden als JSON speichern (F3: Overlay)")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="Dauer der Startphasen bis zum ersten Frame ausgeben")
+    parser.add_argument("--collision", choices=("pixel", "rect"), default="pixel",
+                        help="Kollision gegen die Sprite-Masken (pixel) oder nur gegen die Rechtecke (rect)")
+    parser.add_argument("--audio-frequency", type=int, default=44100, metavar="HZ",
+                        help="Abtastrate des Mixers")
+    parser.add_argument("--audio-buffer", type=int, default=256, metavar="SAMPLES",
+                        help="Puffergröße des Mixers (kleiner = weniger Latenz, zu klein knackt)")
+    parser.add_argument("--audio-voices", type=int, default=4, metavar="N",
+                        help="Anzahl der Kanäle für Soundeffekte")
+    parser.add_argument("--audio-latency", action="store_true",
+                        help="Latenz vom Sprung-Tastendruck bis zur Audioausgabe messen und beim Beenden ausgeben")
+    parser.add_argument("--jump-buffer", type=float, default=100, metavar="MS",
+                        help="Sprung, der kurz vor der Landung gedrückt wird, so lange vormerken (0 schaltet das ab)")
+    parser.add_argument("--input-latency", action="store_true",
+                        help="Latenz vom Sprung-Tastendruck bis zum Bild messen (mit Marker links unten) und ausgeben")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
+    args = parse_args()
+    from dinorunner.game import main
+    from dinorunner.profiler import startup
+    from dinorunner.sfx import sound_manager
+    startup.add("import", time.perf_counter() - _START)
+    if args.startup_profile:
+        startup.enable(origin=_START)
+    sound_manager.configure(frequency=args.audio_frequency, buffer=args.audio_buffer,
+                            voices=max(1, args.audio_voices), measure_latency=args.audio_latency)
+    options = dict(seed=args.seed, turbo=max(1, args.turbo), render=not args.headless,
+                   autoplay=args.autoplay, max_frames=args.max_frames, profile=args.profile,
+                   pacing=args.pacing, max_fps=max(0, args.fps), frame_stats=args.frame_stats,
+                   collision=args.collision, idle_after=max(0.0, args.idle_after), idle_fps=args.idle_fps,
+                   jump_buffer_ms=max(0.0, args.jump_buffer), input_latency=args.input_latency)
     try:
-        asyncio.run(main())
+        asyncio.run(main(**options))
     except RuntimeError:
         loop = asyncio.get_event_loop()
-        loop.run_until_complete(main())
\ No newline at end of file
+        loop.run_until_complete(main(**options))
\ No newline at end of file
@@ -0,0 +1,41 @@
+import argparse
+import time
+from dinorunner.rollout import RolloutRunner, POLICIES, MAX_FRAMES
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Bot-Strategien headless auf mehreren Kernen auswerten")
+    parser.add_argument("--policy", action="append", choices=sorted(POLICIES),
+                        help="Strategie (mehrfach angebbar, Standard: alle)")
+    parser.add_argument("--episodes", type=int, default=10000, help="Episoden pro Strategie")
+    parser.add_argument("--seed", type=int, default=0, help="Erster Seed")
+    parser.add_argument("--workers", type=int, default=None, help="Anzahl der Prozesse (Standard: alle Kerne)")
+    parser.add_argument("--batch-size", type=int, default=256, help="Episoden pro Batch")
+    parser.add_argument("--max-frames", type=int, default=MAX_FRAMES, help="Maximale Dauer einer Episode in Ticks")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    policies = args.policy or sorted(POLICIES)
+    runner = RolloutRunner(args.workers, args.batch_size, max_frames=args.max_frames)
+
+    stats = {name: [0, 0, 0, 0] for name in policies}  # Episoden, Punkte, Ticks, bester Punktestand
+    start = time.perf_counter()
+    for result in runner.run(policies, range(args.seed, args.seed + args.episodes)):
+        entry = stats[result.policy]
+        entry[0] += 1
+        entry[1] += result.score
+        entry[2] += result.frames
+        entry[3] = max(entry[3], result.score)
+    elapsed = time.perf_counter() - start
+
+    total = sum(entry[0] for entry in stats.values())
+    for name, (episodes, score, frames, best) in stats.items():
+        print(f"{name:>8}: {episodes} Episoden, Ø Score {score / episodes:.2f}, "
+              f"Ø Ticks {frames / episodes:.0f}, bester Score {best}")
+    print(f"{total} Episoden in {elapsed:.2f} s ({total / elapsed:.0f} Episoden/s, {runner.workers} Prozesse)")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,9 @@ setup(
     install_requires=[            # Abhängigkeiten
       "pygame", "pygame_gui"
     ],
+    extras_require={              # Optionale Abhängigkeiten
+        "batch": ["numpy"],       # Vektorisierte Batch-Simulation (dinorunner.batch)
+    },
     package_data={                # Ressourcen, die mit dem Package verteilt werden sollen
         'dinorunner': [
             'resources/assets/*',  # Alle Dateien im 'assets' Ordner
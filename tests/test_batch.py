@@ -0,0 +1,54 @@
+import random
+import unittest
+
+from dinorunner import simulation as sim
+
+try:
+    import numpy as np
+    from dinorunner.batch import BatchSimulation
+except ImportError:  # NumPy ist optional (pip install .[batch])
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy nicht installiert")
+class BatchSimulationTest(unittest.TestCase):
+    def test_matches_single_simulation(self):
+        size = 8
+        seed = 40
+        batch = BatchSimulation(size, seed)
+        states = [sim.new_game(seed + index) for index in range(size)]
+        rngs = [random.Random(index) for index in range(size)]
+        finished = [False] * size
+        for _ in range(3000):
+            actions = np.array([rng.choice((0, 0, 0, 2, 4)) for rng in rngs], dtype=np.int64)
+            points, collision = batch.step(actions)
+            for index in range(size):
+                if finished[index]:
+                    continue
+                state, state_points, state_collision = sim.step(states[index], int(actions[index]))
+                states[index] = state
+                self.assertEqual(points[index], state_points)
+                self.assertEqual(bool(collision[index]), state_collision)
+                if state_collision:
+                    # Der Platz enthält danach schon das nächste Spiel
+                    self.assertEqual(batch.final_score[index], state.score)
+                    self.assertEqual(batch.final_frame[index], state.frame)
+                    self.assertEqual(batch.final_x[index], state.x)
+                    finished[index] = True
+                    continue
+                self.assertEqual((batch.x[index], batch.y[index], batch.score[index], batch.frame[index]),
+                                 (state.x, state.y, state.score, state.frame))
+                self.assertEqual(tuple(sorted(batch.obstacles[index])), state.obstacles)
+            if all(finished):
+                break
+        self.assertTrue(all(finished))
+
+    def test_auto_reset_uses_next_seed(self):
+        batch = BatchSimulation(2, seed=0)
+        while not batch.episodes:
+            batch.step(np.zeros(2, dtype=np.int64))
+        self.assertEqual(batch.next_seed, 2 + batch.episodes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+import pygame
+
+from dinorunner.inputs import InputQueue
+from dinorunner.simulation import Action
+
+
+def key(event_type, key_code):
+    return pygame.event.Event(event_type, key=key_code)
+
+
+class InputQueueTest(unittest.TestCase):
+    def test_tap_within_one_frame_counts(self):
+        queue = InputQueue()
+        queue.handle_event(key(pygame.KEYDOWN, pygame.K_d), now=0.0)
+        queue.handle_event(key(pygame.KEYUP, pygame.K_d), now=0.001)
+        self.assertEqual(queue.action(), int(Action.RIGHT))
+        self.assertEqual(queue.action(), 0)
+
+    def test_held_keys(self):
+        queue = InputQueue()
+        queue.handle_event(key(pygame.KEYDOWN, pygame.K_a), now=0.0)
+        self.assertEqual(queue.action(), int(Action.LEFT))
+        self.assertEqual(queue.action(), int(Action.LEFT))
+        queue.handle_event(key(pygame.KEYUP, pygame.K_a), now=0.1)
+        self.assertEqual(queue.action(), 0)
+
+    def test_other_events_are_ignored(self):
+        queue = InputQueue()
+        self.assertFalse(queue.handle_event(key(pygame.KEYDOWN, pygame.K_x)))
+        self.assertFalse(queue.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(0, 0))))
+        self.assertEqual(queue.action(), 0)
+
+    def test_jump_is_buffered_in_the_air(self):
+        queue = InputQueue(jump_buffer_ms=100)  # 6 Ticks bei 60 Hz
+        queue.handle_event(key(pygame.KEYDOWN, pygame.K_SPACE), now=1.0)
+        queue.handle_event(key(pygame.KEYUP, pygame.K_SPACE), now=1.01)
+        # Noch in der Luft: der Sprung bleibt vorgemerkt
+        for _ in range(4):
+            self.assertTrue(queue.action() & int(Action.JUMP))
+            queue.advance(jumped=False)
+        # Gelandet: der vorgemerkte Sprung wird ausgeführt
+        self.assertTrue(queue.action() & int(Action.JUMP))
+        queue.advance(jumped=True)
+        self.assertEqual(queue.buffered_jumps, 1)
+        self.assertEqual(queue.last_jump_at, 1.0)
+        self.assertEqual(queue.action(), 0)
+
+    def test_buffer_expires(self):
+        queue = InputQueue(jump_buffer_ms=50)
+        queue.handle_event(key(pygame.KEYDOWN, pygame.K_SPACE), now=0.0)
+        queue.handle_event(key(pygame.KEYUP, pygame.K_SPACE), now=0.01)
+        for _ in range(queue.jump_buffer + 1):
+            self.assertTrue(queue.action() & int(Action.JUMP))
+            queue.advance(jumped=False)
+        self.assertEqual(queue.action(), 0)
+        self.assertEqual(queue.buffered_jumps, 0)
+
+    def test_reset_drops_events(self):
+        queue = InputQueue()
+        queue.handle_event(key(pygame.KEYDOWN, pygame.K_SPACE), now=0.0)
+        queue.reset()
+        self.assertEqual(queue.action(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
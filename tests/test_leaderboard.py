@@ -0,0 +1,42 @@
+import os
+import tempfile
+import unittest
+
+from dinorunner.leaderboard import Leaderboard
+
+
+class LeaderboardTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "leaderboard.sqlite3")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_submit_is_visible_immediately(self):
+        board = Leaderboard(self.path)
+        board.submit("a", 12, 600)
+        self.assertEqual(board.best(), 12)
+        board.close()
+        self.assertEqual(board.count(), 1)
+        self.assertEqual(board.profile_best("a"), 12)
+
+    def test_best_follows_other_writers(self):
+        board = Leaderboard(self.path, check_interval=0.0)
+        self.assertEqual(board.best(), 0)
+        # Ein zweiter Prozess (hier eine zweite Verbindung) schreibt einen besseren Lauf
+        other = Leaderboard(self.path)
+        other.submit("b", 30, 900)
+        other.close()
+        self.assertEqual(board.best(), 30)
+
+    def test_best_is_not_reread_within_interval(self):
+        board = Leaderboard(self.path, check_interval=3600.0)
+        other = Leaderboard(self.path)
+        other.submit("b", 30, 900)
+        other.close()
+        self.assertEqual(board.best(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from dinorunner import simulation
+from dinorunner.replay import load_pixel_collider
+from dinorunner.rollout import POLICIES
+
+
+class PixelColliderTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.collider = load_pixel_collider()
+
+    def test_mask_follows_facing(self):
+        # Hindernis vor dem nach rechts schauenden Spieler: nur die gespiegelte Maske reicht so weit
+        self.assertFalse(self.collider('idle', 33, 20, True, 10))
+        self.assertTrue(self.collider('idle', 33, 20, False, 10))
+
+    def test_mask_follows_frame(self):
+        # Nur der erste Walk-Frame reicht so weit nach links; die Vereinigung aller Frames träfe immer
+        self.assertTrue(self.collider('walk', -6, 0, True, 0))
+        self.assertTrue(self.collider('walk', -6, 0, True, simulation.ANIMATION_TICKS - 1))
+        self.assertFalse(self.collider('walk', -6, 0, True, simulation.ANIMATION_TICKS))
+
+    def test_jumper_survives_first_obstacle(self):
+        # Mit beiden Blickrichtungen vereinigt starb der Bot bei Seed 6, 7 und 8 in Tick 227
+        for seed in (6, 7, 8):
+            policy = POLICIES["jumper"](seed)
+            state = simulation.new_game(seed)
+            while not state.game_over and state.frame < 400:
+                state = simulation.step(state, policy(state), self.collider)[0]
+            self.assertFalse(state.game_over, f"Seed {seed} endet in Tick {state.frame}")
+
+
+if __name__ == "__main__":
+    unittest.main()
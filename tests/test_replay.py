@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from dinorunner import simulation as sim
+from dinorunner.leaderboard import Leaderboard
+from dinorunner.replay import (FACING_MASKS, FRAME_MASKS, PIXEL_COLLISION, Replay, ReplayError,
+                               ReplayRecorder, load_pixel_collider, simulate, verify)
+from dinorunner.rollout import POLICIES
+
+
+def record(seed, narrowphase=None, flags=0):
+    policy = POLICIES["jumper"](seed)
+    recorder = ReplayRecorder(seed, flags)
+    state = sim.new_game(seed)
+    while not state.game_over:
+        action = policy(state)
+        recorder.record(action)
+        state = sim.step(state, action, narrowphase)[0]
+    return recorder.finish(state.score), state
+
+
+class ReplayTest(unittest.TestCase):
+    def test_round_trip(self):
+        replay, state = record(7)
+        copy = Replay.from_bytes(replay.to_bytes())
+        self.assertEqual((copy.seed, copy.runs, copy.frames, copy.score, copy.flags),
+                         (replay.seed, replay.runs, replay.frames, replay.score, replay.flags))
+        self.assertEqual(list(copy.actions())[:5], list(replay.actions())[:5])
+        self.assertEqual(simulate(copy).to_bytes(), state.to_bytes())
+
+    def test_verify_rect(self):
+        replay, _ = record(7)
+        self.assertTrue(verify(replay))
+        replay.score += 1
+        self.assertFalse(verify(replay))
+
+    def test_corrupted_data(self):
+        data = Replay(1, [(0, 10)], 10, 0).to_bytes()
+        with self.assertRaises(ReplayError):
+            Replay.from_bytes(b"XXXX" + data[4:])
+        with self.assertRaises(ReplayError):
+            Replay.from_bytes(data[:-1])
+
+
+class LeaderboardReplayTest(unittest.TestCase):
+    def test_stored_replays(self):
+        replay, state = record(7)
+        with tempfile.TemporaryDirectory() as directory:
+            board = Leaderboard(os.path.join(directory, "leaderboard.sqlite3"))
+            board.submit("bot", state.score, state.frame, seed=7, replay=replay.to_bytes())
+            board.submit("bot", 3, 100)  # Lauf ohne Replay
+            board.close()
+            rows = board.replays()
+            self.assertEqual(len(rows), 1)
+            run_id, score, data = rows[0]
+            self.assertEqual(board.replays(run_id), rows)
+            self.assertEqual(board.replays(run_id + 1), [])
+        stored = Replay.from_bytes(data)
+        self.assertEqual(score, stored.score)
+        self.assertTrue(verify(stored))
+
+
+class PixelReplayTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.collider = load_pixel_collider()
+
+    def test_verify_pixel(self):
+        replay, _ = record(8, self.collider, PIXEL_COLLISION | FACING_MASKS | FRAME_MASKS)
+        replay = Replay.from_bytes(replay.to_bytes())
+        self.assertTrue(verify(replay, self.collider))
+        # Ohne Maskentest lässt sich ein Pixel-Replay nicht prüfen
+        with self.assertRaises(ReplayError):
+            verify(replay)
+
+    def test_rect_replay_ignores_collider(self):
+        replay, _ = record(7)
+        self.assertTrue(verify(replay, self.collider))
+
+    def test_old_pixel_replay_is_rejected(self):
+        replay, _ = record(8, self.collider, PIXEL_COLLISION | FACING_MASKS | FRAME_MASKS)
+        for flags in (PIXEL_COLLISION, PIXEL_COLLISION | FACING_MASKS):
+            replay.flags = flags
+            with self.assertRaises(ReplayError):
+                verify(replay, self.collider)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+from dinorunner import simulation as sim
+from dinorunner.replay import ReplayRecorder, verify
+from dinorunner.rollout import POLICIES
+from dinorunner.savestate import Snapshot, SnapshotError, restore, take
+
+
+class SnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self.policy = POLICIES["jumper"](7)
+        self.state = sim.new_game(7)
+        self.recorder = ReplayRecorder(7)
+        self.actions = []
+        self.snapshot = None
+        while not self.state.game_over:
+            if self.state.frame == 1000:
+                self.snapshot = take(self.state, self.recorder)
+            action = self.policy(self.state)
+            self.actions.append(action)
+            self.recorder.record(action)
+            self.state = sim.step(self.state, action)[0]
+
+    def test_round_trip(self):
+        copy = Snapshot.from_bytes(self.snapshot.to_bytes())
+        self.assertEqual(copy.state.to_bytes(), self.snapshot.state.to_bytes())
+        self.assertEqual((copy.seed, copy.flags), (self.snapshot.seed, self.snapshot.flags))
+        self.assertEqual(copy.replay().to_bytes(), self.snapshot.replay().to_bytes())
+
+    def test_restore_continues_the_same_run(self):
+        state, recorder = restore(Snapshot.from_bytes(self.snapshot.to_bytes()))
+        for action in self.actions[state.frame:]:
+            recorder.record(action)
+            state = sim.step(state, action)[0]
+        self.assertEqual(state.to_bytes(), self.state.to_bytes())
+        replay = recorder.finish(state.score)
+        self.assertEqual(replay.to_bytes(), self.recorder.finish(self.state.score).to_bytes())
+        self.assertTrue(verify(replay))
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "savegame.dat")
+            self.snapshot.save(path)
+            loaded = Snapshot.load(path)
+        self.assertEqual(loaded.to_bytes(), self.snapshot.to_bytes())
+
+    def test_invalid_data(self):
+        data = self.snapshot.to_bytes()
+        for broken in (b"", data[:5], b"XXXX" + data[4:]):
+            with self.assertRaises(SnapshotError):
+                Snapshot.from_bytes(broken)
+
+    def test_corrupted_payload(self):
+        data = bytearray(self.snapshot.to_bytes())
+        # Ein gekipptes Bit in den Eingaben ergäbe sonst einen gültig aussehenden Spielstand
+        data[-3] ^= 0x01
+        with self.assertRaises(SnapshotError):
+            Snapshot.from_bytes(bytes(data))
+
+
+if __name__ == "__main__":
+    unittest.main()
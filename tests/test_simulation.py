@@ -0,0 +1,78 @@
+import random
+import unittest
+
+from dinorunner import broadphase
+from dinorunner import simulation as sim
+from dinorunner.rollout import POLICIES
+
+
+def play(seed, policy_name="jumper", max_frames=5000):
+    policy = POLICIES[policy_name](seed)
+    state = sim.new_game(seed)
+    states = [state]
+    while not state.game_over and state.frame < max_frames:
+        state = sim.step(state, policy(state))[0]
+        states.append(state)
+    return states
+
+
+class StepTest(unittest.TestCase):
+    def test_same_seed_same_run(self):
+        for seed in (0, 7, 123):
+            first = [state.to_bytes() for state in play(seed)]
+            second = [state.to_bytes() for state in play(seed)]
+            self.assertEqual(first, second)
+
+    def test_known_run(self):
+        # Referenzlauf aus main.py --headless --seed 7 --autoplay jumper
+        final = play(7)[-1]
+        self.assertTrue(final.game_over)
+        self.assertEqual((final.score, final.frame, final.x), (34, 3359, 50))
+
+    def test_step_does_not_modify_state(self):
+        state = sim.new_game(3)
+        before = state.to_bytes()
+        for action in (sim.Action.NONE, sim.Action.RIGHT, sim.Action.JUMP | sim.Action.LEFT):
+            sim.step(state, action)
+            self.assertEqual(state.to_bytes(), before)
+
+    def test_game_over_is_final(self):
+        final = play(5, "idle")[-1]
+        self.assertTrue(final.game_over)
+        self.assertIs(sim.step(final, sim.Action.JUMP)[0], final)
+
+    def test_state_round_trip(self):
+        rng = random.Random(1)
+        state = sim.new_game(11)
+        for _ in range(200):
+            state = sim.step(state, rng.randrange(8))[0]
+        copy = sim.GameState.from_bytes(state.to_bytes())
+        self.assertEqual(copy.to_bytes(), state.to_bytes())
+        self.assertEqual(copy.obstacles, state.obstacles)
+        self.assertEqual(copy.facing_right, state.facing_right)
+
+
+class BroadphaseTest(unittest.TestCase):
+    def test_obstacles_stay_sorted(self):
+        for state in play(7) + play(3, "random"):
+            self.assertEqual(state.obstacles, tuple(sorted(state.obstacles)))
+
+    def test_same_result_as_linear_scan(self):
+        def linear(x, obstacles):
+            return any(x < int(obs_x) + sim.OBSTACLE_SIZE and int(obs_x) < x + sim.PLAYER_SIZE
+                       for obs_x in obstacles)
+
+        rng = random.Random(2)
+        for _ in range(2000):
+            obstacles = tuple(sorted(rng.uniform(-30, 900) for _ in range(rng.randrange(1, 50))))
+            x = rng.randrange(-10, 800)
+            self.assertEqual(sim.collides(x, sim.OBSTACLE_Y, obstacles), linear(x, obstacles))
+
+    def test_candidates_near_player_only(self):
+        obstacles = tuple(float(x) for x in range(0, 60000, 60))
+        low, high = broadphase.candidates(obstacles, 3000, sim.PLAYER_SIZE, sim.OBSTACLE_SIZE)
+        self.assertLessEqual(high - low, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+
+from dinorunner.timing import FixedTimestep
+
+
+class FixedTimestepTest(unittest.TestCase):
+    def test_regular_frames(self):
+        stepper = FixedTimestep(tick_rate=60)
+        ticks = sum(stepper.advance(1 / 60) for _ in range(60))
+        self.assertIn(ticks, (59, 60))
+        self.assertGreaterEqual(stepper.alpha, 0.0)
+        self.assertLessEqual(stepper.alpha, 1.0)
+
+    def test_long_frame_is_clamped(self):
+        stepper = FixedTimestep(tick_rate=60, max_ticks=5)
+        self.assertEqual(stepper.advance(0.505), 5)
+        self.assertGreaterEqual(stepper.accumulator, 0.0)
+        self.assertLess(stepper.accumulator, stepper.dt)
+        self.assertGreaterEqual(stepper.alpha, 0.0)
+        self.assertLessEqual(stepper.alpha, 1.0)
+        self.assertAlmostEqual(stepper.dropped, 25 * stepper.dt)
+        # Danach läuft der Takt normal weiter, ohne negative Ticks oder Stillstand
+        self.assertEqual(stepper.advance(1 / 60 + 1e-9), 1)
+
+    def test_reset(self):
+        stepper = FixedTimestep()
+        stepper.advance(0.01)
+        stepper.reset()
+        self.assertEqual(stepper.accumulator, 0.0)
+        self.assertEqual(stepper.alpha, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()